@@ -0,0 +1,51 @@
+"""add_commandblock_matrix
+
+Revision ID: 06284f829c6f
+Revises: 00a9ceb38842
+Create Date: 2024-11-18 10:12:41.118224
+
+"""
+import re
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql import column, table
+
+# revision identifiers, used by Alembic.
+revision = '06284f829c6f'
+down_revision = '00a9ceb38842'
+branch_labels = None
+depends_on = None
+
+# Matrix IDs are SHA256 hashes
+MATRIX_ID_REGEX = re.compile(r"(?<![0-9a-f])[0-9a-f]{64}(?![0-9a-f])")
+
+
+def upgrade():
+    op.create_table('commandblock_matrix',
+    sa.Column('command_id', sa.String(length=36), nullable=False),
+    sa.Column('matrix_id', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['command_id'], ['commandblock.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('command_id', 'matrix_id')
+    )
+    with op.batch_alter_table('commandblock_matrix', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_commandblock_matrix_matrix_id'), ['matrix_id'], unique=False)
+
+    # Fill the references of the existing command blocks
+    bind = op.get_bind()
+    commandblock_table = table('commandblock', column('id'), column('args'))
+    reference_table = table('commandblock_matrix', column('command_id'), column('matrix_id'))
+    references = [
+        {"command_id": command_id, "matrix_id": matrix_id}
+        for command_id, args in bind.execute(sa.select(commandblock_table.c.id, commandblock_table.c.args))
+        for matrix_id in set(MATRIX_ID_REGEX.findall(args or ""))
+    ]
+    if references:
+        bind.execute(reference_table.insert(), references)
+
+
+def downgrade():
+    with op.batch_alter_table('commandblock_matrix', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_commandblock_matrix_matrix_id'))
+
+    op.drop_table('commandblock_matrix')
@@ -21,6 +21,7 @@ import yaml
 
 from antarest.core.model import JSON
 from antarest.core.roles import RoleType
+from antarest.core.utils.file_copy import CopyMode
 
 DEFAULT_WORKSPACE_NAME = "default"
 
@@ -151,6 +152,9 @@ class StorageConfig:
     download_default_expiration_timeout_minutes: int = 1440
     matrix_gc_sleeping_time: int = 3600
     matrix_gc_dry_run: bool = False
+    matrix_gc_grace_period: int = 86400
+    matrix_export_precision: Optional[int] = None
+    copy_mode: CopyMode = CopyMode.COPY
     auto_archive_threshold_days: int = 60
     auto_archive_dry_run: bool = False
     auto_archive_sleeping_time: int = 3600
@@ -181,6 +185,9 @@ class StorageConfig:
             ),
             matrix_gc_sleeping_time=data.get("matrix_gc_sleeping_time", defaults.matrix_gc_sleeping_time),
             matrix_gc_dry_run=data.get("matrix_gc_dry_run", defaults.matrix_gc_dry_run),
+            matrix_gc_grace_period=data.get("matrix_gc_grace_period", defaults.matrix_gc_grace_period),
+            matrix_export_precision=data.get("matrix_export_precision", defaults.matrix_export_precision),
+            copy_mode=CopyMode(data.get("copy_mode", defaults.copy_mode)),
             auto_archive_threshold_days=data.get("auto_archive_threshold_days", defaults.auto_archive_threshold_days),
             auto_archive_dry_run=data.get("auto_archive_dry_run", defaults.auto_archive_dry_run),
             auto_archive_sleeping_time=data.get("auto_archive_sleeping_time", defaults.auto_archive_sleeping_time),
@@ -502,10 +509,22 @@ class EventBusConfig:
     Sub config object dedicated to eventbus module
     """
 
-    # noinspection PyUnusedLocal
+    # Time windows (in seconds) used to coalesce bursts of events, by event type.
+    # Within a window, only the latest event of a given channel and study/task/job is pushed.
+    coalescing_windows: Dict[str, float] = field(
+        default_factory=lambda: {
+            "TASK_PROGRESS": 0.5,
+            "LAUNCH_PROGRESS": 0.5,
+            "STUDY_DATA_EDITED": 1.0,
+        }
+    )
+
     @classmethod
     def from_dict(cls, data: JSON) -> "EventBusConfig":
-        return cls()
+        defaults = cls()
+        return cls(
+            coalescing_windows=data.get("coalescing_windows", defaults.coalescing_windows),
+        )
 
 
 @dataclass(frozen=True)
@@ -13,9 +13,11 @@
 from typing import Any
 
 from fastapi import APIRouter
+from starlette.responses import Response
 
 from antarest.core.config import Config
 from antarest.core.serialization import AntaresBaseModel
+from antarest.core.utils.metrics import CONTENT_TYPE_LATEST, REGISTRY
 from antarest.core.utils.web import APITag
 from antarest.core.version_info import VersionInfoDTO, get_commit_id, get_dependencies
 
@@ -37,6 +39,20 @@ def create_utils_routes(config: Config) -> APIRouter:
     def health() -> Any:
         return StatusDTO(status="available")
 
+    @bp.get(
+        "/metrics",
+        tags=[APITag.misc],
+        summary="Get application metrics",
+        response_class=Response,
+    )
+    def metrics() -> Any:
+        """
+        Returns the metrics of the application in the Prometheus text format: latency histograms
+        of the hot paths (study creation, matrix reading and parsing, snapshot generation,
+        task queue wait, event dispatch), cache hits and misses, and websocket statistics.
+        """
+        return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
     @bp.get(
         "/version",
         tags=[APITag.misc],
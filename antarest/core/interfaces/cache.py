@@ -15,6 +15,7 @@ from enum import Enum
 from typing import List, Optional
 
 from antarest.core.model import JSON
+from antarest.core.utils.metrics import Counter
 
 
 class CacheConstants(Enum):
@@ -31,10 +32,27 @@ class CacheConstants(Enum):
       This cache is used by the `create_from_fs` function when retrieving the configuration
       of a study from the data on the disk.
 
+    - `STUDY_REVISION`: variable used to store a random token identifying the current revision
+      of the data of a study. This token is renewed each time the study cache is invalidated,
+      and is used to compute the `ETag` of the raw data of the study.
+
     """
 
     RAW_STUDY = "RAW_STUDY"
     STUDY_FACTORY = "STUDY_FACTORY"
+    STUDY_REVISION = "STUDY_REVISION"
+
+
+CACHE_REQUESTS = Counter(
+    "antarest_cache_requests_total",
+    "Number of cache lookups, by cache (`CacheConstants`) and result (hit or miss)",
+    ["cache", "result"],
+)
+
+
+def record_cache_lookup(cache: CacheConstants, data: Optional[JSON]) -> None:
+    """Count a cache lookup, to measure the hit ratio of the cache."""
+    CACHE_REQUESTS.labels(cache.value, "miss" if data is None else "hit").inc()
 
 
 class ICache:
@@ -47,6 +47,7 @@ class EventType(StrEnum):
     WORKER_TASK_STARTED = "WORKER_TASK_STARTED"
     WORKER_TASK_ENDED = "WORKER_TASK_ENDED"
     LAUNCH_PROGRESS = "LAUNCH_PROGRESS"
+    BOT_DELETED = "BOT_DELETED"
 
 
 class EventChannelDirectory:
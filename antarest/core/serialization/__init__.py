@@ -9,6 +9,7 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import functools
 import typing as t
 
 import pydantic
@@ -34,6 +35,28 @@ def to_json_string(data: t.Any, indent: t.Optional[int] = None) -> str:
     return to_json(data, indent=indent).decode("utf-8")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_list_adapter(model_cls: t.Type[t.Any]) -> pydantic.TypeAdapter[t.List[t.Any]]:
+    return pydantic.TypeAdapter(t.List[model_cls])  # type: ignore
+
+
+M = t.TypeVar("M", bound=pydantic.BaseModel)
+
+
+def validate_many(model_cls: t.Type[M], objs: t.Sequence[t.Mapping[str, t.Any]]) -> t.List[M]:
+    """
+    Validate a list of objects in a single call, which is faster than creating the models one by one.
+
+    Args:
+        model_cls: The model class used for validation.
+        objs: The objects to validate.
+
+    Returns:
+        The list of validated models, in the same order as the objects.
+    """
+    return _get_list_adapter(model_cls).validate_python(objs)
+
+
 class AntaresBaseModel(pydantic.BaseModel):
     """
     Due to pydantic migration from v1 to v2, we can have this issue:
@@ -38,6 +38,7 @@ class TaskType(StrEnum):
     UPGRADE_STUDY = "UPGRADE_STUDY"
     THERMAL_CLUSTER_SERIES_GENERATION = "THERMAL_CLUSTER_SERIES_GENERATION"
     SNAPSHOT_CLEARING = "SNAPSHOT_CLEARING"
+    MATRIX_IMPORT = "MATRIX_IMPORT"
 
 
 class TaskStatus(Enum):
@@ -12,6 +12,7 @@
 
 import datetime
 import logging
+import threading
 import time
 import typing as t
 from abc import ABC, abstractmethod
@@ -38,6 +39,7 @@ from antarest.core.tasks.model import (
 )
 from antarest.core.tasks.repository import TaskJobRepository
 from antarest.core.utils.fastapi_sqlalchemy import db
+from antarest.core.utils.metrics import Histogram
 from antarest.worker.worker import WorkerTaskCommand, WorkerTaskResult
 
 logger = logging.getLogger(__name__)
@@ -45,6 +47,15 @@ logger = logging.getLogger(__name__)
 DEFAULT_AWAIT_MAX_TIMEOUT = 172800  # 48 hours
 """Default timeout for `await_task` in seconds."""
 
+AWAIT_DB_CHECK_INTERVAL = 5
+"""Maximum interval in seconds between two checks of the task status in `await_task`."""
+
+_TASK_QUEUE_WAIT_SECONDS = Histogram(
+    "antarest_task_queue_wait_seconds",
+    "Time spent by the tasks in the queue of the task service, before being run",
+    ["type"],
+)
+
 
 class ITaskNotifier(ABC):
     @abstractmethod
@@ -172,42 +183,34 @@ class TaskJobService(ITaskService):
         task_type: str,
         task_args: t.Dict[str, t.Union[int, float, bool, str]],
     ) -> Task:
-        task_result_wrapper: t.List[TaskResult] = []
+        # noinspection PyUnusedLocal
+        def _send_worker_task(logger_: ITaskNotifier) -> TaskResult:
+            task_result: Future[TaskResult] = Future()
 
-        def _create_awaiter(
-            res_wrapper: t.List[TaskResult],
-        ) -> t.Callable[[Event], t.Awaitable[None]]:
             async def _await_task_end(event: Event) -> None:
                 task_event = WorkerTaskResult.model_validate(event.payload)
-                if task_event.task_id == task_id:
-                    res_wrapper.append(task_event.task_result)
+                if task_event.task_id == task_id and not task_result.done():
+                    task_result.set_result(task_event.task_result)
 
-            return _await_task_end
-
-        # noinspection PyUnusedLocal
-        def _send_worker_task(logger_: ITaskNotifier) -> TaskResult:
-            listener_id = self.event_bus.add_listener(
-                _create_awaiter(task_result_wrapper),
-                [EventType.WORKER_TASK_ENDED],
-            )
-            self.event_bus.queue(
-                Event(
-                    type=EventType.WORKER_TASK,
-                    payload=WorkerTaskCommand(
-                        task_id=task_id,
-                        task_type=task_type,
-                        task_args=task_args,
+            listener_id = self.event_bus.add_listener(_await_task_end, [EventType.WORKER_TASK_ENDED])
+            try:
+                self.event_bus.queue(
+                    Event(
+                        type=EventType.WORKER_TASK,
+                        payload=WorkerTaskCommand(
+                            task_id=task_id,
+                            task_type=task_type,
+                            task_args=task_args,
+                        ),
+                        # Use `NONE` for internal events
+                        permissions=PermissionInfo(public_mode=PublicMode.NONE),
                     ),
-                    # Use `NONE` for internal events
-                    permissions=PermissionInfo(public_mode=PublicMode.NONE),
-                ),
-                task_type,
-            )
-            while not task_result_wrapper:
-                logger.info("💤 Sleeping 1 second...")
-                time.sleep(1)
-            self.event_bus.remove_listener(listener_id)
-            return task_result_wrapper[0]
+                    task_type,
+                )
+                logger.info(f"💤 Waiting for the end of worker task '{task_id}'...")
+                return task_result.result()
+            finally:
+                self.event_bus.remove_listener(listener_id)
 
         return _send_worker_task
 
@@ -295,7 +298,9 @@ class TaskJobService(ITaskService):
                 permissions=PermissionInfo(owner=request_params.user.impersonator),
             )
         )
-        future = self.threadpool.submit(self._run_task, action, task.id, custom_event_messages)
+        future = self.threadpool.submit(
+            self._run_task, action, task.id, custom_event_messages, submitted_at=time.perf_counter()
+        )
         self.tasks[task.id] = future
 
     def create_task_event_callback(self) -> t.Callable[[Event], t.Awaitable[None]]:
@@ -362,17 +367,28 @@ class TaskJobService(ITaskService):
                 logger.critical(f"🤕 Task '{task_id}' failed: {exc}.")
                 raise
         else:
-            logger.warning(f"Task '{task_id}' not handled by this worker, will poll for task completion from db")
-            end = time.time() + timeout_sec
-            while time.time() < end:
-                task_status = db.session.query(TaskJob.status).filter(TaskJob.id == task_id).scalar()
-                if task_status is None:
-                    logger.error(f"Awaited task '{task_id}' was not found")
-                    return
-                if TaskStatus(task_status).is_final():
-                    return
-                logger.info("💤 Sleeping 2 seconds...")
-                time.sleep(2)
+            logger.warning(f"Task '{task_id}' not handled by this worker, will wait for task completion")
+            task_ended = threading.Event()
+
+            async def _on_task_end(event: Event) -> None:
+                if event.channel == EventChannelDirectory.TASK + task_id:
+                    task_ended.set()
+
+            listener_id = self.event_bus.add_listener(_on_task_end, [EventType.TASK_COMPLETED, EventType.TASK_FAILED])
+            try:
+                end = time.time() + timeout_sec
+                while time.time() < end:
+                    task_status = db.session.query(TaskJob.status).filter(TaskJob.id == task_id).scalar()
+                    if task_status is None:
+                        logger.error(f"Awaited task '{task_id}' was not found")
+                        return
+                    if TaskStatus(task_status).is_final():
+                        return
+                    # The end event wakes us up, the database is still checked
+                    # regularly in case the task ends without sending an event.
+                    task_ended.wait(min(AWAIT_DB_CHECK_INTERVAL, max(0.0, end - time.time())))
+            finally:
+                self.event_bus.remove_listener(listener_id)
 
             logger.error(f"Timeout while awaiting task '{task_id}'")
             db.session.query(TaskJob).filter(TaskJob.id == task_id).update(
@@ -389,12 +405,16 @@ class TaskJobService(ITaskService):
         callback: Task,
         task_id: str,
         custom_event_messages: t.Optional[CustomTaskEventMessages] = None,
+        submitted_at: t.Optional[float] = None,
     ) -> None:
         # attention: this function is executed in a thread, not in the main process
+        queue_wait = None if submitted_at is None else time.perf_counter() - submitted_at
         with db():
             task = db.session.query(TaskJob).get(task_id)
             task_type = task.type
             study_id = task.ref_id
+        if queue_wait is not None:
+            _TASK_QUEUE_WAIT_SECONDS.labels(task_type).observe(queue_wait)
 
         self.event_bus.push(
             Event(
@@ -9,12 +9,18 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import collections
+import contextlib
+import dataclasses
+import functools
 import logging
 import os
 import shutil
 import tempfile
 import typing as t
 import zipfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import StrEnum
 from pathlib import Path
 
@@ -34,6 +40,117 @@ def is_archive_format(suffix: str) -> bool:
     return suffix in {ArchiveFormat.ZIP, ArchiveFormat.SEVEN_ZIP}
 
 
+# Number of threads used to compress or extract the members of a ZIP archive
+ARCHIVE_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Compression level of the ZIP archives (fast compression)
+ZIP_COMPRESS_LEVEL = 2
+
+# Files bigger than this size are compressed while being written, instead of being loaded in memory
+_PARALLEL_MAX_FILE_SIZE = 64 * 1024 * 1024
+
+# Maximum size of the files being compressed in parallel, waiting to be written in the archive
+_PARALLEL_MAX_PENDING_SIZE = 256 * 1024 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class _DeflatedFile:
+    data: bytes
+    crc: int
+    size: int
+
+
+def _deflate_file(path: str, level: int) -> _DeflatedFile:
+    with open(path, mode="rb") as f:
+        content = f.read()
+    # Raw deflate stream (no zlib header), as stored in ZIP archives
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    data = compressor.compress(content) + compressor.flush()
+    return _DeflatedFile(data=data, crc=zlib.crc32(content), size=len(content))
+
+
+# Private attributes of `zipfile.ZipFile` used to write a member compressed beforehand
+_ZIPFILE_WRITE_ATTRIBUTES = ("fp", "start_dir", "filelist", "NameToInfo", "_lock", "_writing", "_didModify")
+
+
+def _can_write_deflated(zf: zipfile.ZipFile) -> bool:
+    """
+    Check that the `zipfile` implementation has the private attributes used by `_write_deflated`,
+    because they may change between Python versions. If not, the files must be written with `ZipFile.write`.
+    """
+    return hasattr(zipfile.ZipInfo, "FileHeader") and all(hasattr(zf, name) for name in _ZIPFILE_WRITE_ATTRIBUTES)
+
+
+def _write_deflated(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, deflated: _DeflatedFile) -> None:
+    """
+    Write an already compressed member in a ZIP archive opened in write mode.
+
+    This mimics `ZipFile.write`, which cannot write data compressed beforehand,
+    and must only be used if `_can_write_deflated` is true.
+    """
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.flag_bits = 0x00
+    zinfo.file_size = deflated.size
+    zinfo.compress_size = len(deflated.data)
+    zinfo.CRC = deflated.crc
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    with zf._lock:  # type: ignore
+        if zf._writing:  # type: ignore
+            raise ValueError("Can't write to the ZIP archive while an open writing handle exists")
+        fp = t.cast(t.IO[bytes], zf.fp)
+        fp.seek(zf.start_dir)
+        zinfo.header_offset = fp.tell()
+        fp.write(zinfo.FileHeader(zip64))
+        fp.write(deflated.data)
+        zf.start_dir = fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf._didModify = True  # type: ignore
+
+
+def _zip_dir(src_dir_path: Path, target_archive_path: Path) -> None:
+    """
+    Compress a directory in a ZIP archive, the files are compressed in parallel.
+
+    The files are written in the archive in the order of `os.walk`, as soon as they are compressed.
+    """
+    files = [os.path.join(root, file) for root, _, filenames in os.walk(src_dir_path) for file in sorted(filenames)]
+    pending: t.Deque[t.Tuple[str, int, t.Optional["Future[_DeflatedFile]"]]] = collections.deque()
+    pending_size = 0
+    with contextlib.ExitStack() as stack:
+        zf = stack.enter_context(
+            zipfile.ZipFile(
+                target_archive_path,
+                mode="w",
+                compression=zipfile.ZIP_DEFLATED,
+                compresslevel=ZIP_COMPRESS_LEVEL,
+            )
+        )
+        pool = stack.enter_context(ThreadPoolExecutor(ARCHIVE_MAX_WORKERS, thread_name_prefix="archive_"))
+        parallel = _can_write_deflated(zf)
+
+        def _write_next() -> int:
+            file_path, size, future = pending.popleft()
+            arcname = os.path.relpath(file_path, src_dir_path)
+            if future is None:
+                zf.write(file_path, arcname)
+            else:
+                _write_deflated(zf, zipfile.ZipInfo.from_file(file_path, arcname), future.result())
+            return size
+
+        for file_path in files:
+            size = os.path.getsize(file_path)
+            if not parallel or size > _PARALLEL_MAX_FILE_SIZE:
+                pending.append((file_path, 0, None))
+            else:
+                pending.append((file_path, size, pool.submit(_deflate_file, file_path, ZIP_COMPRESS_LEVEL)))
+                pending_size += size
+            while pending and (pending[0][2] is None or pending_size > _PARALLEL_MAX_PENDING_SIZE):
+                pending_size -= _write_next()
+        while pending:
+            pending_size -= _write_next()
+
+
 def archive_dir(
     src_dir_path: Path,
     target_archive_path: Path,
@@ -48,21 +165,39 @@ def archive_dir(
         with py7zr.SevenZipFile(target_archive_path, mode="w") as szf:
             szf.writeall(src_dir_path, arcname="")
     elif target_archive_path.suffix == ArchiveFormat.ZIP:
-        with zipfile.ZipFile(target_archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=2) as zipf:
-            len_dir_path = len(str(src_dir_path))
-            for root, _, files in os.walk(src_dir_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    zipf.write(file_path, file_path[len_dir_path:])
+        _zip_dir(src_dir_path, target_archive_path)
     else:
         raise ShouldNotHappenException(f"Unsupported archive format {target_archive_path.suffix}")
     if remove_source_dir:
         shutil.rmtree(src_dir_path)
 
 
+def _extract_zip(zf: zipfile.ZipFile, target_dir: Path) -> None:
+    """
+    Extract all the members of a ZIP archive, the members are decompressed in parallel.
+
+    Reading the members of a `ZipFile` from several threads is safe:
+    the archive file is shared with a lock, and decompression happens outside it.
+    """
+    members = zf.infolist()
+    if len(members) < 2 or ARCHIVE_MAX_WORKERS < 2:
+        zf.extractall(target_dir)
+        return
+    # Create the directories first, to avoid concurrent creations of the same directory.
+    # Unsafe paths are left to `ZipFile.extract`, which sanitizes them.
+    root = target_dir.resolve()
+    for member in members:
+        path = (root / member.filename).resolve()
+        if path.is_relative_to(root):
+            (path if member.is_dir() else path.parent).mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(ARCHIVE_MAX_WORKERS, thread_name_prefix="extract_") as pool:
+        for _ in pool.map(functools.partial(zf.extract, path=target_dir), members):
+            pass
+
+
 def unzip(dir_path: Path, zip_path: Path, remove_source_zip: bool = False) -> None:
     with zipfile.ZipFile(zip_path, mode="r") as zipf:
-        zipf.extractall(dir_path)
+        _extract_zip(zipf, dir_path)
     if remove_source_zip:
         zip_path.unlink()
 
@@ -107,7 +242,7 @@ def extract_archive(stream: t.BinaryIO, target_dir: Path) -> None:
     if file_format[:4] == b"PK\x03\x04":
         try:
             with zipfile.ZipFile(stream) as zf:
-                zf.extractall(path=target_dir)
+                _extract_zip(zf, target_dir)
         except zipfile.BadZipFile as error:
             raise BadArchiveContent("Unsupported ZIP format") from error
 
@@ -169,6 +304,33 @@ def read_file_from_archive(archive_path: Path, posix_path: str) -> str:
         raise ValueError(f"Unsupported {archive_path.suffix} archive format for {archive_path}")
 
 
+def read_files_from_archive(archive_path: Path, predicate: t.Callable[[str], t.Any]) -> t.Dict[str, str]:
+    """
+    Read several files from an archive, opening the archive only once.
+
+    Args:
+        archive_path: the path to the archive file.
+        predicate: function called with the POSIX path of each file of the archive,
+            the file is read if the result is truthy.
+
+    Returns:
+        The content of the selected files as strings, indexed by their path inside the archive.
+    """
+
+    if archive_path.suffix == ArchiveFormat.ZIP:
+        with zipfile.ZipFile(archive_path) as zip_obj:
+            names = [name for name in zip_obj.namelist() if predicate(name)]
+            return {name: zip_obj.read(name).decode("utf-8") for name in names}
+    elif archive_path.suffix == ArchiveFormat.SEVEN_ZIP:
+        with py7zr.SevenZipFile(archive_path, mode="r") as szf:
+            names = [name for name in szf.getnames() if predicate(name)]
+            if not names:
+                return {}
+            return {name: f.read().decode("utf-8") for name, f in szf.read(names).items()}
+    else:
+        raise ValueError(f"Unsupported {archive_path.suffix} archive format for {archive_path}")
+
+
 def extract_lines_from_archive(root: Path, posix_path: str) -> t.List[str]:
     """
     Extract text lines from various types of files.
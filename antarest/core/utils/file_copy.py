@@ -0,0 +1,125 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import logging
+import os
+import shutil
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# `FICLONE` ioctl request code (see `ioctl_ficlone(2)`), supported by Btrfs, XFS, OCFS2...
+FICLONE = 0x40049409
+
+# Number of threads used to copy the files of a directory tree
+COPY_MAX_WORKERS = 8
+
+# Devices on which the creation of reflinks failed: no need to try again.
+_no_reflink_devices: t.Set[int] = set()
+_no_reflink_lock = threading.Lock()
+
+
+class CopyMode(StrEnum):
+    """
+    Strategy used to copy directory trees (e.g.: when a study is copied or a variant snapshot is created).
+
+    - `COPY`: regular copy of the files.
+    - `REFLINK`: copy-on-write clones of the files when the filesystem supports them,
+      parallel kernel-side copy otherwise.
+    """
+
+    COPY = "copy"
+    REFLINK = "reflink"
+
+
+def _reflink(src_fd: int, dst_fd: int, device: int) -> bool:
+    if fcntl is None or device in _no_reflink_devices:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        with _no_reflink_lock:
+            if device not in _no_reflink_devices:
+                logger.info(f"Reflinks are not supported on device {device}: {e}")
+                _no_reflink_devices.add(device)
+        return False
+
+
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> None:
+    copied = 0
+    while copied < size:
+        n = os.copy_file_range(src_fd, dst_fd, size - copied)
+        if n == 0:
+            break
+        copied += n
+
+
+def clone_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file, using a copy-on-write clone (reflink) if the filesystem supports it.
+
+    Otherwise, the file content is copied by the kernel with `copy_file_range`
+    (or by a regular copy if it is not available). The file metadata are copied too.
+    """
+    with open(src, mode="rb") as fsrc, open(dst, mode="wb") as fdst:
+        stat = os.fstat(fsrc.fileno())
+        if not _reflink(fsrc.fileno(), fdst.fileno(), stat.st_dev):
+            try:
+                _copy_range(fsrc.fileno(), fdst.fileno(), stat.st_size)
+            except (AttributeError, OSError):
+                # `copy_file_range` is not available on this platform or between these filesystems
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+def copy_tree(
+    src: Path,
+    dst: Path,
+    mode: CopyMode = CopyMode.COPY,
+    ignore: t.Optional[t.Callable[[str, t.List[str]], t.Iterable[str]]] = None,
+) -> None:
+    """
+    Recursively copy a directory tree, like `shutil.copytree`, using the given copy strategy.
+
+    Args:
+        src: Source directory.
+        dst: Destination directory, which must not exist.
+        mode: Copy strategy.
+        ignore: Callable used to ignore files (see `shutil.copytree`).
+    """
+    if mode != CopyMode.REFLINK:
+        shutil.copytree(src, dst, ignore=ignore)
+        return
+
+    # The directories are created first, the files are then cloned in parallel.
+    files: t.List[t.Tuple[str, str]] = []
+
+    def _register(src_file: str, dst_file: str) -> None:
+        files.append((src_file, dst_file))
+
+    shutil.copytree(src, dst, ignore=ignore, copy_function=_register)
+    with ThreadPoolExecutor(max_workers=COPY_MAX_WORKERS, thread_name_prefix="copy_tree_") as pool:
+        for future in [pool.submit(clone_file, Path(s), Path(d)) for s, d in files]:
+            future.result()
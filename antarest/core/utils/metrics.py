@@ -0,0 +1,283 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+"""
+In-process metrics of the application, exposed in the Prometheus text format.
+
+The API mimics the one of the `prometheus_client` library (`Counter`, `Gauge`, `Histogram`, `labels`...),
+without the dependency. The metrics are only updated in memory (a lock and a few additions),
+the text exposition is computed when the metrics are scraped.
+"""
+
+import bisect
+import functools
+import math
+import threading
+import time
+import typing as t
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds (in seconds) of the histogram buckets, suitable for the latency of hot paths
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: t.Sequence[t.Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = ((name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for name, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class MetricsRegistry:
+    """
+    Collection of the metrics exposed by the application.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: t.Dict[str, "_Metric[t.Any]"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric[t.Any]") -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Duplicated metric: '{metric.name}'")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: t.List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+C = t.TypeVar("C")
+
+
+class _Metric(t.Generic[C]):
+    type_name: str
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: t.Dict[t.Tuple[str, ...], C] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # metrics without labels are exposed even if they are never updated
+            self.labels()
+        registry.register(self)
+
+    def _new_child(self) -> C:
+        raise NotImplementedError()
+
+    def labels(self, *labelvalues: str) -> C:
+        """
+        Returns the child metric of the given label values (in the order of the label names).
+        """
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects the labels {self.labelnames}, got {labelvalues}")
+        key = tuple(str(value) for value in labelvalues)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self) -> t.List[t.Tuple[t.Tuple[t.Tuple[str, str], ...], C]]:
+        with self._lock:
+            children = list(self._children.items())
+        return [(tuple(zip(self.labelnames, key)), child) for key, child in children]
+
+    def collect(self) -> t.Iterator[str]:
+        raise NotImplementedError()
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric[_CounterChild]):
+    """
+    Monotonic counter, e.g.: the number of cache hits.
+
+    By convention, the name of a counter ends with `_total`.
+    """
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def collect(self) -> t.Iterator[str]:
+        for labels, child in self._samples():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"
+
+
+class _GaugeChild:
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.function: t.Optional[t.Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def set_function(self, function: t.Callable[[], float]) -> None:
+        """
+        Compute the value of the gauge by calling the given function when the metrics are scraped.
+        """
+        self.function = function
+
+    def get(self) -> float:
+        return float(self.function()) if self.function is not None else self.value
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """
+    Value that can go up and down, e.g.: the number of websocket connections.
+    """
+
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, function: t.Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+    def collect(self) -> t.Iterator[str]:
+        for labels, child in self._samples():
+            yield f"{self.name}{_format_labels(labels)} {_format_value(child.get())}"
+
+
+class _Timer:
+    """
+    Context manager (or decorator) observing the elapsed time in a histogram.
+    """
+
+    def __init__(self, child: "_HistogramChild") -> None:
+        self._child = child
+        self._start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self._child.observe(time.perf_counter() - self._start)
+
+    def __call__(self, func: F) -> F:
+        child = self._child
+
+        @functools.wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            # a new timer is used for each call, so that the decorated function can be called concurrently
+            with _Timer(child):
+                return func(*args, **kwargs)
+
+        return t.cast(F, wrapper)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: t.Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # the last bucket counts the observations greater than the highest upper bound (`+Inf`)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """
+    Distribution of observed values (durations in seconds by default), counted in cumulative buckets.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: t.Sequence[str] = (),
+        registry: MetricsRegistry = REGISTRY,
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> _Timer:
+        return self.labels().time()
+
+    def collect(self) -> t.Iterator[str]:
+        for labels, child in self._samples():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                bucket_labels = labels + (("le", _format_value(upper_bound)),)
+                yield f"{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}"
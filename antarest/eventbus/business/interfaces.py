@@ -12,7 +12,7 @@
 
 import abc
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from antarest.core.interfaces.eventbus import Event
 
@@ -27,7 +27,17 @@ class IEventBusBackend(abc.ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def pull_queue(self, queue: str) -> Optional[Event]:
+    def pull_queues(self, queues: Sequence[str], timeout: float) -> Optional[Tuple[str, Event]]:
+        """
+        Wait for an event in any of the given queues and remove it from its queue.
+
+        Args:
+            queues: names of the queues to consume, in priority order.
+            timeout: maximum waiting time in seconds.
+
+        Returns:
+            The name of the queue and the event, or `None` if no event was queued before the timeout.
+        """
         raise NotImplementedError
 
     @abstractmethod
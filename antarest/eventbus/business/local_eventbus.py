@@ -11,7 +11,8 @@
 # This file is part of the Antares project.
 
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from antarest.core.interfaces.eventbus import Event
 from antarest.eventbus.business.interfaces import IEventBusBackend
@@ -23,6 +24,7 @@ class LocalEventBus(IEventBusBackend):
     def __init__(self) -> None:
         self.events: List[Event] = []
         self.queues: Dict[str, List[Event]] = {}
+        self.queued = threading.Condition()
 
     def push_event(self, event: Event) -> None:
         self.events.append(event)
@@ -34,11 +36,14 @@ class LocalEventBus(IEventBusBackend):
         self.events.clear()
 
     def queue_event(self, event: Event, queue: str) -> None:
-        if queue not in self.queues:
-            self.queues[queue] = []
-        self.queues[queue].append(event)
-
-    def pull_queue(self, queue: str) -> Optional[Event]:
-        if queue in self.queues and len(self.queues[queue]) > 0:
-            return self.queues[queue].pop(0)
-        return None
+        with self.queued:
+            self.queues.setdefault(queue, []).append(event)
+            self.queued.notify_all()
+
+    def pull_queues(self, queues: Sequence[str], timeout: float) -> Optional[Tuple[str, Event]]:
+        with self.queued:
+            self.queued.wait_for(lambda: any(self.queues.get(queue) for queue in queues), timeout)
+            for queue in queues:
+                if self.queues.get(queue):
+                    return queue, self.queues[queue].pop(0)
+            return None
@@ -11,7 +11,8 @@
 # This file is part of the Antares project.
 
 import logging
-from typing import List, Optional, cast
+import math
+from typing import List, Optional, Sequence, Tuple
 
 from redis.client import Redis
 
@@ -34,11 +35,13 @@ class RedisEventBus(IEventBusBackend):
     def queue_event(self, event: Event, queue: str) -> None:
         self.redis.rpush(queue, event.model_dump_json())
 
-    def pull_queue(self, queue: str) -> Optional[Event]:
-        event = self.redis.lpop(queue)
-        if event:
-            return cast(Optional[Event], Event.parse_raw(event))
-        return None
+    def pull_queues(self, queues: Sequence[str], timeout: float) -> Optional[Tuple[str, Event]]:
+        # BLPOP only accepts an integer timeout (0 meaning "wait forever")
+        item = self.redis.blpop(list(queues), timeout=max(1, math.ceil(timeout)))
+        if item is None:
+            return None
+        queue, event = item
+        return queue.decode() if isinstance(queue, bytes) else queue, Event.model_validate_json(event)
 
     def get_events(self) -> List[Event]:
         try:
@@ -17,6 +17,7 @@ from redis import Redis
 
 from antarest.core.application import AppBuildContext
 from antarest.core.config import Config
+from antarest.core.interfaces.eventbus import EventType
 from antarest.eventbus.business.local_eventbus import LocalEventBus
 from antarest.eventbus.business.redis_eventbus import RedisEventBus
 from antarest.eventbus.service import EventBusService
@@ -32,6 +33,9 @@ def build_eventbus(
     eventbus = EventBusService(
         RedisEventBus(redis_client) if redis_client is not None else LocalEventBus(),
         autostart,
+        coalescing_windows={
+            EventType(ev_type): window for ev_type, window in config.eventbus.coalescing_windows.items()
+        },
     )
 
     if app_ctxt:
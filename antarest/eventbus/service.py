@@ -16,28 +16,116 @@ import random
 import threading
 import time
 import uuid
-from typing import Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
+from antarest.core.utils.metrics import Histogram
 from antarest.eventbus.business.interfaces import IEventBusBackend
 
 logger = logging.getLogger(__name__)
 
+# Maximum time (in seconds) a blocking read of the queues waits before taking new consumers into account
+QUEUE_PULL_TIMEOUT = 2.0
+
+_DISPATCH_SECONDS = Histogram(
+    "antarest_event_dispatch_seconds",
+    "Duration of the dispatch of an event to its listeners (broadcast) or to a consumer (queue)",
+    ["mode"],
+)
+
+CoalescingKey = Tuple[EventType, str, Any]
+
+
+def _coalescing_key(event: Event) -> CoalescingKey:
+    # progress events are identified by their channel, study events by the study ID
+    payload_id = event.payload.get("id") if isinstance(event.payload, dict) else None
+    return event.type, event.channel, payload_id
+
+
+class EventCoalescer:
+    """
+    Collapses bursts of events of the same type into one event per time window.
+
+    The first event of a burst is pushed immediately. The following events
+    received during the window only replace a pending event, which is pushed
+    when the window ends, so that only the latest value is sent.
+    """
+
+    def __init__(self, windows: Mapping[EventType, float]) -> None:
+        self.windows = {ev_type: window for ev_type, window in windows.items() if window > 0}
+        self.last_pushed: Dict[CoalescingKey, float] = {}
+        self.pending: Dict[CoalescingKey, Event] = {}
+        self.lock = threading.Lock()
+
+    def push(self, event: Event, push: Callable[[Event], None]) -> None:
+        window = self.windows.get(event.type)
+        with self.lock:
+            if window is None:
+                # pending events related to this one must be sent before it to preserve the ordering
+                self._push_related(event, push)
+                push(event)
+                return
+            key = _coalescing_key(event)
+            now = time.monotonic()
+            if key not in self.pending and now - self.last_pushed.get(key, -window) >= window:
+                self.last_pushed[key] = now
+                push(event)
+            else:
+                self.pending[key] = event
+
+    def flush(self, push: Callable[[Event], None], force: bool = False) -> None:
+        """
+        Push the pending events whose window has ended (or all of them if `force` is set).
+        """
+        with self.lock:
+            now = time.monotonic()
+            for key, event in list(self.pending.items()):
+                if force or now - self.last_pushed.get(key, 0) >= self.windows[key[0]]:
+                    del self.pending[key]
+                    self.last_pushed[key] = now
+                    push(event)
+            expired = [key for key, pushed in self.last_pushed.items() if now - pushed >= self.windows[key[0]]]
+            for key in expired:
+                if key not in self.pending:
+                    del self.last_pushed[key]
+
+    def _push_related(self, event: Event, push: Callable[[Event], None]) -> None:
+        if not self.pending:
+            return
+        _, channel, payload_id = _coalescing_key(event)
+        for key in list(self.pending):
+            if (channel and key[1] == channel) or (payload_id is not None and key[2] == payload_id):
+                self.last_pushed[key] = time.monotonic()
+                push(self.pending.pop(key))
+
 
 class EventBusService(IEventBus):
-    def __init__(self, backend: IEventBusBackend, autostart: bool = True) -> None:
+    def __init__(
+        self,
+        backend: IEventBusBackend,
+        autostart: bool = True,
+        coalescing_windows: Optional[Mapping[EventType, float]] = None,
+    ) -> None:
         self.backend = backend
+        self.coalescer = EventCoalescer(coalescing_windows or {})
         self.listeners: Dict[EventType, Dict[str, Callable[[Event], Awaitable[None]]]] = {
             ev_type: {} for ev_type in EventType
         }
         self.consumers: Dict[str, Dict[str, Callable[[Event], Awaitable[None]]]] = {}
+        self.consumers_changed = threading.Event()
 
         self.lock = threading.Lock()
         if autostart:
             self.start()
 
     def push(self, event: Event) -> None:
-        self.backend.push_event(event)
+        self.coalescer.push(event, self.backend.push_event)
+
+    def flush(self) -> None:
+        """
+        Push the events retained by the coalescing stage without waiting for the end of their window.
+        """
+        self.coalescer.flush(self.backend.push_event, force=True)
 
     def queue(self, event: Event, queue: str) -> None:
         self.backend.queue_event(event, queue)
@@ -48,6 +136,7 @@ class EventBusService(IEventBus):
             if queue not in self.consumers:
                 self.consumers[queue] = {}
             self.consumers[queue][listener_id] = listener
+            self.consumers_changed.set()
             return listener_id
 
     def remove_queue_consumer(self, listener_id: str) -> None:
@@ -78,36 +167,59 @@ class EventBusService(IEventBus):
         while True:
             time.sleep(0.2)
             try:
+                self.coalescer.flush(self.backend.push_event)
                 await self._on_events()
             except Exception as e:
                 logger.error("Unexpected error when processing events", exc_info=e)
 
+    def _consume_queues(self) -> None:
+        """
+        Dispatch the events of the queues to their consumers.
+
+        The queues are read with a blocking call, so that queued events are
+        processed as soon as they arrive without polling the backend.
+        """
+        loop = asyncio.new_event_loop()
+        while True:
+            with self.lock:
+                queues = [queue for queue, consumers in self.consumers.items() if consumers]
+                self.consumers_changed.clear()
+            if not queues:
+                self.consumers_changed.wait()
+                continue
+            try:
+                item = self.backend.pull_queues(queues, QUEUE_PULL_TIMEOUT)
+            except Exception as e:
+                logger.error("Unexpected error when pulling queue events", exc_info=e)
+                time.sleep(QUEUE_PULL_TIMEOUT)
+                continue
+            if item is None:
+                continue
+            queue, event = item
+            with self.lock:
+                consumers = list(self.consumers.get(queue, {}).values())
+            if not consumers:
+                # the consumers were removed in the meantime: give the event back
+                self.backend.queue_event(event, queue)
+                continue
+            try:
+                with _DISPATCH_SECONDS.labels("queue").time():
+                    loop.run_until_complete(random.choice(consumers)(event))
+            except Exception as ex:
+                logger.error(f"Failed to process queue event {event.type}", exc_info=ex)
+
     async def _on_events(self) -> None:
         with self.lock:
-            for queue in self.consumers:
-                if len(self.consumers[queue]) > 0:
-                    event = self.backend.pull_queue(queue)
-                    while event is not None:
-                        try:
-                            await list(self.consumers[queue].values())[
-                                random.randint(0, len(self.consumers[queue]) - 1)
-                            ](event)
-                        except Exception as ex:
-                            logger.error(
-                                f"Failed to process queue event {event.type}",
-                                exc_info=ex,
-                            )
-                        event = self.backend.pull_queue(queue)
-
             for e in self.backend.get_events():
                 if e.type in self.listeners:
-                    responses = await asyncio.gather(
-                        *[
-                            listener(e)
-                            for listener in list(self.listeners[e.type].values())
-                            + list(self.listeners[EventType.ANY].values())
-                        ]
-                    )
+                    with _DISPATCH_SECONDS.labels("broadcast").time():
+                        responses = await asyncio.gather(
+                            *[
+                                listener(e)
+                                for listener in list(self.listeners[e.type].values())
+                                + list(self.listeners[EventType.ANY].values())
+                            ]
+                        )
                     for res in responses:
                         if isinstance(res, Exception):
                             logger.error(
@@ -121,6 +233,11 @@ class EventBusService(IEventBus):
         loop.run_until_complete(self._run_loop())
 
     def start(self, threaded: bool = True) -> None:
+        threading.Thread(
+            target=self._consume_queues,
+            name=f"{self.__class__.__name__}-queues",
+            daemon=True,
+        ).start()
         if threaded:
             t = threading.Thread(
                 target=self._async_loop,
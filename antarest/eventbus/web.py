@@ -10,27 +10,42 @@
 #
 # This file is part of the Antares project.
 
+import asyncio
 import dataclasses
 import logging
 from enum import StrEnum
 from http import HTTPStatus
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from fastapi import Depends, HTTPException, Query
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
 from antarest.core.application import AppBuildContext
 from antarest.core.config import Config
-from antarest.core.interfaces.eventbus import Event, IEventBus
+from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
 from antarest.core.jwt import DEFAULT_ADMIN_USER, JWTUser
 from antarest.core.model import PermissionInfo, StudyPermissionType
 from antarest.core.permissions import check_permission
 from antarest.core.serialization import AntaresBaseModel, to_json_string
+from antarest.core.utils.metrics import Gauge
 from antarest.fastapi_jwt_auth import AuthJWT
 from antarest.login.auth import Auth
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of messages waiting to be sent to a single websocket.
+MAX_QUEUE_SIZE = 1000
+
+# Events which only carry the latest state of a long-running operation:
+# a slow consumer only needs the most recent one.
+COALESCED_EVENT_TYPES = frozenset({EventType.TASK_PROGRESS, EventType.LAUNCH_PROGRESS})
+
+_WEBSOCKET_STATS = Gauge(
+    "antarest_websocket_stats",
+    "Statistics of the websocket connections and of their outbound queues (see `ConnectionManager.get_stats`)",
+    ["stat"],
+)
+
 
 class WebsocketMessageAction(StrEnum):
     SUBSCRIBE = "SUBSCRIBE"
@@ -42,32 +57,104 @@ class WebsocketMessage(AntaresBaseModel):
     payload: str
 
 
+@dataclasses.dataclass(frozen=True)
+class _CoalescedMessage:
+    """Queue placeholder for a message whose latest value is stored in `WebsocketConnection.pending`."""
+
+    key: str
+
+
 @dataclasses.dataclass
 class WebsocketConnection:
     websocket: WebSocket
     user: JWTUser
     channel_subscriptions: List[str] = dataclasses.field(default_factory=list)
+    queue: "asyncio.Queue[Union[str, _CoalescedMessage]]" = dataclasses.field(
+        default_factory=lambda: asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+    )
+    pending: Dict[str, str] = dataclasses.field(default_factory=dict)
+    sender: Optional["asyncio.Task[None]"] = None
+    dropped: int = 0
+
+    def enqueue(self, message: str, coalesce_key: Optional[str] = None) -> None:
+        """
+        Queue a message for sending without waiting for the client.
+
+        Messages sharing a `coalesce_key` are merged while waiting in the queue:
+        only the most recent one is sent. When the queue is full, the message is dropped.
+        """
+        if coalesce_key is not None:
+            if coalesce_key in self.pending:
+                self.pending[coalesce_key] = message
+                return
+            item: Union[str, _CoalescedMessage] = _CoalescedMessage(coalesce_key)
+        else:
+            item = message
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % MAX_QUEUE_SIZE == 0:
+                logger.warning(f"Websocket queue of user {self.user.id} is full, {self.dropped} messages dropped")
+            return
+        if coalesce_key is not None:
+            self.pending[coalesce_key] = message
+
+    async def send_loop(self) -> None:
+        while True:
+            item = await self.queue.get()
+            try:
+                message = self.pending.pop(item.key) if isinstance(item, _CoalescedMessage) else item
+                await self.websocket.send_text(message)
+            except Exception as e:
+                logger.warning(f"Failed to send message to websocket of user {self.user.id}", exc_info=e)
+                return
+            finally:
+                self.queue.task_done()
+
+
+def _user_key(user: JWTUser) -> Tuple[object, ...]:
+    return user.id, user.type, user.impersonator, tuple((g.id, g.role) for g in user.groups)
 
 
 class ConnectionManager:
     def __init__(self) -> None:
-        self.active_connections: List[WebsocketConnection] = []
+        # connections are indexed by the identity of their websocket (websockets are not hashable)
+        self.connections: Dict[int, WebsocketConnection] = {}
+        self.channels: Dict[str, Set[int]] = {}
+
+    @property
+    def active_connections(self) -> List[WebsocketConnection]:
+        return list(self.connections.values())
 
     async def connect(self, websocket: WebSocket, user: JWTUser) -> None:
         await websocket.accept()
-        self.active_connections.append((WebsocketConnection(websocket, user)))
+        connection = WebsocketConnection(websocket, user)
+        connection.sender = asyncio.create_task(connection.send_loop())
+        self.connections[id(websocket)] = connection
 
     def _get_connection(self, websocket: WebSocket) -> Optional[WebsocketConnection]:
-        for connection in self.active_connections:
-            if connection.websocket == websocket:
-                return connection
-        logger.warning(f"Failed to remove websocket connection f{websocket}. Not found in active connections.")
-        return None
+        connection = self.connections.get(id(websocket))
+        if connection is None:
+            logger.warning(f"Failed to find websocket connection {websocket}. Not found in active connections.")
+        return connection
 
     def disconnect(self, websocket: WebSocket) -> None:
-        connection_to_remove: Optional[WebsocketConnection] = self._get_connection(websocket)
-        if connection_to_remove is not None:
-            self.active_connections.remove(connection_to_remove)
+        connection = self.connections.pop(id(websocket), None)
+        if connection is None:
+            logger.warning(f"Failed to remove websocket connection {websocket}. Not found in active connections.")
+            return
+        for channel in connection.channel_subscriptions:
+            self._unindex(channel, id(websocket))
+        if connection.sender is not None:
+            connection.sender.cancel()
+
+    def _unindex(self, channel: str, key: int) -> None:
+        subscribers = self.channels.get(channel)
+        if subscribers is not None:
+            subscribers.discard(key)
+            if not subscribers:
+                del self.channels[channel]
 
     def process_message(self, message: str, websocket: WebSocket) -> None:
         connection = self._get_connection(websocket)
@@ -78,27 +165,67 @@ class ConnectionManager:
         if ws_message.action == WebsocketMessageAction.SUBSCRIBE:
             if ws_message.payload not in connection.channel_subscriptions:
                 connection.channel_subscriptions.append(ws_message.payload)
+                self.channels.setdefault(ws_message.payload, set()).add(id(websocket))
         elif ws_message.action == WebsocketMessageAction.UNSUBSCRIBE:
             if ws_message.payload in connection.channel_subscriptions:
                 connection.channel_subscriptions.remove(ws_message.payload)
+                self._unindex(ws_message.payload, id(websocket))
+
+    def broadcast(
+        self,
+        message: str,
+        permissions: PermissionInfo,
+        channel: str,
+        coalesce_key: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a message for all the connections subscribed to the channel
+        (or all the connections if the channel is empty) whose user can read it.
+
+        The message is sent by the sender task of each connection,
+        so that a slow client does not delay the others.
+        """
+        if channel:
+            keys = self.channels.get(channel, ())
+            recipients = [self.connections[key] for key in keys if key in self.connections]
+        else:
+            recipients = list(self.connections.values())
+
+        # the same user is often connected from several browsers
+        allowed: Dict[Tuple[object, ...], bool] = {}
+        for connection in recipients:
+            user_key = _user_key(connection.user)
+            if user_key not in allowed:
+                allowed[user_key] = check_permission(connection.user, permissions, StudyPermissionType.READ)
+            if allowed[user_key]:
+                connection.enqueue(message, coalesce_key)
 
-    async def broadcast(self, message: str, permissions: PermissionInfo, channel: str) -> None:
-        for connection in self.active_connections:
-            # if is subscribed to chanel and has permission, send message to websocket
-            if (not channel or channel in connection.channel_subscriptions) and check_permission(
-                connection.user, permissions, StudyPermissionType.READ
-            ):
-                await connection.websocket.send_text(message)
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns metrics about the outbound queues of the websocket connections.
+        """
+        connections = list(self.connections.values())
+        depths = [connection.queue.qsize() for connection in connections]
+        return {
+            "connections": len(depths),
+            "channels": len(self.channels),
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_messages": sum(connection.dropped for connection in connections),
+        }
 
 
 def configure_websockets(app_ctxt: AppBuildContext, config: Config, event_bus: IEventBus) -> None:
     manager = ConnectionManager()
+    for stat in manager.get_stats():
+        _WEBSOCKET_STATS.labels(stat).set_function(lambda stat=stat: manager.get_stats()[stat])  # type: ignore
 
     async def send_event_to_ws(event: Event) -> None:
         event_data = event.model_dump()
         del event_data["permissions"]
         del event_data["channel"]
-        await manager.broadcast(to_json_string(event_data), event.permissions, event.channel)
+        coalesce_key = f"{event.type}:{event.channel}" if event.type in COALESCED_EVENT_TYPES else None
+        manager.broadcast(to_json_string(event_data), event.permissions, event.channel, coalesce_key)
 
     @app_ctxt.api_root.websocket("/ws")
     async def connect(
@@ -1,8 +1,12 @@
 import hmac
+import math
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Sequence, Union
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
 import jwt
 from fastapi import Request, Response, WebSocket
@@ -23,6 +27,54 @@ from .exceptions import (
 TYPE_ERROR_MSG = "The response must be an object response FastAPI"
 
 
+class _VerifiedTokenCache:
+    """
+    LRU cache of the verified tokens, the same token is usually verified several times per request.
+
+    A token is only kept until its expiration time.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._tokens: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Union[str, int, bool]], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Dict[str, Union[str, int, bool]]]:
+        """
+        :param key: the encoded token and the decoding options
+        :return: a copy of the decoded token, or None if the token is not cached or has expired
+        """
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            raw_token, expiration = entry
+            if expiration <= time.time():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return dict(raw_token)
+
+    def put(self, key: Tuple[Any, ...], raw_token: Dict[str, Union[str, int, bool]], expiration: float) -> None:
+        """
+        :param key: the encoded token and the decoding options
+        :param raw_token: the decoded token
+        :param expiration: the time (in seconds since the Epoch) after which the token must be verified again
+        """
+        with self._lock:
+            self._tokens[key] = (dict(raw_token), expiration)
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.maxsize:
+                self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+
+_verified_tokens = _VerifiedTokenCache()
+
+
 class AuthJWT(AuthConfig):
     def __init__(self, req: Request = None, res: Response = None):
         """
@@ -628,8 +680,12 @@ class AuthJWT(AuthConfig):
         """
         algorithms = self._decode_algorithms or [self._algorithm]
         secret_key = self._get_secret_key(self._algorithm, "decode")
+        key = (encoded_token, issuer, secret_key, tuple(algorithms), repr(self._decode_audience), self._decode_leeway)
+        raw_token = _verified_tokens.get(key)
+        if raw_token is not None:
+            return raw_token
         try:
-            return jwt.decode(
+            raw_token = jwt.decode(
                 encoded_token,
                 secret_key,
                 issuer=issuer,
@@ -639,6 +695,13 @@ class AuthJWT(AuthConfig):
             )
         except Exception as err:
             raise JWTDecodeError(status_code=422, message=str(err))
+        if "exp" in raw_token:
+            leeway = self._decode_leeway
+            expiration = raw_token["exp"] + (leeway.total_seconds() if isinstance(leeway, timedelta) else leeway)
+        else:
+            expiration = math.inf
+        _verified_tokens.put(key, raw_token, expiration)
+        return raw_token
 
     def jwt_required(
         self,
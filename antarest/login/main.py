@@ -10,15 +10,16 @@
 #
 # This file is part of the Antares project.
 
+import functools
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from antarest.core.application import AppBuildContext
 from antarest.core.config import Config
-from antarest.core.interfaces.eventbus import DummyEventBusService, IEventBus
+from antarest.core.interfaces.eventbus import DummyEventBusService, Event, EventType, IEventBus
 from antarest.core.serialization import from_json
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.fastapi_jwt_auth import AuthJWT
@@ -29,6 +30,13 @@ from antarest.login.service import LoginService
 from antarest.login.web import create_login_api
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_subject(subject: str) -> Tuple[str, int]:
+    """Return the type ("users" or "bots") and the ID of the identity of a JWT subject."""
+    identity = from_json(subject)
+    return identity["type"], identity["id"]
+
+
 def build_login(
     app_ctxt: Optional[AppBuildContext],
     config: Config,
@@ -77,11 +85,19 @@ def build_login(
 
     @AuthJWT.token_in_denylist_loader  # type: ignore
     def check_if_token_is_revoked(decrypted_token: Any) -> bool:
-        subject = from_json(decrypted_token["sub"])
-        user_id = subject["id"]
-        token_type = subject["type"]
+        token_type, user_id = _parse_subject(decrypted_token["sub"])
+        if token_type != "bots" or service is None:
+            return False
+        if service.live_bots.contains(user_id):
+            return False
         with db():
-            return token_type == "bots" and service is not None and not service.exists_bot(user_id)
+            return not service.exists_bot(user_id)
+
+    async def _on_bot_deleted(event: Event) -> None:
+        if service is not None:
+            service.live_bots.discard(event.payload)
+
+    event_bus.add_listener(_on_bot_deleted, [EventType.BOT_DELETED])
 
     if app_ctxt:
         app_ctxt.api_root.include_router(create_login_api(service, config))
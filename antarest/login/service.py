@@ -11,12 +11,15 @@
 # This file is part of the Antares project.
 
 import logging
-from typing import List, Optional, Union
+import threading
+import time
+from typing import Dict, List, Optional, Union
 
 from fastapi import HTTPException
 
-from antarest.core.interfaces.eventbus import IEventBus
+from antarest.core.interfaces.eventbus import Event, EventType, IEventBus
 from antarest.core.jwt import JWTGroup, JWTUser
+from antarest.core.model import PermissionInfo, PublicMode
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
 from antarest.core.roles import RoleType
 from antarest.login.ldap import LdapService
@@ -54,6 +57,39 @@ class UserNotFoundError(HTTPException):
         super().__init__(status_code=404, detail="User not found")
 
 
+class LiveBotCache:
+    """
+    In-memory cache of the IDs of the existing bots.
+
+    The bot tokens are checked on each request: this cache avoids a database query
+    for the bots which have been checked recently. An entry expires after `ttl` seconds,
+    and is discarded as soon as the bot is deleted.
+    """
+
+    def __init__(self, ttl: float = 60) -> None:
+        self.ttl = ttl
+        self._expirations: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, bot_id: int) -> bool:
+        with self._lock:
+            expiration = self._expirations.get(bot_id)
+            if expiration is None:
+                return False
+            if expiration <= time.monotonic():
+                del self._expirations[bot_id]
+                return False
+            return True
+
+    def add(self, bot_id: int) -> None:
+        with self._lock:
+            self._expirations[bot_id] = time.monotonic() + self.ttl
+
+    def discard(self, bot_id: int) -> None:
+        with self._lock:
+            self._expirations.pop(bot_id, None)
+
+
 class LoginService:
     """
     Facade module service to handle request to manage user, group and role
@@ -74,6 +110,7 @@ class LoginService:
         self.roles = role_repo
         self.ldap = ldap
         self.event_bus = event_bus
+        self.live_bots = LiveBotCache()
 
     def save_group(self, group: Group, params: RequestParameters) -> Group:
         """
@@ -472,7 +509,12 @@ class LoginService:
         Returns: true if bot exist, false else.
 
         """
-        return self.bots.exists(id)
+        if self.live_bots.contains(id):
+            return True
+        exists = self.bots.exists(id)
+        if exists:
+            self.live_bots.add(id)
+        return exists
 
     def authenticate(self, name: str, pwd: str) -> Optional[JWTUser]:
         """
@@ -742,7 +784,16 @@ class LoginService:
             logger.info("bot %d deleted by user %s", id, params.get_user_id())
             for role in self.roles.get_all_by_user(id):
                 self.roles.delete(user=role.identity_id, group=role.group_id)
-            return self.bots.delete(id)
+            self.bots.delete(id)
+            # The other workers are notified to revoke the bot tokens
+            self.live_bots.discard(id)
+            self.event_bus.push(
+                Event(
+                    type=EventType.BOT_DELETED,
+                    payload=id,
+                    permissions=PermissionInfo(public_mode=PublicMode.NONE),
+                )
+            )
         else:
             logger.error(
                 "user %s has not permission to delete bot %d",
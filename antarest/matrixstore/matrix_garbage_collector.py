@@ -11,8 +11,8 @@
 # This file is part of the Antares project.
 
 import logging
+import os
 import time
-from os import listdir
 from pathlib import Path
 from typing import List, Set
 
@@ -25,13 +25,13 @@ from antarest.matrixstore.service import MatrixService
 from antarest.matrixstore.uri_resolver_service import UriResolverService
 from antarest.study.model import DEFAULT_WORKSPACE_NAME
 from antarest.study.service import StudyService
-from antarest.study.storage.variantstudy.model.command.icommand import ICommand
-from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock
-from antarest.study.storage.variantstudy.model.model import CommandDTO
 from antarest.study.storage.variantstudy.variant_study_service import VariantStudyService
 
 logger = logging.getLogger(__name__)
 
+# Number of matrices deleted in a single transaction
+_DELETION_BATCH_SIZE = 1000
+
 
 class MatrixGarbageCollector(IService):
     def __init__(
@@ -48,12 +48,21 @@ class MatrixGarbageCollector(IService):
         self.matrix_service = matrix_service
         self.dataset_repository: MatrixDataSetRepository = matrix_service.repo_dataset
         self.sleeping_time = config.storage.matrix_gc_sleeping_time
+        self.grace_period = config.storage.matrix_gc_grace_period
         self.matrix_constants = self.variant_study_service.command_factory.command_context.generator_matrix_constants
         self.dry_run = config.storage.matrix_gc_dry_run
 
     def _get_saved_matrices(self) -> Set[str]:
+        """
+        Return the matrices saved for longer than the grace period.
+
+        Recent matrices are never collected: they may be created by an operation
+        which has not yet saved the reference to the matrix (command, link file, etc.).
+        """
         logger.info("Getting all saved matrices")
-        return {f.split(".")[0] for f in listdir(self.saved_matrices_path)}
+        deadline = time.time() - self.grace_period
+        with os.scandir(self.saved_matrices_path) as entries:
+            return {entry.name.split(".")[0] for entry in entries if entry.stat().st_mtime <= deadline}
 
     def _get_raw_studies_matrices(self) -> Set[str]:
         logger.info("Getting all matrices used in raw studies")
@@ -65,57 +74,50 @@ class MatrixGarbageCollector(IService):
             if matrix_id
         }
 
-    def _get_variant_studies_matrices(self) -> Set[str]:
+    def _get_variant_studies_matrices(self, matrices: Set[str]) -> Set[str]:
+        """Return the given matrices which are referenced by variant study commands"""
         logger.info("Getting all matrices used in variant studies")
-        command_blocks: List[CommandBlock] = self.variant_study_service.repository.get_all_command_blocks()
+        return self.variant_study_service.repository.get_used_matrices(matrices)
 
-        def transform_to_command(command_dto: CommandDTO, study_ref: str) -> List[ICommand]:
-            try:
-                return self.variant_study_service.command_factory.to_command(command_dto)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to parse command {command_dto} (from study {study_ref}) !",
-                    exc_info=e,
-                )
-            return []
+    def _get_datasets_matrices(self, matrices: Set[str]) -> Set[str]:
+        """Return the given matrices which are used in datasets"""
+        logger.info("Getting all matrices used in datasets")
+        return self.dataset_repository.get_used_matrices(matrices)
 
-        variant_study_commands = [cmd for c in command_blocks for cmd in transform_to_command(c.to_dto(), c.study_id)]
-        matrices = {matrix for command in variant_study_commands for matrix in command.get_inner_matrices()}
-        return matrices
+    def _get_unused_matrices(self, saved_matrices: Set[str]) -> Set[str]:
+        """
+        Return the saved matrices which are not used in variant studies, datasets and raw studies.
 
-    def _get_datasets_matrices(self) -> Set[str]:
-        logger.info("Getting all matrices used in datasets")
-        datasets = self.dataset_repository.get_all_datasets()
-        return {matrix.matrix_id for dataset in datasets for matrix in dataset.matrices}
-
-    def _get_used_matrices(self) -> Set[str]:
-        """Return all matrices used in raw studies, variant studies and datasets"""
-        raw_studies_matrices = self._get_raw_studies_matrices()
-        variant_studies_matrices = self._get_variant_studies_matrices()
-        datasets_matrices = self._get_datasets_matrices()
-        return (
-            raw_studies_matrices
-            | variant_studies_matrices
-            | datasets_matrices
-            | set(self.matrix_constants.hashes.values())
-        )
+        The references stored in the database are checked first, so the managed workspace
+        is only scanned if some matrices are still candidates for deletion.
+        """
+        unused_matrices = saved_matrices - set(self.matrix_constants.hashes.values())
+        if unused_matrices:
+            unused_matrices = unused_matrices - self._get_variant_studies_matrices(unused_matrices)
+        if unused_matrices:
+            unused_matrices = unused_matrices - self._get_datasets_matrices(unused_matrices)
+        if unused_matrices:
+            unused_matrices = unused_matrices - self._get_raw_studies_matrices()
+        return unused_matrices
 
     def _delete_unused_saved_matrices(self, unused_matrices: Set[str]) -> None:
         """Delete all files with the name in unused_matrices"""
         logger.info("Deleting unused saved matrices:")
-        for unused_matrix_id in unused_matrices:
-            logger.info(f"Matrix {unused_matrix_id} is set to be deleted")
+        matrix_ids: List[str] = sorted(unused_matrices)
+        for start in range(0, len(matrix_ids), _DELETION_BATCH_SIZE):
+            batch = matrix_ids[start : start + _DELETION_BATCH_SIZE]
+            for unused_matrix_id in batch:
+                logger.info(f"Matrix {unused_matrix_id} is set to be deleted")
             if not self.dry_run:
-                logger.info(f"Deleting {unused_matrix_id}")
-                self.matrix_service.delete(unused_matrix_id)
+                logger.info(f"Deleting {len(batch)} matrices")
+                self.matrix_service.delete_many(batch)
 
     def _clean_matrices(self) -> None:
         """Delete all matrices that are not used anymore"""
         stopwatch = StopWatch()
         logger.info("Beginning of the cleaning process")
         saved_matrices = self._get_saved_matrices()
-        used_matrices = self._get_used_matrices()
-        unused_matrices = saved_matrices - used_matrices
+        unused_matrices = self._get_unused_matrices(saved_matrices)
         self._delete_unused_saved_matrices(unused_matrices=unused_matrices)
         stopwatch.log_elapsed(lambda x: logger.info(f"Finished cleaning matrices in {x}s"))
 
@@ -12,6 +12,7 @@
 
 import hashlib
 import logging
+import os
 import typing as t
 from pathlib import Path
 
@@ -22,10 +23,46 @@ from sqlalchemy import exists  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 
 from antarest.core.utils.fastapi_sqlalchemy import db
-from antarest.matrixstore.model import Matrix, MatrixContent, MatrixData, MatrixDataSet
+from antarest.core.utils.metrics import Histogram
+from antarest.matrixstore.model import Matrix, MatrixContent, MatrixData, MatrixDataSet, MatrixDataSetRelation
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of parameters in an `IN (...)` clause (SQLite is limited to 999 parameters).
+_IN_CHUNK_SIZE = 500
+
+# Above this number of matrices, listing the bucket directory is cheaper than checking each file.
+_SCAN_THRESHOLD = 64
+
+_MATRIX_GET_SECONDS = Histogram(
+    "antarest_matrix_content_get_seconds",
+    "Duration of the reading of a matrix from the matrix store (`MatrixContentRepository.get`)",
+)
+
+
+def scan_tsv_shape(path: Path) -> t.Tuple[int, int]:
+    """
+    Get the shape of a matrix stored in a TSV file (without header), without parsing its values.
+
+    The rows are the non-blank lines, and the columns are the fields of the first row,
+    ignoring the trailing empty fields.
+
+    Args:
+        path: Path of the TSV file.
+
+    Returns:
+        The number of rows and columns, `(0, 0)` if the file is empty.
+    """
+    nb_rows = nb_columns = 0
+    with open(path, mode="rb") as f:
+        for line in f:
+            line = line.rstrip()
+            if line:
+                if not nb_rows:
+                    nb_columns = line.count(b"\t") + 1
+                nb_rows += 1
+    return nb_rows, nb_columns
+
 
 class MatrixDataSetRepository:
     """
@@ -61,6 +98,25 @@ class MatrixDataSetRepository:
         matrix_datasets: t.List[MatrixDataSet] = self.session.query(MatrixDataSet).all()
         return matrix_datasets
 
+    def get_used_matrices(self, matrix_ids: t.Collection[str]) -> t.Set[str]:
+        """
+        Get the matrices belonging to at least one dataset.
+
+        Args:
+            matrix_ids: IDs of the matrices to check.
+
+        Returns:
+            The subset of the given matrix IDs which are used in datasets.
+        """
+        ids = list(set(matrix_ids))
+        used: t.Set[str] = set()
+        for start in range(0, len(ids), _IN_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CHUNK_SIZE]
+            q = self.session.query(MatrixDataSetRelation.matrix_id).distinct()
+            q = q.filter(MatrixDataSetRelation.matrix_id.in_(chunk))  # type: ignore
+            used.update(r[0] for r in q)
+        return used
+
     def query(
         self,
         name: t.Optional[str],
@@ -115,6 +171,16 @@ class MatrixRepository:
         logger.debug(f"Matrix {matrix.id} saved")
         return matrix
 
+    def save_many(self, matrices: t.Collection[Matrix]) -> None:
+        """
+        Saves several matrices with a single transaction, the matrices which already exist are left unchanged.
+        """
+        existing = self.exists_many([matrix.id for matrix in matrices])
+        new_matrices = {matrix.id: matrix for matrix in matrices if matrix.id not in existing}
+        self.session.add_all(new_matrices.values())
+        self.session.commit()
+        logger.debug(f"{len(new_matrices)} matrices saved")
+
     def get(self, matrix_hash: str) -> t.Optional[Matrix]:
         matrix: Matrix = self.session.query(Matrix).get(matrix_hash)
         return matrix
@@ -123,6 +189,20 @@ class MatrixRepository:
         res: bool = self.session.query(exists().where(Matrix.id == matrix_hash)).scalar()
         return res
 
+    def exists_many(self, matrix_hashes: t.Collection[str]) -> t.Set[str]:
+        """
+        Returns the subset of the given matrix hashes which exist in the database.
+
+        The hashes are checked with `IN (...)` queries, by chunks to stay
+        below the maximum number of SQL parameters.
+        """
+        hashes = list(set(matrix_hashes))
+        found: t.Set[str] = set()
+        for start in range(0, len(hashes), _IN_CHUNK_SIZE):
+            chunk = hashes[start : start + _IN_CHUNK_SIZE]
+            found.update(row[0] for row in self.session.query(Matrix.id).filter(Matrix.id.in_(chunk)))  # type: ignore
+        return found
+
     def delete(self, matrix_hash: str) -> None:
         if g := self.session.query(Matrix).get(matrix_hash):
             self.session.delete(g)
@@ -131,6 +211,18 @@ class MatrixRepository:
             logger.warning(f"Trying to delete matrix {matrix_hash}, but was not found in database!")
         logger.debug(f"Matrix {matrix_hash} deleted")
 
+    def delete_many(self, matrix_hashes: t.Collection[str]) -> None:
+        """
+        Deletes several matrices with a single transaction, missing matrices are ignored.
+        """
+        hashes = list(set(matrix_hashes))
+        for start in range(0, len(hashes), _IN_CHUNK_SIZE):
+            chunk = hashes[start : start + _IN_CHUNK_SIZE]
+            q = self.session.query(Matrix).filter(Matrix.id.in_(chunk))  # type: ignore
+            q.delete(synchronize_session=False)
+        self.session.commit()
+        logger.debug(f"{len(hashes)} matrices deleted")
+
 
 class MatrixContentRepository:
     """
@@ -149,6 +241,7 @@ class MatrixContentRepository:
         self.bucket_dir = bucket_dir
         self.bucket_dir.mkdir(parents=True, exist_ok=True)
 
+    @_MATRIX_GET_SECONDS.time()
     def get(self, matrix_hash: str) -> MatrixContent:
         """
         Retrieves the content of a matrix with a given SHA256 hash.
@@ -160,14 +253,50 @@ class MatrixContentRepository:
             The matrix content or `None` if the file is not found.
         """
 
-        matrix_file = self.bucket_dir.joinpath(f"{matrix_hash}.tsv")
-        matrix = np.loadtxt(matrix_file, delimiter="\t", dtype=np.float64, ndmin=2)
-        matrix = matrix.reshape((1, 0)) if matrix.size == 0 else matrix
+        matrix = self.get_array(matrix_hash)
         data = matrix.tolist()
         index = list(range(matrix.shape[0]))
         columns = list(range(matrix.shape[1]))
         return MatrixContent.construct(data=data, columns=columns, index=index)
 
+    def get_array(self, matrix_hash: str) -> npt.NDArray[np.float64]:
+        """
+        Retrieves the content of a matrix with a given SHA256 hash as a NumPy array.
+
+        Parameters:
+            matrix_hash: SHA256 hash
+
+        Returns:
+            The matrix content as a 2D array.
+        """
+        matrix = np.loadtxt(self.get_path(matrix_hash), delimiter="\t", dtype=np.float64, ndmin=2)
+        return matrix.reshape((1, 0)) if matrix.size == 0 else matrix
+
+    def get_shape(self, matrix_hash: str) -> t.Tuple[int, int]:
+        """
+        Retrieves the shape of a matrix with a given SHA256 hash, without parsing its values.
+
+        Parameters:
+            matrix_hash: SHA256 hash
+
+        Returns:
+            The number of rows and columns, `(1, 0)` for an empty matrix (like `get_array`).
+        """
+        shape = scan_tsv_shape(self.get_path(matrix_hash))
+        return shape if shape[1] else (1, 0)
+
+    def get_path(self, matrix_hash: str) -> Path:
+        """
+        Returns the path of the TSV file containing the content of a matrix with a given SHA256 hash.
+
+        Parameters:
+            matrix_hash: SHA256 hash
+
+        Returns:
+            The path of the TSV file, which may not exist.
+        """
+        return self.bucket_dir.joinpath(f"{matrix_hash}.tsv")
+
     def exists(self, matrix_hash: str) -> bool:
         """
         Checks if a matrix with a given SHA256 hash exists in the directory.
@@ -181,6 +310,26 @@ class MatrixContentRepository:
         matrix_file = self.bucket_dir.joinpath(f"{matrix_hash}.tsv")
         return matrix_file.exists()
 
+    def exists_many(self, matrix_hashes: t.Collection[str]) -> t.Set[str]:
+        """
+        Returns the subset of the given SHA256 hashes whose matrix exists in the directory.
+
+        For a large number of hashes, the bucket directory is listed once
+        instead of checking the existence of each file.
+
+        Parameters:
+            matrix_hashes: SHA256 hashes
+
+        Returns:
+            The hashes of the existing matrices.
+        """
+        hashes = set(matrix_hashes)
+        if len(hashes) <= _SCAN_THRESHOLD:
+            return {matrix_hash for matrix_hash in hashes if self.exists(matrix_hash)}
+        with os.scandir(self.bucket_dir) as entries:
+            stored = {entry.name[:-4] for entry in entries if entry.name.endswith(".tsv")}
+        return hashes & stored
+
     def save(self, content: t.Union[t.List[t.List[MatrixData]], npt.NDArray[np.float64]]) -> str:
         """
         Saves the content of a matrix as a TSV file in the bucket directory
@@ -11,16 +11,20 @@
 # This file is part of the Antares project.
 
 import contextlib
+import functools
 import io
 import logging
+import shutil
 import tempfile
 import typing as t
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import py7zr
 from fastapi import UploadFile
 from numpy import typing as npt
@@ -30,10 +34,9 @@ from antarest.core.filetransfer.model import FileDownloadTaskDTO
 from antarest.core.filetransfer.service import FileTransferManager
 from antarest.core.jwt import JWTUser
 from antarest.core.requests import RequestParameters, UserHasNotPermissionError
-from antarest.core.serialization import from_json
+from antarest.core.serialization import from_json, to_json_string
 from antarest.core.tasks.model import TaskResult, TaskType
 from antarest.core.tasks.service import ITaskNotifier, ITaskService
-from antarest.core.utils.archives import ArchiveFormat, archive_dir
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.core.utils.utils import StopWatch
 from antarest.login.service import LoginService
@@ -65,6 +68,45 @@ EXCLUDED_FILES = {
 
 logger = logging.getLogger(__name__)
 
+# Number of threads and batch size used to format the matrices of an exported dataset
+EXPORT_MAX_WORKERS = 4
+EXPORT_BATCH_SIZE = 64
+
+# Number of threads and batch size used to parse and save the matrices of an imported archive
+IMPORT_MAX_WORKERS = 4
+IMPORT_BATCH_SIZE = 64
+
+
+def _load_tsv(file: bytes) -> npt.NDArray[np.float64]:
+    # noinspection PyTypeChecker
+    matrix = np.loadtxt(io.BytesIO(file), delimiter="\t", dtype=np.float64, ndmin=2)
+    return matrix.reshape((1, 0)) if matrix.size == 0 else matrix
+
+
+def _parse_tsv(file: bytes) -> npt.NDArray[np.float64]:
+    """
+    Parses a matrix from a TSV file (without header) in bytes format.
+
+    The values are parsed with the C parser of pandas, using the same rounding
+    as `np.loadtxt`, so that the SHA256 hash of a matrix does not depend on the parser.
+    The pandas parser is more lenient than `np.loadtxt` (missing values are read as NaN),
+    so the files which can't be parsed or which contain NaN values are parsed with `np.loadtxt`:
+    malformed files (short rows, trailing tabs...) are rejected, and explicit "nan" values are accepted.
+    """
+    if not file.strip():
+        return np.empty((1, 0), dtype=np.float64)
+    try:
+        df = pd.read_csv(
+            io.BytesIO(file), sep="\t", header=None, comment="#", dtype=np.float64, float_precision="round_trip"
+        )
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError):
+        return _load_tsv(file)
+    matrix = df.to_numpy(dtype=np.float64)
+    if np.isnan(matrix).any():
+        return _load_tsv(file)
+    # The hash is computed from the array buffer, which must be in row-major order
+    return np.ascontiguousarray(matrix)
+
 
 class ISimpleMatrixService(ABC):
     def __init__(self, matrix_content_repository: MatrixContentRepository) -> None:
@@ -82,6 +124,32 @@ class ISimpleMatrixService(ABC):
     def exists(self, matrix_id: str) -> bool:
         raise NotImplementedError()
 
+    def exists_many(self, matrix_ids: t.Collection[str]) -> t.Set[str]:
+        """
+        Check the existence of several matrices at once.
+
+        Args:
+            matrix_ids: The IDs of the matrices to check.
+
+        Returns:
+            The IDs of the existing matrices.
+        """
+        return {matrix_id for matrix_id in set(matrix_ids) if self.exists(matrix_id)}
+
+    def get_shape(self, matrix_id: str) -> t.Optional[t.Tuple[int, int]]:
+        """
+        Get the shape of a matrix without loading its content.
+
+        Args:
+            matrix_id: The ID of the matrix.
+
+        Returns:
+            The number of rows and columns of the matrix, or `None` if the matrix is not found.
+        """
+        if not self.matrix_content_repository.exists(matrix_id):
+            return None
+        return self.matrix_content_repository.get_shape(matrix_id)
+
     @abstractmethod
     def delete(self, matrix_id: str) -> None:
         raise NotImplementedError()
@@ -129,6 +197,9 @@ class SimpleMatrixService(ISimpleMatrixService):
     def exists(self, matrix_id: str) -> bool:
         return self.matrix_content_repository.exists(matrix_id)
 
+    def exists_many(self, matrix_ids: t.Collection[str]) -> t.Set[str]:
+        return self.matrix_content_repository.exists_many(matrix_ids)
+
     def delete(self, matrix_id: str) -> None:
         self.matrix_content_repository.delete(matrix_id)
 
@@ -214,6 +285,9 @@ class MatrixService(ISimpleMatrixService):
         - `columns`: The list of column labels.
         - `data`: The matrix data as a nested list of floats.
 
+        The files of an archive are parsed and saved in a thread pool, while the archive
+        is read, and the matrix objects are inserted in the database with a single transaction.
+
         Args:
             file: The file to import (TSV, JSON or ZIP).
             is_json: Flag indicating if the file is JSON-encoded.
@@ -223,30 +297,141 @@ class MatrixService(ISimpleMatrixService):
         """
         with file.file as f:
             assert file.filename is not None
-            if file.content_type == "application/zip":
-                with contextlib.closing(f):
-                    buffer = io.BytesIO(f.read())
-                matrix_info: t.List[MatrixInfoDTO] = []
-                if file.filename.endswith("zip"):
-                    with zipfile.ZipFile(buffer) as zf:
-                        for info in zf.infolist():
-                            if info.is_dir() or info.filename in EXCLUDED_FILES:
-                                continue
-                            matrix_id = self._file_importation(zf.read(info.filename), is_json=is_json)
-                            matrix_info.append(MatrixInfoDTO(id=matrix_id, name=info.filename))
-                else:
-                    with py7zr.SevenZipFile(buffer, "r") as szf:
-                        for info in szf.list():
-                            if info.is_directory or info.filename in EXCLUDED_FILES:  # type:ignore
-                                continue
-                            file_content = next(iter(szf.read(info.filename).values()))
-                            matrix_id = self._file_importation(file_content.read(), is_json=is_json)
-                            matrix_info.append(MatrixInfoDTO(id=matrix_id, name=info.filename))
-                            szf.reset()
-                return matrix_info
+            return self._import_stream(f, file.filename, file.content_type, is_json=is_json, notifier=None)
+
+    def create_by_importation_task(self, file: UploadFile, is_json: bool, params: RequestParameters) -> str:
+        """
+        Imports a matrix or a collection of matrices (see `create_by_importation`) in a task,
+        so that the importation of large archives does not block the HTTP request.
+
+        The uploaded file is copied in the temporary directory, and the task reports
+        the progress of the importation. The list of `MatrixInfoDTO` objects is returned
+        as a JSON string in the result of the task.
+
+        Args:
+            file: The file to import (TSV, JSON or ZIP).
+            is_json: Flag indicating if the file is JSON-encoded.
+            params: Request parameters.
+
+        Returns:
+            The ID of the task importing the matrices.
+        """
+        if not params.user:
+            raise UserHasNotPermissionError()
+        assert file.filename is not None
+        filename = file.filename
+        content_type = file.content_type
+        with tempfile.NamedTemporaryFile(dir=self.config.storage.tmp_dir, delete=False) as dst:
+            tmp_path = Path(dst.name)
+
+        def import_task(notifier: ITaskNotifier) -> TaskResult:
+            try:
+                with tmp_path.open(mode="rb") as f:
+                    matrix_info = self._import_stream(f, filename, content_type, is_json=is_json, notifier=notifier)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            return TaskResult(
+                success=True,
+                message=f"{len(matrix_info)} matrices successfully imported from '{filename}'",
+                return_value=to_json_string([info.model_dump() for info in matrix_info]),
+            )
+
+        try:
+            with file.file as src, tmp_path.open(mode="wb") as fdst:
+                shutil.copyfileobj(src, fdst)
+            return self.task_service.add_task(
+                import_task,
+                f"Importing matrices from '{filename}'",
+                task_type=TaskType.MATRIX_IMPORT,
+                ref_id=None,
+                progress=0,
+                custom_event_messages=None,
+                request_params=params,
+            )
+        except BaseException:
+            # Once the task is registered, the temporary file is removed by the task
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _import_stream(
+        self,
+        f: t.BinaryIO,
+        filename: str,
+        content_type: t.Optional[str],
+        *,
+        is_json: bool,
+        notifier: t.Optional[ITaskNotifier],
+    ) -> t.List[MatrixInfoDTO]:
+        if content_type == "application/zip":
+            if filename.endswith("zip"):
+                # The uploaded file is seekable: members are decompressed one at a time
+                with zipfile.ZipFile(f) as zf:
+                    names = [
+                        info.filename
+                        for info in zf.infolist()
+                        if not info.is_dir() and info.filename not in EXCLUDED_FILES
+                    ]
+                    return self._import_files(names, zf.read, is_json=is_json, notifier=notifier)
             else:
-                matrix_id = self._file_importation(f.read(), is_json=is_json)
-                return [MatrixInfoDTO(id=matrix_id, name=file.filename)]
+                with py7zr.SevenZipFile(f, "r") as szf:
+                    names = [
+                        info.filename
+                        for info in szf.list()
+                        if not info.is_directory and info.filename not in EXCLUDED_FILES
+                    ]
+                    # Solid archives must be decompressed in a single pass: the members are extracted
+                    # on the disk, and then read by batches, like the members of a ZIP archive.
+                    with tempfile.TemporaryDirectory(dir=self.config.storage.tmp_dir) as tmp_dir:
+                        szf.extractall(path=tmp_dir)
+                        tmp_path = Path(tmp_dir)
+                        return self._import_files(
+                            names, lambda name: tmp_path.joinpath(name).read_bytes(), is_json=is_json, notifier=notifier
+                        )
+        else:
+            matrix_id = self._file_importation(f.read(), is_json=is_json)
+            return [MatrixInfoDTO(id=matrix_id, name=filename)]
+
+    def _import_files(
+        self,
+        names: t.Sequence[str],
+        read: t.Callable[[str], bytes],
+        *,
+        is_json: bool,
+        notifier: t.Optional[ITaskNotifier],
+    ) -> t.List[MatrixInfoDTO]:
+        stopwatch = StopWatch()
+        matrix_info: t.List[MatrixInfoDTO] = []
+        matrices: t.List[Matrix] = []
+        # Do not use the `timezone.utc` timezone to preserve a naive datetime.
+        created_at = datetime.utcnow()
+        save_content = functools.partial(self._save_content, is_json=is_json)
+        with ThreadPoolExecutor(max_workers=IMPORT_MAX_WORKERS, thread_name_prefix="matrix_import_") as pool:
+            # Files are read by batches to limit the memory used by pending contents.
+            for start in range(0, len(names), IMPORT_BATCH_SIZE):
+                batch = names[start : start + IMPORT_BATCH_SIZE]
+                for name, (matrix_id, shape) in zip(batch, pool.map(save_content, [read(name) for name in batch])):
+                    matrix_info.append(MatrixInfoDTO(id=matrix_id, name=name))
+                    matrices.append(Matrix(id=matrix_id, width=shape[1], height=shape[0], created_at=created_at))
+                if notifier is not None:
+                    notifier.notify_progress(len(matrix_info) * 100 // len(names))
+        with db():
+            self.repo.save_many(matrices)
+        stopwatch.log_elapsed(lambda x: logger.info(f"{len(matrices)} matrices imported in {x}s"))
+        return matrix_info
+
+    def _save_content(self, file: bytes, *, is_json: bool) -> t.Tuple[str, t.Tuple[int, ...]]:
+        """
+        Parses a matrix from a TSV or JSON file in bytes format and saves it in the content repository.
+
+        Returns:
+            The SHA256 hash and the shape of the matrix.
+        """
+        if is_json:
+            obj = from_json(file)
+            matrix = np.array(MatrixContent(**obj).data, dtype=np.float64)
+        else:
+            matrix = _parse_tsv(file)
+        return self.matrix_content_repository.save(matrix), matrix.shape
 
     def _file_importation(self, file: bytes, *, is_json: bool = False) -> str:
         """
@@ -263,10 +448,7 @@ class MatrixService(ISimpleMatrixService):
             obj = from_json(file)
             content = MatrixContent(**obj)
             return self.create(content.data)
-        # noinspection PyTypeChecker
-        matrix = np.loadtxt(io.BytesIO(file), delimiter="\t", dtype=np.float64, ndmin=2)
-        matrix = matrix.reshape((1, 0)) if matrix.size == 0 else matrix
-        return self.create(matrix)
+        return self.create(_parse_tsv(file))
 
     def get_dataset(
         self,
@@ -397,6 +579,23 @@ class MatrixService(ISimpleMatrixService):
             data=content.data,
         )
 
+    def get_shape(self, matrix_id: str) -> t.Optional[t.Tuple[int, int]]:
+        """
+        Get the shape of a matrix from the metadata stored in the database, without reading its content.
+
+        Parameters:
+            matrix_id: The SHA256 hash of the matrix object to search for.
+
+        Returns:
+            The number of rows and columns of the matrix, or `None` if the matrix is not found in the database.
+        """
+        matrix = self.repo.get(matrix_id)
+        if matrix is None:
+            return None
+        if matrix.height is None or matrix.width is None:
+            return self.matrix_content_repository.get_shape(matrix_id)
+        return matrix.height, matrix.width
+
     def exists(self, matrix_id: str) -> bool:
         """
         Check if a matrix object exists in both the matrix content repository and the database.
@@ -409,6 +608,19 @@ class MatrixService(ISimpleMatrixService):
         """
         return self.matrix_content_repository.exists(matrix_id) and self.repo.exists(matrix_id)
 
+    def exists_many(self, matrix_ids: t.Collection[str]) -> t.Set[str]:
+        """
+        Check the existence of several matrix objects with a single lookup in each repository.
+
+        Parameters:
+            matrix_ids: The SHA256 hashes of the matrix objects to check for existence.
+
+        Returns:
+            The hashes of the matrix objects which exist in both repositories.
+        """
+        existing = self.matrix_content_repository.exists_many(matrix_ids)
+        return self.repo.exists_many(existing) if existing else set()
+
     def delete(self, matrix_id: str) -> None:
         """
         Delete a matrix object from the matrix content repository and the database.
@@ -430,6 +642,20 @@ class MatrixService(ISimpleMatrixService):
             with contextlib.suppress(FileNotFoundError):
                 self.matrix_content_repository.delete(matrix_id)
 
+    def delete_many(self, matrix_ids: t.Collection[str]) -> None:
+        """
+        Delete several matrix objects from the database, with a single transaction,
+        and from the matrix content repository.
+
+        Parameters:
+            matrix_ids: The SHA256 hashes of the matrix objects to delete.
+        """
+        with db():
+            self.repo.delete_many(matrix_ids)
+        for matrix_id in matrix_ids:
+            with contextlib.suppress(FileNotFoundError):
+                self.matrix_content_repository.delete(matrix_id)
+
     @staticmethod
     def check_access_permission(
         dataset: MatrixDataSet,
@@ -449,27 +675,54 @@ class MatrixService(ISimpleMatrixService):
             raise UserHasNotPermissionError()
         return access
 
-    def create_matrix_files(self, matrix_ids: t.Sequence[str], export_path: Path) -> str:
-        with tempfile.TemporaryDirectory(dir=self.config.storage.tmp_dir) as tmpdir:
-            stopwatch = StopWatch()
-            for mid in matrix_ids:
-                mtx = self.get(mid)
-                if not mtx:
-                    continue
-                name = f"matrix-{mtx.id}.txt"
-                filepath = Path(tmpdir).joinpath(name)
-                array = np.array(mtx.data, dtype=np.float64)
-                if array.size == 0:
-                    # If the array or dataframe is empty, create an empty file instead of
-                    # traditional saving to avoid unwanted line breaks.
-                    filepath.touch()
-                else:
-                    # noinspection PyTypeChecker
-                    np.savetxt(filepath, array, delimiter="\t", fmt="%.18f")
-            archive_dir(Path(tmpdir), export_path, archive_format=ArchiveFormat.ZIP)
-            stopwatch.log_elapsed(lambda x: logger.info(f"Matrix dataset exported (zipped mode) in {x}s"))
+    def create_matrix_files(
+        self,
+        matrix_ids: t.Sequence[str],
+        export_path: Path,
+        precision: t.Optional[int] = None,
+    ) -> str:
+        """
+        Export matrices to a ZIP archive, with one TSV file per matrix.
+
+        The entries are written directly into the archive, without intermediate files.
+        If no precision is given, the TSV files of the matrix store are copied as they are.
+        Otherwise, the matrices are formatted in a thread pool while the archive is written.
+
+        Args:
+            matrix_ids: The SHA256 hashes of the matrices to export (unknown matrices are ignored).
+            export_path: Path of the ZIP archive to create.
+            precision: Number of decimals of the exported values.
+
+        Returns:
+            The path of the ZIP archive.
+        """
+        stopwatch = StopWatch()
+        existing = self.exists_many(matrix_ids)
+        exported_ids = [matrix_id for matrix_id in dict.fromkeys(matrix_ids) if matrix_id in existing]
+        with zipfile.ZipFile(export_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=2) as zf:
+            if precision is None:
+                for matrix_id in exported_ids:
+                    zf.write(self.matrix_content_repository.get_path(matrix_id), f"matrix-{matrix_id}.txt")
+            else:
+                float_format = f"%.{precision}f"
+                with ThreadPoolExecutor(max_workers=EXPORT_MAX_WORKERS, thread_name_prefix="matrix_export_") as pool:
+                    # Matrices are formatted by batches to limit the memory used by pending entries.
+                    for start in range(0, len(exported_ids), EXPORT_BATCH_SIZE):
+                        batch = exported_ids[start : start + EXPORT_BATCH_SIZE]
+                        contents = pool.map(functools.partial(self._format_matrix, float_format=float_format), batch)
+                        for matrix_id, content in zip(batch, contents):
+                            zf.writestr(f"matrix-{matrix_id}.txt", content)
+        stopwatch.log_elapsed(lambda x: logger.info(f"Matrix dataset exported (zipped mode) in {x}s"))
         return str(export_path)
 
+    def _format_matrix(self, matrix_id: str, float_format: str) -> bytes:
+        array = self.matrix_content_repository.get_array(matrix_id)
+        if array.size == 0:
+            # Empty matrices are exported as empty files, to avoid unwanted line breaks.
+            return b""
+        csv = pd.DataFrame(array).to_csv(None, sep="\t", header=False, index=False, float_format=float_format)
+        return csv.encode("utf-8")
+
     def download_dataset(
         self,
         dataset_id: str,
@@ -512,7 +765,11 @@ class MatrixService(ISimpleMatrixService):
 
         def export_task(notifier: ITaskNotifier) -> TaskResult:
             try:
-                self.create_matrix_files(matrix_ids=matrix_list, export_path=export_path)
+                self.create_matrix_files(
+                    matrix_ids=matrix_list,
+                    export_path=export_path,
+                    precision=self.config.storage.matrix_export_precision,
+                )
                 self.file_transfer_manager.set_ready(export_id)
                 return TaskResult(
                     success=True,
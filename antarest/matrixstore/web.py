@@ -12,7 +12,7 @@
 
 import logging
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 from fastapi import APIRouter, Body, Depends, File, UploadFile
 from starlette.responses import FileResponse
@@ -57,16 +57,24 @@ def create_matrix_api(service: MatrixService, ftm: FileTransferManager, config:
     @bp.post(
         "/matrix/_import",
         tags=[APITag.matrix],
-        description="Import a new matrix or zip matrices",
-        response_model=List[MatrixInfoDTO],
+        description=(
+            "Import a new matrix or zip matrices."
+            " If `use_task` is true, the matrices are imported in a task, and the task ID is returned:"
+            " the list of imported matrices is then the JSON return value of the task."
+        ),
+        response_model=Union[List[MatrixInfoDTO], str],
     )
     def create_by_importation(
         json: bool = False,
+        use_task: bool = False,
         file: UploadFile = File(...),
         current_user: JWTUser = Depends(auth.get_current_user),
     ) -> Any:
         logger.info("Importing new matrix dataset", extra={"user": current_user.id})
         if current_user.id is not None:
+            if use_task:
+                params = RequestParameters(user=current_user)
+                return service.create_by_importation_task(file, is_json=json, params=params)
             return service.create_by_importation(file, is_json=json)
         raise UserHasNotPermissionError()
 
@@ -18,6 +18,7 @@ from pydantic import field_validator
 
 from antarest.core.exceptions import DuplicateRenewableCluster, RenewableClusterConfigNotFound, RenewableClusterNotFound
 from antarest.core.model import JSON
+from antarest.core.serialization import validate_many
 from antarest.study.business.all_optional_meta import all_optional_model, camel_case_model
 from antarest.study.business.enum_ignore_case import EnumIgnoreCase
 from antarest.study.business.utils import execute_or_add_commands
@@ -28,6 +29,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.renewable import (
     RenewableConfigType,
     RenewableProperties,
     create_renewable_config,
+    get_renewable_config_cls,
 )
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.storage_service import StudyStorageService
@@ -119,6 +121,26 @@ def create_renewable_output(
     return RenewableClusterOutput(**kwargs)
 
 
+def create_renewable_outputs(
+    study_version: str,
+    configs: t.Mapping[str, t.Mapping[str, t.Any]],
+) -> t.Dict[str, "RenewableClusterOutput"]:
+    """
+    Create the outputs of several renewable clusters at once (bulk version of `create_renewable_output`).
+
+    Args:
+        study_version: The version of the study.
+        configs: The configurations of the clusters, indexed by cluster ID.
+
+    Returns:
+        The outputs of the clusters, indexed by cluster ID.
+    """
+    config_cls = get_renewable_config_cls(StudyVersion.parse(study_version))
+    objs = validate_many(config_cls, [{**config, "id": cluster_id} for cluster_id, config in configs.items()])
+    outputs = validate_many(RenewableClusterOutput, [obj.model_dump(by_alias=False) for obj in objs])
+    return dict(zip(configs, outputs))
+
+
 class RenewableManager:
     """
     A manager class responsible for handling operations related to renewable clusters within a study.
@@ -186,8 +208,8 @@ class RenewableManager:
         renewables_by_areas: t.MutableMapping[str, t.MutableMapping[str, RenewableClusterOutput]]
         renewables_by_areas = collections.defaultdict(dict)
         for area_id, cluster_obj in clusters.items():
-            for cluster_id, cluster in cluster_obj.items():
-                renewables_by_areas[area_id][cluster_id] = create_renewable_output(study.version, cluster_id, cluster)
+            if cluster_obj:
+                renewables_by_areas[area_id] = create_renewable_outputs(study.version, cluster_obj)
 
         return renewables_by_areas
 
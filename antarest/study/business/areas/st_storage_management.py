@@ -29,7 +29,7 @@ from antarest.core.exceptions import (
 )
 from antarest.core.model import JSON
 from antarest.core.requests import CaseInsensitiveDict
-from antarest.core.serialization import AntaresBaseModel
+from antarest.core.serialization import AntaresBaseModel, validate_many
 from antarest.study.business.all_optional_meta import all_optional_model, camel_case_model
 from antarest.study.business.utils import execute_or_add_commands
 from antarest.study.model import STUDY_VERSION_8_8, Study
@@ -40,6 +40,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.st_storage import (
     STStorageConfigType,
     STStorageGroup,
     create_st_storage_config,
+    get_st_storage_config_cls,
 )
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.storage_service import StudyStorageService
@@ -250,6 +251,26 @@ def create_storage_output(
     return STStorageOutput(**kwargs)
 
 
+def create_storage_outputs(
+    study_version: StudyVersion,
+    configs: t.Mapping[str, t.Mapping[str, t.Any]],
+) -> t.Dict[str, "STStorageOutput"]:
+    """
+    Create the outputs of several short-term storages at once (bulk version of `create_storage_output`).
+
+    Args:
+        study_version: The version of the study.
+        configs: The configurations of the storages, indexed by storage ID.
+
+    Returns:
+        The outputs of the storages, indexed by storage ID.
+    """
+    config_cls = get_st_storage_config_cls(study_version)
+    objs = validate_many(config_cls, [{**config, "id": cluster_id} for cluster_id, config in configs.items()])
+    outputs = validate_many(STStorageOutput, [obj.model_dump(mode="json", by_alias=False) for obj in objs])
+    return dict(zip(configs, outputs))
+
+
 class STStorageManager:
     """
     Manage short-term storage configuration in a study
@@ -373,8 +394,8 @@ class STStorageManager:
         storages_by_areas: t.MutableMapping[str, t.MutableMapping[str, STStorageOutput]]
         storages_by_areas = collections.defaultdict(dict)
         for area_id, cluster_obj in storages.items():
-            for cluster_id, cluster in cluster_obj.items():
-                storages_by_areas[area_id][cluster_id] = create_storage_output(study_version, cluster_id, cluster)
+            if cluster_obj:
+                storages_by_areas[area_id] = create_storage_outputs(study_version, cluster_obj)
 
         return storages_by_areas
 
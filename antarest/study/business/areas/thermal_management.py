@@ -25,6 +25,7 @@ from antarest.core.exceptions import (
     WrongMatrixHeightError,
 )
 from antarest.core.model import JSON
+from antarest.core.serialization import validate_many
 from antarest.study.business.all_optional_meta import all_optional_model, camel_case_model
 from antarest.study.business.utils import execute_or_add_commands
 from antarest.study.model import STUDY_VERSION_8_7, Study
@@ -34,8 +35,10 @@ from antarest.study.storage.rawstudy.model.filesystem.config.thermal import (
     Thermal870Properties,
     ThermalConfigType,
     create_thermal_config,
+    get_thermal_config_cls,
 )
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
 from antarest.study.storage.storage_service import StudyStorageService
 from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
 from antarest.study.storage.variantstudy.model.command.remove_cluster import RemoveCluster
@@ -128,6 +131,26 @@ def create_thermal_output(
     return ThermalClusterOutput(**kwargs)
 
 
+def create_thermal_outputs(
+    study_version: StudyVersion,
+    configs: t.Mapping[str, t.Mapping[str, t.Any]],
+) -> t.Dict[str, "ThermalClusterOutput"]:
+    """
+    Create the outputs of several thermal clusters at once (bulk version of `create_thermal_output`).
+
+    Args:
+        study_version: The version of the study.
+        configs: The configurations of the clusters, indexed by cluster ID.
+
+    Returns:
+        The outputs of the clusters, indexed by cluster ID.
+    """
+    config_cls = get_thermal_config_cls(study_version)
+    objs = validate_many(config_cls, [{**config, "id": cluster_id} for cluster_id, config in configs.items()])
+    outputs = validate_many(ThermalClusterOutput, [obj.model_dump(mode="json", by_alias=False) for obj in objs])
+    return dict(zip(configs, outputs))
+
+
 class ThermalManager:
     """
     Manager class implementing endpoints related to Thermal Clusters within a study.
@@ -235,8 +258,8 @@ class ThermalManager:
         thermals_by_areas: t.MutableMapping[str, t.MutableMapping[str, ThermalClusterOutput]]
         thermals_by_areas = collections.defaultdict(dict)
         for area_id, cluster_obj in clusters.items():
-            for cluster_id, cluster in cluster_obj.items():
-                thermals_by_areas[area_id][cluster_id] = create_thermal_output(study_version, cluster_id, cluster)
+            if cluster_obj:
+                thermals_by_areas[area_id] = create_thermal_outputs(study_version, cluster_obj)
 
         return thermals_by_areas
 
@@ -486,17 +509,18 @@ class ThermalManager:
             series_path.append(thermal_cluster_path / "CO2Cost")
             series_path.append(thermal_cluster_path / "fuelCost")
 
+        file_study = self._get_file_study(study)
         ts_widths: t.MutableMapping[int, t.MutableSequence[str]] = {}
         for ts_path in series_path:
-            matrix = self.storage_service.get_storage(study).get(study, ts_path.as_posix())
-            matrix_data = matrix["data"]
-            matrix_height = len(matrix_data)
+            # Only the shape of the matrix is needed, its values are not parsed.
+            node = file_study.tree.get_node(list(ts_path.parts))
+            assert isinstance(node, InputSeriesMatrix)
+            matrix_height, matrix_width = node.get_shape()
             # We ignore empty matrices as there are default matrices for the simulator.
-            if matrix_data != [[]] and matrix_height != 8760:
+            if matrix_width and matrix_height != 8760:
                 raise WrongMatrixHeightError(
                     f"The matrix {ts_path.name} should have 8760 rows, currently: {matrix_height}"
                 )
-            matrix_width = len(matrix_data[0])
             if matrix_width > 1:
                 ts_widths.setdefault(matrix_width, []).append(ts_path.name)
 
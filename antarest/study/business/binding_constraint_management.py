@@ -46,6 +46,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.binding_constraint
 )
 from antarest.study.storage.rawstudy.model.filesystem.config.model import transform_name_to_id
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
+from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
 from antarest.study.storage.storage_service import StudyStorageService
 from antarest.study.storage.variantstudy.business.matrix_constants.binding_constraint.series_after_v87 import (
     default_bc_hourly as default_bc_hourly_87,
@@ -377,19 +378,19 @@ def _get_references_by_widths(
         for matrix_name in matrices_name:
             matrix_id = matrix_name.format(bc_id=bc.id)
             logger.info(f"⏲ Validating BC '{bc.id}': {matrix_id=} [{_index+1}/{_total}]")
-            obj = file_study.tree.get(url=["input", "bindingconstraints", matrix_id])
-            matrix = np.array(obj["data"], dtype=float)
+            # Only the shape of the matrix is needed, its values are not parsed.
+            node = file_study.tree.get_node(url=["input", "bindingconstraints", matrix_id])
+            assert isinstance(node, InputSeriesMatrix)
+            matrix_height, matrix_width = node.get_shape()
             # We ignore empty matrices as there are default matrices for the simulator.
-            if not matrix.size:
+            if not matrix_height * matrix_width:
                 continue
 
-            matrix_height = matrix.shape[0]
             expected_height = EXPECTED_MATRIX_SHAPES[bc.time_step][0]  # type: ignore
             if matrix_height != expected_height:
                 raise WrongMatrixHeightError(
                     f"The binding constraint '{bc.name}' should have {expected_height} rows, currently: {matrix_height}"
                 )
-            matrix_width = matrix.shape[1]
             if matrix_width > 1:
                 references_by_width.setdefault(matrix_width, []).append((bc.id, matrix_id))
 
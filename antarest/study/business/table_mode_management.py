@@ -11,10 +11,9 @@
 # This file is part of the Antares project.
 
 import collections
+import math
 import typing as t
 
-import numpy as np
-import pandas as pd
 from antares.study.version import StudyVersion
 
 from antarest.core.exceptions import ChildNotFoundError
@@ -34,6 +33,34 @@ _CellValue = t.Any  # cell value (str, int, float, bool, enum, etc.)
 TableDataDTO = t.Mapping[_TableIndex, t.Mapping[_TableColumn, _CellValue]]
 
 
+def _project_table(data: TableDataDTO, columns: t.Sequence[_TableColumn]) -> TableDataDTO:
+    """
+    Select the listed columns of the table (all the columns if empty) and drop the columns without any value.
+
+    According to the study version, some properties may not be present, so these columns are dropped.
+    Missing or NaN cells are replaced by `None`, because NaN is not JSON-serializable.
+    """
+    if columns:
+        selected = list(dict.fromkeys(columns))
+    else:
+        selected = list(dict.fromkeys(column for row in data.values() for column in row))
+    table = {index: {column: row.get(column) for column in selected} for index, row in data.items()}
+    kept = []
+    for column in selected:
+        has_value = False
+        for row in table.values():
+            cell = row[column]
+            if isinstance(cell, float) and math.isnan(cell):
+                row[column] = None
+            elif cell is not None:
+                has_value = True
+        if has_value:
+            kept.append(column)
+    if len(kept) < len(selected):
+        table = {index: {column: row[column] for column in kept} for index, row in table.items()}
+    return table
+
+
 class TableModeType(EnumIgnoreCase):
     """
     Table types.
@@ -160,19 +187,7 @@ class TableModeManager:
             # It's better to return an empty table than raising an 404 error
             return {}
 
-        df = pd.DataFrame.from_dict(data, orient="index")  # type: ignore
-        if columns:
-            # Create a new dataframe with the listed columns.
-            df = pd.DataFrame(df, columns=columns)  # type: ignore
-
-        # According to the study version, some properties may not be present,
-        # so we need to drop columns that are all NaN.
-        df = df.dropna(axis=1, how="all")
-
-        # Convert NaN to `None` because it is not JSON-serializable
-        df.replace(np.nan, None, inplace=True)
-
-        return t.cast(TableDataDTO, df.to_dict(orient="index"))
+        return _project_table(data, columns)
 
     def update_table_data(
         self,
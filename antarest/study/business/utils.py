@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import itertools
 import typing as t
 
 from antares.study.version import StudyVersion
@@ -25,6 +26,7 @@ from antarest.study.storage.storage_service import StudyStorageService
 from antarest.study.storage.utils import is_managed
 from antarest.study.storage.variantstudy.business.utils import transform_command_to_dto
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 
 # noinspection SpellCheckingInspection
@@ -39,12 +41,20 @@ def execute_or_add_commands(
     listener: t.Optional[ICommandListener] = None,
 ) -> None:
     if isinstance(study, RawStudy):
-        executed_commands: t.MutableSequence[ICommand] = []
-        for command in commands:
-            result = command.apply(file_study, listener)
-            if not result.status:
-                raise CommandApplicationError(result.message)
-            executed_commands.append(command)
+        # Consecutive `UpdateConfig` commands are applied at once,
+        # so that each INI file is written only once (e.g.: table mode updates).
+        for is_update_config, group in itertools.groupby(commands, key=lambda c: isinstance(c, UpdateConfig)):
+            grouped_commands = list(group)
+            if is_update_config and len(grouped_commands) > 1:
+                update_commands = t.cast(t.List[UpdateConfig], grouped_commands)
+                result = UpdateConfig.apply_batch(update_commands, file_study, listener)
+                if not result.status:
+                    raise CommandApplicationError(result.message)
+            else:
+                for command in grouped_commands:
+                    result = command.apply(file_study, listener)
+                    if not result.status:
+                        raise CommandApplicationError(result.message)
         storage_service.variant_study_service.invalidate_cache(study)
         if not is_managed(study):
             # In a previous version, de-normalization was performed asynchronously.
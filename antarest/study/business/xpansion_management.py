@@ -29,7 +29,7 @@ from antarest.study.business.enum_ignore_case import EnumIgnoreCase
 from antarest.study.model import Study
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.storage_service import StudyStorageService
-from antarest.study.storage.utils import fix_study_root
+from antarest.study.storage.utils import fix_study_root, remove_from_cache
 
 logger = logging.getLogger(__name__)
 
@@ -314,6 +314,13 @@ class XpansionManager:
     def __init__(self, study_storage_service: StudyStorageService):
         self.study_storage_service = study_storage_service
 
+    def _invalidate_cache(self, study: Study) -> None:
+        """
+        Invalidate the cache of the study (and renew its revision),
+        because the xpansion configuration is written directly, without using variant commands.
+        """
+        remove_from_cache(self.study_storage_service.raw_study_service.cache, study.id)
+
     def create_xpansion_configuration(self, study: Study, zipped_config: t.Optional[UploadFile] = None) -> None:
         logger.info(f"Initiating xpansion configuration for study '{study.id}'")
         file_study = self.study_storage_service.get_storage(study).get_raw(study)
@@ -327,6 +334,7 @@ class XpansionManager:
                         logger.info(f"Importing zipped xpansion configuration for study '{study.id}'")
                         zip_output.extractall(path=file_study.config.path / "user" / "expansion")
                         fix_study_root(file_study.config.path / "user" / "expansion")
+                    self._invalidate_cache(study)
                     return
                 except zipfile.BadZipFile:
                     shutil.rmtree(
@@ -360,11 +368,13 @@ class XpansionManager:
             }
 
             file_study.tree.save(xpansion_configuration_data)
+            self._invalidate_cache(study)
 
     def delete_xpansion_configuration(self, study: Study) -> None:
         logger.info(f"Deleting xpansion configuration for study '{study.id}'")
         file_study = self.study_storage_service.get_storage(study).get_raw(study)
         file_study.tree.delete(["user", "expansion"])
+        self._invalidate_cache(study)
 
     def get_xpansion_settings(self, study: Study) -> GetXpansionSettings:
         logger.info(f"Getting xpansion settings for study '{study.id}'")
@@ -411,6 +421,7 @@ class XpansionManager:
             sensitivity_obj = new_xpansion_settings.sensitivity_config.model_dump(mode="json", by_alias=True)
             file_study.tree.save(sensitivity_obj, ["user", "expansion", "sensitivity", "sensitivity_in"])
 
+        self._invalidate_cache(study)
         return self.get_xpansion_settings(study)
 
     @staticmethod
@@ -551,6 +562,7 @@ class XpansionManager:
         candidates_obj[next_id] = xpansion_candidate.model_dump(mode="json", by_alias=True, exclude_none=True)
         candidates_data = {"user": {"expansion": {"candidates": candidates_obj}}}
         file_study.tree.save(candidates_data)
+        self._invalidate_cache(study)
         # Should we add a field in the study config containing the xpansion candidates like the links or the areas ?
         return self.get_candidate(study, xpansion_candidate.name)
 
@@ -593,6 +605,7 @@ class XpansionManager:
                     mode="json", by_alias=True, exclude_none=True
                 )
                 file_study.tree.save(candidates, ["user", "expansion", "candidates"])
+                self._invalidate_cache(study)
                 return
         raise CandidateNotFoundError(f"The candidate '{xpansion_candidate_dto.name}' does not exist")
 
@@ -606,6 +619,7 @@ class XpansionManager:
 
         logger.info(f"Deleting candidate '{candidate_name}' from study '{study.id}'")
         file_study.tree.delete(["user", "expansion", "candidates", candidate_id])
+        self._invalidate_cache(study)
 
     def update_xpansion_constraints_settings(self, study: Study, constraints_file_name: str) -> GetXpansionSettings:
         # Make sure filename is not `None`, because `None` values are ignored by the update.
@@ -667,6 +681,7 @@ class XpansionManager:
         logger.info(f"Adding xpansion {resource_type} resource file list to study '{study.id}'")
         file_study = self.study_storage_service.get_storage(study).get_raw(study)
         self._add_raw_files(file_study, files, resource_type)
+        self._invalidate_cache(study)
 
     def delete_resource(
         self,
@@ -693,6 +708,7 @@ class XpansionManager:
                 f"The weight file '{filename}' is still used in the xpansion settings and cannot be deleted"
             )
         file_study.tree.delete(self._raw_file_dir(resource_type) + [filename])
+        self._invalidate_cache(study)
 
     def get_resource_content(
         self,
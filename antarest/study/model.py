@@ -221,7 +221,7 @@ class Study(Base):  # type: ignore
     author = Column(String(255))
     created_at = Column(DateTime, index=True)
     updated_at = Column(DateTime, index=True)
-    last_access = Column(DateTime)
+    last_access = Column(DateTime, index=True)
     path = Column(String())
     folder = Column(String, nullable=True, index=True)
     parent_id = Column(String(36), ForeignKey("study.id", name="fk_study_study_id"), index=True)
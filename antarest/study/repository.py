@@ -392,6 +392,40 @@ class StudyMetadataRepository:
         studies: t.Sequence[RawStudy] = query.all()
         return studies
 
+    def get_archiving_candidates(
+        self, old_date: datetime.datetime, limit: t.Optional[int] = None
+    ) -> t.List[t.Tuple[str, bool]]:
+        """
+        Get the managed studies which have not been accessed (or updated) since the given date,
+        and which can be archived: non-archived raw studies, and variant studies (for their outputs).
+
+        The filtering is done by the database, without loading the studies.
+
+        Args:
+            old_date: studies accessed (or updated, if never accessed) before this date are candidates.
+            limit: maximum number of candidates to return.
+
+        Returns:
+            List of study IDs and boolean indicating if it's a raw study (True) or a variant (False).
+        """
+        is_variant = Study.type == "variantstudy"
+        # `last_access` and `updated_at` are compared separately so that their indexes can be used
+        is_old = or_(
+            Study.last_access < old_date,
+            and_(Study.last_access.is_(None), Study.updated_at < old_date),
+        )
+        # noinspection PyTypeChecker
+        q = (
+            self.session.query(Study.id, Study.type)
+            .outerjoin(RawStudy.__table__, RawStudy.__table__.c.id == Study.id)
+            .filter(or_(is_variant, RawStudy.__table__.c.workspace == DEFAULT_WORKSPACE_NAME))
+            .filter(or_(is_variant, Study.archived.isnot(True)))
+            .filter(is_old)
+        )
+        if limit is not None:
+            q = q.limit(limit)
+        return [(study_id, study_type == "rawstudy") for study_id, study_type in q]
+
     def delete(self, id_: str, *ids: str) -> None:
         ids = (id_,) + ids
         session = self.session
@@ -14,6 +14,7 @@ import base64
 import collections
 import contextlib
 import csv
+import hashlib
 import http
 import io
 import logging
@@ -139,6 +140,7 @@ from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixFrequency
 from antarest.study.storage.rawstudy.model.filesystem.matrix.output_series_matrix import OutputSeriesMatrix
 from antarest.study.storage.rawstudy.model.filesystem.raw_file_node import RawFileNode
+from antarest.study.storage.rawstudy.model.filesystem.root.filestudytree import FileStudyTree
 from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
 from antarest.study.storage.storage_service import StudyStorageService
 from antarest.study.storage.study_download_utils import StudyDownloader, get_output_variables_information
@@ -146,6 +148,7 @@ from antarest.study.storage.study_upgrader import StudyUpgrader, check_versions_
 from antarest.study.storage.utils import (
     assert_permission,
     get_start_date,
+    get_study_revision,
     is_managed,
     is_output_archived,
     remove_from_cache,
@@ -305,7 +308,7 @@ class StudyUpgraderTask:
         """Run the task (lock the database)."""
         study_id: str = self._study_id
         target_version: str = self._target_version
-        is_study_denormalized = False
+        denormalized_paths: t.List[str] = []
         with db():
             # TODO We want to verify that a study doesn't have children and if it does do we upgrade all of them ?
             study_to_upgrade = self.repository.one(study_id)
@@ -318,10 +321,11 @@ class StudyUpgraderTask:
                     study_path = Path(study_to_upgrade.path)
                     study_upgrader = StudyUpgrader(study_path, target_version)
                     if is_managed(study_to_upgrade) and study_upgrader.should_denormalize_study():
-                        # We have to denormalize the study because the upgrade impacts study matrices
+                        # We have to denormalize the matrices impacted by the upgrade (and only them)
                         file_study = self.storage_service.get_storage(study_to_upgrade).get_raw(study_to_upgrade)
-                        file_study.tree.denormalize()
-                        is_study_denormalized = True
+                        denormalized_paths = study_upgrader.get_paths_to_denormalize()
+                        for node in self._get_nodes(file_study.tree, denormalized_paths):
+                            node.denormalize()
                     study_upgrader.upgrade()
                 remove_from_cache(self.cache_service, study_to_upgrade.id)
                 study_to_upgrade.version = target_version
@@ -334,9 +338,21 @@ class StudyUpgraderTask:
                     )
                 )
             finally:
-                if is_study_denormalized:
+                if denormalized_paths:
                     file_study = self.storage_service.get_storage(study_to_upgrade).get_raw(study_to_upgrade)
-                    file_study.tree.normalize()
+                    for node in self._get_nodes(file_study.tree, denormalized_paths):
+                        node.normalize()
+
+    @staticmethod
+    def _get_nodes(tree: FileStudyTree, paths: t.Sequence[str]) -> t.List[INode[JSON, SUB_JSON, JSON]]:
+        """Get the nodes of the study tree matching the given paths, ignoring the missing ones."""
+        nodes = []
+        for path in paths:
+            try:
+                nodes.append(tree.get_node(path.split("/")))
+            except ChildNotFoundError:
+                logger.info(f"No '{path}' node in the study tree, nothing to (de)normalize")
+        return nodes
 
     def run_task(self, notifier: ITaskNotifier) -> TaskResult:
         """
@@ -451,6 +467,40 @@ class StudyService:
 
         return self.storage_service.get_storage(study).get(study, url, depth, formatted)
 
+    def get_etag(
+        self,
+        uuid: str,
+        url: str,
+        depth: int,
+        formatted: bool,
+        params: RequestParameters,
+    ) -> t.Optional[str]:
+        """
+        Get the strong `ETag` of the study data returned by `get`, without reading the study files.
+
+        The `ETag` is derived from the current revision of the study data (renewed each time
+        the study is modified) and from the request parameters.
+
+        Args:
+            uuid: study uuid
+            url: route to follow inside study structure
+            depth: depth to expand tree when route matched
+            formatted: indicate if raw files must be parsed and formatted
+            params: request parameters
+
+        Returns:
+            The quoted `ETag`, or `None` if the study is not managed: the files of a study
+            stored in an external workspace can be modified outside the application.
+        """
+        study = self.get_study(uuid)
+        assert_permission(params.user, study, StudyPermissionType.READ)
+        if not is_managed(study):
+            return None
+        revision = get_study_revision(self.cache_service, study.id)
+        parts = (study.id, revision, study.version, study.updated_at, study.archived, url, depth, formatted)
+        key = "\n".join(map(str, parts))
+        return f'"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]}"'
+
     def aggregate_output_data(
         self,
         uuid: str,
@@ -549,6 +599,7 @@ class StudyService:
                 f"{job_id}-{log_suffix}",
             ],
         )
+        remove_from_cache(self.cache_service, study.id)
         stopwatch.log_elapsed(lambda d: logger.info(f"Saved logs for job {job_id} in {d}s"))
 
     def get_comments(self, study_id: str, params: RequestParameters) -> t.Union[str, JSON]:
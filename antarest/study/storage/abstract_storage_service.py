@@ -22,7 +22,7 @@ import py7zr
 
 from antarest.core.config import Config
 from antarest.core.exceptions import BadOutputError, StudyOutputNotFoundError
-from antarest.core.interfaces.cache import CacheConstants, ICache
+from antarest.core.interfaces.cache import CacheConstants, ICache, record_cache_lookup
 from antarest.core.model import JSON, PublicMode
 from antarest.core.serialization import from_json
 from antarest.core.utils.archives import ArchiveFormat, archive_dir, extract_archive, unzip
@@ -159,6 +159,7 @@ class AbstractStorageService(IStudyStorageService[T], ABC):
             from_cache: t.Optional[JSON] = None
             if use_cache:
                 from_cache = self.cache.get(cache_id)
+                record_cache_lookup(CacheConstants.RAW_STUDY, from_cache)
             if from_cache is not None:
                 logger.info(f"Raw Study {metadata.id} read from cache")
                 data = from_cache
@@ -13,7 +13,6 @@
 import datetime
 import logging
 import time
-import typing as t
 
 from antarest.core.config import Config
 from antarest.core.exceptions import TaskAlreadyRunning
@@ -21,10 +20,7 @@ from antarest.core.interfaces.service import IService
 from antarest.core.jwt import DEFAULT_ADMIN_USER
 from antarest.core.requests import RequestParameters
 from antarest.core.utils.fastapi_sqlalchemy import db
-from antarest.study.model import RawStudy, Study
-from antarest.study.repository import AccessPermissions, StudyFilter
 from antarest.study.service import StudyService
-from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +40,11 @@ class AutoArchiveService(IService):
         """
         old_date = datetime.datetime.utcnow() - datetime.timedelta(days=self.config.storage.auto_archive_threshold_days)
         with db():
-            # in this part full `Read` rights over studies are granted to this function
-            studies: t.Sequence[Study] = self.study_service.repository.get_all(
-                study_filter=StudyFilter(managed=True, access_permissions=AccessPermissions(is_admin=True))
-            )
             # list of study IDs and boolean indicating if it's a raw study (True) or a variant (False)
-            study_ids_to_archive = [
-                (study.id, isinstance(study, RawStudy))
-                for study in studies
-                if (study.last_access or study.updated_at) < old_date
-                and (isinstance(study, VariantStudy) or not study.archived)
-            ]
-        for study_id, is_raw_study in study_ids_to_archive[0 : self.max_parallel]:
+            study_ids_to_archive = self.study_service.repository.get_archiving_candidates(
+                old_date, limit=self.max_parallel
+            )
+        for study_id, is_raw_study in study_ids_to_archive:
             try:
                 if is_raw_study:
                     logger.info(
@@ -10,22 +10,33 @@
 #
 # This file is part of the Antares project.
 
+import collections
 import dataclasses
+import os
 import re
+import threading
+import time
 import typing as t
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 from antarest.core.model import JSON
 
+# Infinity values are not supported by JSON, so we use a string instead.
+_SPECIAL_VALUES: t.Mapping[str, t.Union[str, bool]] = {
+    "true": True,
+    "false": False,
+    "+inf": "+Inf",
+    "-inf": "-Inf",
+    "inf": "+Inf",
+}
+
 
 def convert_value(value: str) -> t.Union[str, int, float, bool]:
     """Convert value to the appropriate type for JSON."""
 
     try:
-        # Infinity values are not supported by JSON, so we use a string instead.
-        mapping = {"true": True, "false": False, "+inf": "+Inf", "-inf": "-Inf", "inf": "+Inf"}
-        return t.cast(t.Union[str, int, float, bool], mapping[value.lower()])
+        return _SPECIAL_VALUES[value.lower()]
     except KeyError:
         try:
             return int(value)
@@ -101,6 +112,122 @@ class IniFilter:
             return False
         return True
 
+    def filter_sections(self, sections: t.Mapping[str, t.Mapping[str, t.Any]]) -> t.Dict[str, t.Dict[str, t.Any]]:
+        """
+        Select the sections and options matching the regular expressions.
+
+        The result is a copy of the selected sections: it can be modified by the caller
+        without altering the given sections (lists of values of duplicate keys are also copied).
+
+        Args:
+            sections: Dictionary of parsed sections and options.
+
+        Returns:
+            Dictionary of the selected sections and options.
+        """
+        if self.section_regex is None and self.option_regex is None:
+            return {
+                section: {
+                    option: value.copy() if isinstance(value, list) else value for option, value in options.items()
+                }
+                for section, options in sections.items()
+            }
+        select = self.select_section_option
+        return {
+            section: {
+                option: value.copy() if isinstance(value, list) else value
+                for option, value in options.items()
+                if select(section, option)
+            }
+            for section, options in sections.items()
+            if select(section)
+        }
+
+
+class IniParseCache:
+    """
+    Thread-safe LRU cache of parsed `.ini` files, shared by all the readers.
+
+    An entry is identified by the path of the file and is only valid as long as
+    the modification time (in nanoseconds) and the size of the file are unchanged.
+    Since a file may be parsed differently depending on the reader configuration,
+    each entry holds the parsed sections for each reader configuration.
+
+    The modification time has a coarse resolution on most filesystems, so a file
+    modified twice in a short period may keep the same stamp.
+    To avoid returning stale data, recently modified files are not cached (like "racily clean" entries in Git).
+    """
+
+    def __init__(self, maxsize: int = 1024, racy_delay: float = 1.0) -> None:
+        self.maxsize = maxsize
+        self.racy_delay_ns = int(racy_delay * 1e9)
+        self._entries: t.OrderedDict[str, t.Tuple[t.Tuple[int, int], t.Dict[t.Hashable, JSON]]]
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stamp: t.Tuple[int, int], reader_key: t.Hashable) -> t.Optional[JSON]:
+        """
+        Get the parsed sections of a file, or `None` if the file is not in the cache or has changed.
+
+        Args:
+            path: Path of the `.ini` file.
+            stamp: Modification time (in nanoseconds) and size of the file.
+            reader_key: Key identifying the reader configuration.
+
+        Returns:
+            The cached sections which must not be modified by the caller.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if entry[0] != stamp:
+                del self._entries[path]
+                return None
+            self._entries.move_to_end(path)
+            return entry[1].get(reader_key)
+
+    def put(self, path: str, stamp: t.Tuple[int, int], reader_key: t.Hashable, sections: JSON) -> None:
+        """
+        Store the parsed sections of a file.
+
+        Args:
+            path: Path of the `.ini` file.
+            stamp: Modification time (in nanoseconds) and size of the file when it was parsed.
+            reader_key: Key identifying the reader configuration.
+            sections: Parsed sections which must not be modified afterward.
+        """
+        if time.time_ns() - stamp[0] < self.racy_delay_ns:
+            return
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != stamp:
+                entry = (stamp, {})
+                self._entries[path] = entry
+            entry[1][reader_key] = sections
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: t.Union[str, "os.PathLike[str]"]) -> None:
+        """
+        Remove the entry of a file from the cache, for instance, after the file is written.
+
+        Args:
+            path: Path of the `.ini` file.
+        """
+        with self._lock:
+            self._entries.pop(os.fspath(path), None)
+
+    def clear(self) -> None:
+        """Remove all the entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Cache shared by all the `IniReader` instances
+ini_parse_cache = IniParseCache()
+
 
 class IReader(ABC):
     """
@@ -178,17 +305,8 @@ class IniReader(IReader):
 
     def read(self, path: t.Any, **kwargs: t.Any) -> JSON:
         if isinstance(path, (Path, str)):
-            try:
-                with open(path, mode="r", encoding="utf-8") as f:
-                    sections = self._parse_ini_file(f, **kwargs)
-            except UnicodeDecodeError:
-                # On windows, `.ini` files may use "cp1252" encoding
-                with open(path, mode="r", encoding="cp1252") as f:
-                    sections = self._parse_ini_file(f, **kwargs)
-            except FileNotFoundError:
-                # If the file is missing, an empty dictionary is returned.
-                # This is required to mimic the behavior of `configparser.ConfigParser`.
-                return {}
+            sections = self._read_cached(os.fspath(path))
+            return t.cast(JSON, IniFilter.from_kwargs(**kwargs).filter_sections(sections))
 
         elif hasattr(path, "read"):
             with path:
@@ -199,6 +317,66 @@ class IniReader(IReader):
 
         return t.cast(JSON, sections)
 
+    def _read_cached(self, path: str) -> t.Mapping[str, t.Mapping[str, t.Any]]:
+        """
+        Parse the whole `.ini` file, or get the parsed sections from the shared cache
+        if the file is unchanged since the last parsing.
+
+        The returned sections are shared and must not be modified.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            # If the file is missing, an empty dictionary is returned.
+            # This is required to mimic the behavior of `configparser.ConfigParser`.
+            return {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        reader_key = (self.__class__, frozenset(self._special_keys), self._section_name)
+        sections = ini_parse_cache.get(path, stamp, reader_key)
+        if sections is None:
+            try:
+                with open(path, mode="r", encoding="utf-8") as f:
+                    sections = self._parse_ini_text(f.read())
+            except UnicodeDecodeError:
+                # On windows, `.ini` files may use "cp1252" encoding
+                with open(path, mode="r", encoding="cp1252") as f:
+                    sections = self._parse_ini_text(f.read())
+            except FileNotFoundError:
+                return {}
+            ini_parse_cache.put(path, stamp, reader_key, sections)
+        return t.cast(t.Mapping[str, t.Mapping[str, t.Any]], sections)
+
+    def _parse_ini_text(self, text: str) -> JSON:
+        """
+        Parse the whole content of a `.ini` file to JSON object, without filtering.
+
+        This is a fast path of `_parse_ini_file` which applies the same parsing rules.
+        """
+        special_keys = self._special_keys
+        sections: t.Dict[str, t.Dict[str, t.Any]] = {}
+        section_name = self._section_name
+        values: t.Optional[t.Dict[str, t.Any]] = None
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line or line[0] in ";#":
+                continue
+            elif line[0] == "[":
+                section_name = line[1:-1]
+                values = sections.setdefault(section_name, {})
+            elif "=" in line:
+                key, _, value = line.partition("=")
+                key = key.strip()
+                if values is None:
+                    values = sections.setdefault(section_name, {})
+                if key in special_keys:
+                    values.setdefault(key, []).append(convert_value(value.strip()))
+                else:
+                    values[key] = convert_value(value.strip())
+            else:
+                raise ValueError(f"☠☠☠ Invalid line: {line!r}")
+        return sections
+
     def _parse_ini_file(self, ini_file: t.TextIO, **kwargs: t.Any) -> JSON:
         """
         Parse `.ini` file to JSON object.
@@ -243,8 +421,9 @@ class IniReader(IReader):
         # NOTE: This algorithm is 1.93x faster than configparser.ConfigParser
         section_name = self._section_name
 
-        # reset the current values
-        self._curr_sections.clear()
+        # reset the current values (a new dictionary is used, because
+        # the previous one is returned to the caller and may still be in use)
+        self._curr_sections = {}
         self._curr_section = ""
         self._curr_option = ""
 
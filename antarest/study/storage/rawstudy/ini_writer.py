@@ -12,10 +12,38 @@
 
 import ast
 import configparser
+import contextlib
+import os
 import typing as t
+import uuid
 from pathlib import Path
 
 from antarest.core.model import JSON
+from antarest.study.storage.rawstudy.ini_reader import ini_parse_cache
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path) -> t.Generator[t.TextIO, None, None]:
+    """
+    Open a text file for writing and replace the target file only once the writing is complete.
+
+    The content is written to a temporary file in the same directory, which is then renamed,
+    so the readers never see a partially written file.
+
+    Args:
+        path: path of the file to write.
+
+    Yields:
+        The temporary file opened for writing.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("x") as fp:
+            yield fp
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    ini_parse_cache.invalidate(path)
 
 
 class IniConfigParser(configparser.RawConfigParser):
@@ -80,7 +108,7 @@ class IniWriter:
         """
         config_parser = IniConfigParser(special_keys=self.special_keys)
         config_parser.read_dict(data)
-        with path.open("w") as fp:
+        with atomic_write(path) as fp:
             config_parser.write(fp)
 
 
@@ -97,7 +125,7 @@ class SimpleKeyValueWriter(IniWriter):
             data: JSON content.
             path: path to `.ini` file.
         """
-        with path.open("w") as fp:
+        with atomic_write(path) as fp:
             for key, value in data.items():
                 if value is not None:
                     fp.write(f"{key}={value}\n")
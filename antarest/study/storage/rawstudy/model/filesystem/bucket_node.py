@@ -37,6 +37,8 @@ class BucketNode(FolderNode):
     Node to handle structure free, user purpose folder. BucketNode accept any file or sub folder as children.
     """
 
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
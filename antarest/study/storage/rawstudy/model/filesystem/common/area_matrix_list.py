@@ -65,6 +65,8 @@ class AreaMatrixList(FolderNode):
         self.prefix = prefix
         self.matrix_class = matrix_class
         self.additional_matrix_params = additional_matrix_params or {}
+        # Without prefix, the matrix files are listed from the filesystem (outputs)
+        self.memoize_children = bool(prefix)
 
     def build(self) -> TREE:
         """
@@ -109,6 +111,8 @@ class HydroMatrixList(FolderNode):
 
 
 class BindingConstraintMatrixList(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -127,6 +131,8 @@ class BindingConstraintMatrixList(FolderNode):
 
 
 class ThermalMatrixList(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -163,6 +169,8 @@ class AreaMultipleMatrixList(FolderNode):
             └── cluster_nuclear.txt
     """
 
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -17,6 +17,7 @@ import re
 import tempfile
 import typing as t
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -30,7 +31,9 @@ from antarest.core.utils.archives import (
     extract_lines_from_archive,
     is_archive_format,
     read_file_from_archive,
+    read_files_from_archive,
 )
+from antarest.core.utils.utils import StopWatch
 from antarest.study.model import STUDY_VERSION_8_1, STUDY_VERSION_8_6
 from antarest.study.storage.rawstudy.ini_reader import IniReader
 from antarest.study.storage.rawstudy.model.filesystem.config.binding_constraint import (
@@ -72,6 +75,26 @@ class FileType(Enum):
     MULTI_INI = "multi_ini"
 
 
+ArchiveFiles = t.Mapping[str, str]
+"""
+Content of the configuration files of an archived study, indexed by their POSIX path inside the archive.
+"""
+
+# Maximum number of threads used to parse the areas of a study.
+# Parsing is I/O-bound (especially on network filesystems), so we use more threads than CPU cores.
+MAX_PARSING_WORKERS = 16
+
+# Configuration files read by `build`, preloaded in one pass when the study is archived.
+_CONFIG_FILES_REGEX = re.compile(
+    r"^(?:study\.antares"
+    r"|settings/generaldata\.ini"
+    r"|input/areas/(?:list\.txt|sets\.ini|[^/]+/optimization\.ini)"
+    r"|input/bindingconstraints/bindingconstraints\.ini"
+    r"|input/(?:thermal|renewables|st-storage)/clusters/[^/]+/list\.ini"
+    r"|input/links/[^/]+/properties\.ini)$"
+)
+
+
 def extract_data_from_archive(
     root: Path,
     posix_path: str,
@@ -97,41 +120,72 @@ def extract_data_from_archive(
         return {}
 
 
-def build(study_path: Path, study_id: str, output_path: t.Optional[Path] = None) -> "FileStudyTreeConfig":
+def build(
+    study_path: Path,
+    study_id: str,
+    output_path: t.Optional[Path] = None,
+    max_workers: int = MAX_PARSING_WORKERS,
+) -> "FileStudyTreeConfig":
     """
     Extracts data from the filesystem to build a study config.
 
+    The areas are parsed concurrently in a thread pool.
+    If the study is archived, the configuration files are read in one pass through a single archive handle.
+
     Args:
         study_path: Path to the study directory or ZIP file containing the study.
         study_id: UUID of the study.
         output_path: Optional path for the output directory.
             If not provided, it will be set to `{study_path}/output`.
+        max_workers: Maximum number of threads used to parse the areas.
 
     Returns:
         An instance of `FileStudyTreeConfig` filled with the study data.
     """
+    stopwatch = StopWatch()
     is_archive = is_archive_format(study_path.suffix.lower())
 
+    archive_files: t.Optional[ArchiveFiles] = None
+    if is_archive:
+        archive_files = read_files_from_archive(study_path, _CONFIG_FILES_REGEX.match)
+        stopwatch.log_elapsed(lambda x: logger.debug(f"Study '{study_id}': archive read in {x:.3f}s"))
+
     # Study directory to use if the study is compressed
     study_dir = study_path.with_suffix("") if is_archive else study_path
-    (sns, asi, enr_modelling) = _parse_parameters(study_path)
+    (sns, asi, enr_modelling) = _parse_parameters(study_path, archive_files=archive_files)
+    version = _parse_version(study_path, archive_files=archive_files)
+
+    areas = _parse_areas(study_path, version=version, archive_files=archive_files, max_workers=max_workers)
+    stopwatch.log_elapsed(lambda x: logger.debug(f"Study '{study_id}': {len(areas)} areas parsed in {x:.3f}s"))
+
+    sets = _parse_sets(study_path, archive_files=archive_files)
+    bindings = _parse_bindings(study_path, archive_files=archive_files)
+    stopwatch.log_elapsed(lambda x: logger.debug(f"Study '{study_id}': sets and bindings parsed in {x:.3f}s"))
 
     outputs_dir: Path = output_path or study_path / "output"
-    return FileStudyTreeConfig(
+    outputs = parse_outputs(outputs_dir)
+    stopwatch.log_elapsed(lambda x: logger.debug(f"Study '{study_id}': {len(outputs)} outputs parsed in {x:.3f}s"))
+
+    config = FileStudyTreeConfig(
         study_path=study_path,
         output_path=outputs_dir,
         path=study_dir,
         study_id=study_id,
-        version=_parse_version(study_path),
-        areas=_parse_areas(study_path),
-        sets=_parse_sets(study_path),
-        outputs=parse_outputs(outputs_dir),
-        bindings=_parse_bindings(study_path),
+        version=version,
+        areas=areas,
+        sets=sets,
+        outputs=outputs,
+        bindings=bindings,
         store_new_set=sns,
         archive_input_series=asi,
         enr_modelling=enr_modelling,
         archive_path=study_path if is_archive else None,
     )
+    stopwatch.log_elapsed(
+        lambda x: logger.debug(f"Study '{study_id}': configuration built in {x:.3f}s"),
+        since_start=True,
+    )
+    return config
 
 
 def _extract_data_from_file(
@@ -139,6 +193,7 @@ def _extract_data_from_file(
     inside_root_path: Path,
     file_type: FileType,
     multi_ini_keys: t.Sequence[str] = (),
+    archive_files: t.Optional[ArchiveFiles] = None,
 ) -> t.Any:
     """
     Extract and process data from various types of files.
@@ -148,6 +203,8 @@ def _extract_data_from_file(
         inside_root_path: Relative path to the file to extract.
         file_type: Type of the file to extract: text, simple INI or multi INI.
         multi_ini_keys: List of keys to use for multi INI files.
+        archive_files: Preloaded content of the archive files, if the study is archived.
+            If not provided, the file is read directly from the archive.
 
     Returns:
         The content of the file, processed according to its type:
@@ -159,6 +216,15 @@ def _extract_data_from_file(
     posix_path: str = inside_root_path.as_posix()
     output_data_path = root / inside_root_path
 
+    if is_archive and archive_files is not None:
+        text = archive_files.get(posix_path)
+        if file_type == FileType.TXT:
+            return [] if text is None else text.splitlines(keepends=False)
+        elif file_type in {FileType.MULTI_INI, FileType.SIMPLE_INI}:
+            return {} if text is None else IniReader(multi_ini_keys).read(io.StringIO(text))
+        else:  # pragma: no cover
+            raise NotImplementedError(file_type)
+
     if file_type == FileType.TXT:
         # Parse the file as a list of lines, return an empty list if missing.
         if is_archive:
@@ -184,11 +250,12 @@ def _extract_data_from_file(
         raise NotImplementedError(file_type)
 
 
-def _parse_version(path: Path) -> StudyVersion:
+def _parse_version(path: Path, archive_files: t.Optional[ArchiveFiles] = None) -> StudyVersion:
     study_info = _extract_data_from_file(
         root=path,
         inside_root_path=Path("study.antares"),
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     version = study_info.get("antares", {}).get("version", 0)
     if isinstance(version, float):  # study 9.0 or newer
@@ -196,11 +263,15 @@ def _parse_version(path: Path) -> StudyVersion:
     return StudyVersion.parse(version)
 
 
-def _parse_parameters(path: Path) -> t.Tuple[bool, t.List[str], str]:
+def _parse_parameters(
+    path: Path,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> t.Tuple[bool, t.List[str], str]:
     general = _extract_data_from_file(
         root=path,
         inside_root_path=Path("settings/generaldata.ini"),
         file_type=FileType.MULTI_INI,
+        archive_files=archive_files,
     )
 
     store_new_set: bool = general.get("output", {}).get("storenewset", False)
@@ -211,11 +282,12 @@ def _parse_parameters(path: Path) -> t.Tuple[bool, t.List[str], str]:
     return store_new_set, archive_input_series, enr_modelling
 
 
-def _parse_bindings(root: Path) -> t.List[BindingConstraintDTO]:
+def _parse_bindings(root: Path, archive_files: t.Optional[ArchiveFiles] = None) -> t.List[BindingConstraintDTO]:
     bindings = _extract_data_from_file(
         root=root,
         inside_root_path=Path("input/bindingconstraints/bindingconstraints.ini"),
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     output_list = []
     for bind in bindings.values():
@@ -246,12 +318,13 @@ def _parse_bindings(root: Path) -> t.List[BindingConstraintDTO]:
     return output_list
 
 
-def _parse_sets(root: Path) -> t.Dict[str, DistrictSet]:
+def _parse_sets(root: Path, archive_files: t.Optional[ArchiveFiles] = None) -> t.Dict[str, DistrictSet]:
     obj = _extract_data_from_file(
         root=root,
         inside_root_path=Path("input/areas/sets.ini"),
         file_type=FileType.MULTI_INI,
         multi_ini_keys=["+", "-"],
+        archive_files=archive_files,
     )
     return {
         transform_name_to_id(name): DistrictSet(
@@ -264,14 +337,31 @@ def _parse_sets(root: Path) -> t.Dict[str, DistrictSet]:
     }
 
 
-def _parse_areas(root: Path) -> t.Dict[str, Area]:
+def _parse_areas(
+    root: Path,
+    version: t.Optional[StudyVersion] = None,
+    archive_files: t.Optional[ArchiveFiles] = None,
+    max_workers: int = MAX_PARSING_WORKERS,
+) -> t.Dict[str, Area]:
     areas = _extract_data_from_file(
         root=root,
         inside_root_path=Path("input/areas/list.txt"),
         file_type=FileType.TXT,
+        archive_files=archive_files,
     )
     areas = [a for a in areas if a != ""]
-    return {transform_name_to_id(a): parse_area(root, a) for a in areas}
+    version = version or _parse_version(root, archive_files=archive_files)
+
+    def _parse(area: str) -> Area:
+        return parse_area(root, area, version=version, archive_files=archive_files)
+
+    if max_workers <= 1 or len(areas) <= 1:
+        return {transform_name_to_id(a): _parse(a) for a in areas}
+
+    # Areas are independent of each other: they can be parsed concurrently.
+    # The order of the areas is preserved by `map`.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(areas))) as executor:
+        return {transform_name_to_id(a): area for a, area in zip(areas, executor.map(_parse, areas))}
 
 
 def parse_outputs(output_path: Path) -> t.Dict[str, Simulation]:
@@ -400,18 +490,26 @@ def get_playlist(config: JSON) -> t.Optional[t.Dict[int, float]]:
     return {year + 1: weights.get(year, 1) for year in added if year not in removed}
 
 
-def parse_area(root: Path, area: str) -> "Area":
+def parse_area(
+    root: Path,
+    area: str,
+    version: t.Optional[StudyVersion] = None,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> "Area":
     """
     Parse an area configuration and extract its filtering configuration.
 
     Args:
         root: The root directory of the study.
         area: The name of the area to parse.
+        version: The version of the study, read from the study if not provided.
+        archive_files: Preloaded content of the archive files, if the study is archived.
 
     Returns:
         The area configuration.
     """
     area_id = transform_name_to_id(area)
+    version = version or _parse_version(root, archive_files=archive_files)
 
     # Parse the optimization INI file to extract the filtering configuration.
     # The file is optional, so we use a default value to avoid a parsing error.
@@ -419,6 +517,7 @@ def parse_area(root: Path, area: str) -> "Area":
         root=root,
         inside_root_path=Path(f"input/areas/{area_id}/optimization.ini"),
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     filtering = optimization.get("filtering", {})
     filter_synthesis = extract_filtering(filtering.get("filter-synthesis", ""))
@@ -426,23 +525,28 @@ def parse_area(root: Path, area: str) -> "Area":
 
     return Area(
         name=area,
-        links=_parse_links_filtering(root, area_id),
-        thermals=_parse_thermal(root, area_id),
-        renewables=_parse_renewables(root, area_id),
+        links=_parse_links_filtering(root, area_id, archive_files=archive_files),
+        thermals=_parse_thermal(root, area_id, version=version, archive_files=archive_files),
+        renewables=_parse_renewables(root, area_id, version=version, archive_files=archive_files),
         filters_synthesis=filter_synthesis,
         filters_year=filter_year_by_year,
-        st_storages=_parse_st_storage(root, area_id),
+        st_storages=_parse_st_storage(root, area_id, version=version, archive_files=archive_files),
     )
 
 
-def _parse_thermal(root: Path, area: str) -> t.List[ThermalConfigType]:
+def _parse_thermal(
+    root: Path,
+    area: str,
+    version: t.Optional[StudyVersion] = None,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> t.List[ThermalConfigType]:
     """
     Parse the thermal INI file, return an empty list if missing.
     """
-    version = _parse_version(root)
+    version = version or _parse_version(root, archive_files=archive_files)
     relpath = Path(f"input/thermal/clusters/{area}/list.ini")
     config_dict: t.Dict[str, t.Any] = _extract_data_from_file(
-        root=root, inside_root_path=relpath, file_type=FileType.SIMPLE_INI
+        root=root, inside_root_path=relpath, file_type=FileType.SIMPLE_INI, archive_files=archive_files
     )
     config_list = []
     for section, values in config_dict.items():
@@ -454,14 +558,19 @@ def _parse_thermal(root: Path, area: str) -> t.List[ThermalConfigType]:
     return config_list
 
 
-def _parse_renewables(root: Path, area: str) -> t.List[RenewableConfigType]:
+def _parse_renewables(
+    root: Path,
+    area: str,
+    version: t.Optional[StudyVersion] = None,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> t.List[RenewableConfigType]:
     """
     Parse the renewables INI file, return an empty list if missing.
     """
 
     # Before version 8.1, we only have "Load", "Wind" and "Solar" objects.
     # We can't use renewable clusters.
-    version = _parse_version(root)
+    version = version or _parse_version(root, archive_files=archive_files)
     if version < STUDY_VERSION_8_1:
         return []
 
@@ -471,6 +580,7 @@ def _parse_renewables(root: Path, area: str) -> t.List[RenewableConfigType]:
         root=root,
         inside_root_path=relpath,
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     config_list = []
     for section, values in config_dict.items():
@@ -482,13 +592,18 @@ def _parse_renewables(root: Path, area: str) -> t.List[RenewableConfigType]:
     return config_list
 
 
-def _parse_st_storage(root: Path, area: str) -> t.List[STStorageConfigType]:
+def _parse_st_storage(
+    root: Path,
+    area: str,
+    version: t.Optional[StudyVersion] = None,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> t.List[STStorageConfigType]:
     """
     Parse the short-term storage INI file, return an empty list if missing.
     """
 
     # st_storage feature exists only since 8.6 version
-    version = _parse_version(root)
+    version = version or _parse_version(root, archive_files=archive_files)
     if version < STUDY_VERSION_8_6:
         return []
 
@@ -497,6 +612,7 @@ def _parse_st_storage(root: Path, area: str) -> t.List[STStorageConfigType]:
         root=root,
         inside_root_path=relpath,
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     config_list = []
     for section, values in config_dict.items():
@@ -508,11 +624,16 @@ def _parse_st_storage(root: Path, area: str) -> t.List[STStorageConfigType]:
     return config_list
 
 
-def _parse_links_filtering(root: Path, area: str) -> t.Dict[str, Link]:
+def _parse_links_filtering(
+    root: Path,
+    area: str,
+    archive_files: t.Optional[ArchiveFiles] = None,
+) -> t.Dict[str, Link]:
     properties_ini = _extract_data_from_file(
         root=root,
         inside_root_path=Path(f"input/links/{area}/properties.ini"),
         file_type=FileType.SIMPLE_INI,
+        archive_files=archive_files,
     )
     links_by_ids = {link_id: Link(**obj) for link_id, obj in properties_ini.items()}
     return links_by_ids
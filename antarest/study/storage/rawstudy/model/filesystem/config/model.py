@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import contextlib
 import re
 import typing as t
 from pathlib import Path
@@ -155,6 +156,28 @@ class BindingConstraintDTO(AntaresBaseModel):
     group: str = DEFAULT_GROUP
 
 
+class TreeRevision:
+    """
+    Revision counter shared by all the configurations of a study tree (see `FileStudyTreeConfig.next_file`).
+
+    The counter changes each time the configuration is modified, so that the folder
+    nodes of the tree can invalidate their memoised children.
+    It is not part of the configuration data, so two revisions always compare equal.
+    """
+
+    __slots__ = ("value", "modifying")
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.modifying = 0
+
+    def __eq__(self, other: t.Any) -> bool:
+        return isinstance(other, TreeRevision)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.value})"
+
+
 class FileStudyTreeConfig(DTO):
     """
     Root object to handle all study parameters which impact tree structure
@@ -176,6 +199,7 @@ class FileStudyTreeConfig(DTO):
         enr_modelling: str = str(EnrModelling.AGGREGATED),
         cache: t.Optional[t.Dict[str, t.List[str]]] = None,
         archive_path: t.Optional[Path] = None,
+        revision: t.Optional[TreeRevision] = None,
     ):
         self.study_path = study_path
         self.path = path
@@ -191,6 +215,32 @@ class FileStudyTreeConfig(DTO):
         self.enr_modelling = enr_modelling
         self.cache = cache or {}
         self.archive_path = archive_path
+        self.tree_revision = revision or TreeRevision()
+
+    @property
+    def revision(self) -> int:
+        """
+        Revision of the configuration, used by the study tree to invalidate its memoised nodes.
+
+        While the configuration is being modified (see `modifying`), a new revision is returned
+        on each access, so that the memoised nodes are never reused.
+        """
+        if self.tree_revision.modifying:
+            self.tree_revision.value += 1
+        return self.tree_revision.value
+
+    @contextlib.contextmanager
+    def modifying(self) -> t.Iterator[None]:
+        """
+        Context manager to use while the configuration is modified (areas, clusters, links...),
+        for instance when a command is applied to the study.
+        """
+        self.tree_revision.modifying += 1
+        try:
+            yield
+        finally:
+            self.tree_revision.modifying -= 1
+            self.tree_revision.value += 1
 
     def next_file(self, name: str, is_output: bool = False) -> "FileStudyTreeConfig":
         if is_output and name in self.outputs and self.outputs[name].archived:
@@ -213,6 +263,7 @@ class FileStudyTreeConfig(DTO):
             enr_modelling=self.enr_modelling,
             cache=self.cache,
             archive_path=archive_path,
+            revision=self.tree_revision,
         )
 
     def at_file(self, filepath: Path) -> "FileStudyTreeConfig":
@@ -230,6 +281,7 @@ class FileStudyTreeConfig(DTO):
             archive_input_series=self.archive_input_series,
             enr_modelling=self.enr_modelling,
             cache=self.cache,
+            revision=self.tree_revision,
         )
 
     def area_names(self) -> t.List[str]:
@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import math
 import typing as t
 
 import numpy as np
@@ -68,6 +69,95 @@ def idx_group(group: str, /) -> str:
     return group
 
 
+# ====================================
+#  Vectorized access to the matrices
+# ====================================
+
+
+def _new_matrix(index: t.List[str], columns: t.List[str]) -> pd.DataFrame:
+    # Note: all DataFrames are initialized with NaN values, so the dtype is `float`.
+    return pd.DataFrame(np.full((len(index), len(columns)), np.nan), index=index, columns=columns)
+
+
+def _scatter_values(matrix: pd.DataFrame, cells: t.Mapping[t.Tuple[str, str], _Value]) -> pd.DataFrame:
+    """
+    Set the values of the given cells of a matrix at once.
+
+    Args:
+        matrix: The scenario matrix to update.
+        cells: Values indexed by (row label, column label).
+
+    Returns:
+        The updated matrix (a new DataFrame, unless the fallback is used).
+    """
+    labels, years = zip(*cells)
+    rows = matrix.index.get_indexer(labels)
+    cols = matrix.columns.get_indexer(years)
+    if rows.min() >= 0 and cols.min() >= 0:
+        try:
+            data = matrix.to_numpy(dtype=float, na_value=np.nan, copy=True)
+            data[rows, cols] = list(cells.values())
+        except (TypeError, ValueError):
+            pass  # unexpected values, use the fallback
+        else:
+            return pd.DataFrame(data, index=matrix.index, columns=matrix.columns)
+
+    # Fallback: unknown rows or columns are added to the matrix (and the dtype may be changed) by pandas
+    for (label, year), value in cells.items():
+        matrix.at[label, year] = value
+    return matrix
+
+
+def _gather_rules(
+    matrix: pd.DataFrame,
+    labels: t.Sequence[str],
+    heads: t.Sequence[str],
+    tails: t.Sequence[str],
+    *,
+    percent: bool,
+    allow_nan: bool,
+) -> t.Dict[str, _Value]:
+    """
+    Get the rules of a matrix, the key of the rule of each cell is: ``head + year + tail``.
+
+    Args:
+        matrix: The scenario matrix.
+        labels: The labels of the rows to read (in this order).
+        heads: The beginning of the rule keys of each row.
+        tails: The end of the rule keys of each row.
+        percent: Whether the values are percentages which must be converted to the range [0, 1].
+        allow_nan: Allow NaN values if True.
+
+    Returns:
+        Dictionary of rules.
+    """
+    if not labels:
+        return {}
+    rows = matrix.index.get_indexer(labels)
+    if rows.min() < 0:
+        raise KeyError(labels[int(np.argmin(rows))])
+    data = matrix.to_numpy(dtype=float, na_value=np.nan)[rows]
+    if allow_nan:
+        row_pos, col_pos = (pos.ravel() for pos in np.indices(data.shape))
+    else:
+        row_pos, col_pos = np.nonzero(~np.isnan(data))
+    values = data[row_pos, col_pos]
+
+    rule_values: t.List[_Value]
+    if percent:
+        # Convert value to percentage in range [0, 100]
+        rule_values = (values / 100).tolist()
+    elif allow_nan:
+        # Convert value to TimeSeries number
+        rule_values = [np.nan if math.isnan(v) else int(v) for v in values.tolist()]
+    else:
+        rule_values = values.astype(np.int64).tolist()
+
+    years = [str(year) for year in matrix.columns]
+    keys = [heads[r] + years[c] + tails[r] for r, c in zip(row_pos.tolist(), col_pos.tolist())]
+    return dict(zip(keys, rule_values))
+
+
 # ==========================
 #  Scenario Builder Ruleset
 # ==========================
@@ -143,22 +233,19 @@ class RulesetMatrices:
         group_index = self.get_group_index()
         link_index = self.get_link_index()
         for symbol, scenario_type in self.scenario_types.items():
-            # Note: all DataFrames are initialized with NaN values, so the dtype is `float`.
             if symbol in _AREA_RELATED_SYMBOLS:
-                self.scenarios[scenario_type] = pd.DataFrame(index=area_index, columns=self.columns, dtype=float)
+                self.scenarios[scenario_type] = _new_matrix(area_index, self.columns)
             elif symbol in _BINDING_CONSTRAINTS_RELATED_SYMBOLS:
-                self.scenarios[scenario_type] = pd.DataFrame(index=group_index, columns=self.columns, dtype=float)
+                self.scenarios[scenario_type] = _new_matrix(group_index, self.columns)
             elif symbol in _LINK_RELATED_SYMBOLS:
-                self.scenarios[scenario_type] = pd.DataFrame(index=link_index, columns=self.columns, dtype=float)
+                self.scenarios[scenario_type] = _new_matrix(link_index, self.columns)
             elif symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
-                self.scenarios[scenario_type] = pd.DataFrame(index=area_index, columns=self.columns, dtype=float)
+                self.scenarios[scenario_type] = _new_matrix(area_index, self.columns)
             elif symbol in _CLUSTER_RELATED_SYMBOLS:
                 # We only take the areas that are defined in the thermals and renewables dictionaries
                 # Keys are the names of the areas (and not the identifiers)
                 self.scenarios[scenario_type] = {
-                    self.areas[area_id]: pd.DataFrame(
-                        index=self.get_cluster_index(symbol, self.areas[area_id]), columns=self.columns, dtype=float
-                    )
+                    self.areas[area_id]: _new_matrix(self.get_cluster_index(symbol, self.areas[area_id]), self.columns)
                     for area_id, cluster in self.clusters_by_symbols[symbol].items()
                     if cluster
                 }
@@ -193,37 +280,40 @@ class RulesetMatrices:
                         "symbol,group_id,year": value,  # binding constraints
                     }
         """
+        # The values are grouped by matrix (scenario type and area for clusters) and cell,
+        # then each matrix is updated at once.
+        cells_by_matrix: t.Dict[t.Tuple[str, str], t.Dict[t.Tuple[str, str], _Value]] = {}
         for key, value in rules.items():
             symbol, *parts = key.split(",")
             scenario_type = self.scenario_types[symbol]
             # Common values
             area_id = parts[0].lower()  # or group_id for BC
             year = parts[2] if symbol in _LINK_RELATED_SYMBOLS else parts[1]
+            matrix_area = ""  # only used for clusters
             if symbol in _AREA_RELATED_SYMBOLS:
-                area = self.areas[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_area(area), str(year)] = value
+                label = idx_area(self.areas[area_id])
             elif symbol in _LINK_RELATED_SYMBOLS:
-                area1 = self.areas[area_id]
-                area2 = self.areas[parts[1].lower()]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_link(area1, area2), str(year)] = value
+                label = idx_link(self.areas[area_id], self.areas[parts[1].lower()])
             elif symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
-                area = self.areas[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_area(area), str(year)] = value * 100
+                label = idx_area(self.areas[area_id])
+                value = value * 100
             elif symbol in _CLUSTER_RELATED_SYMBOLS:
-                area = self.areas[area_id]
+                matrix_area = self.areas[area_id]
                 clusters = self.clusters_by_symbols[symbol][area_id]
-                cluster = clusters[parts[2].lower()]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type][area])
-                scenario.at[idx_cluster(area, cluster), str(year)] = value
+                label = idx_cluster(matrix_area, clusters[parts[2].lower()])
             elif symbol in _BINDING_CONSTRAINTS_RELATED_SYMBOLS:
-                group = self.groups[area_id]
-                scenario = t.cast(pd.DataFrame, self.scenarios[scenario_type])
-                scenario.at[idx_group(group), str(year)] = value
+                label = idx_group(self.groups[area_id])
             else:
                 raise NotImplementedError(f"Unknown symbol {symbol}")
+            cells_by_matrix.setdefault((scenario_type, matrix_area), {})[(label, str(year))] = value
+
+        for (scenario_type, matrix_area), cells in cells_by_matrix.items():
+            if matrix_area:
+                cluster_scenario = t.cast(_ClusterScenario, self.scenarios[scenario_type])
+                cluster_scenario[matrix_area] = _scatter_values(cluster_scenario[matrix_area], cells)
+            else:
+                simple_scenario = t.cast(_SimpleScenario, self.scenarios[scenario_type])
+                self.scenarios[scenario_type] = _scatter_values(simple_scenario, cells)
 
     def get_rules(self, *, allow_nan: bool = False) -> t.Dict[str, _Value]:
         """
@@ -264,51 +354,49 @@ class RulesetMatrices:
             Dictionary of rules.
         """
 
-        def to_ts_number(v: t.Any) -> _Value:
-            """Convert value to TimeSeries number."""
-            return np.nan if pd.isna(v) else int(v)
-
-        def to_percent(v: t.Any) -> _Value:
-            """Convert value to percentage in range [0, 100]."""
-            return np.nan if pd.isna(v) else float(v) / 100
-
-        if symbol in _AREA_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area_id},{year}": to_ts_number(value)
-                for area_id, area in self.areas.items()
-                for year, value in scenario.loc[idx_area(area)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
+        if symbol in _AREA_RELATED_SYMBOLS or symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
+            scenario_rules = _gather_rules(
+                t.cast(_SimpleScenario, scenario),
+                [idx_area(area) for area in self.areas.values()],
+                [f"{symbol},{area_id}," for area_id in self.areas],
+                [""] * len(self.areas),
+                percent=symbol in _HYDRO_LEVEL_RELATED_SYMBOLS,
+                allow_nan=allow_nan,
+            )
         elif symbol in _LINK_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area1_id},{area2_id},{year}": to_ts_number(value)
-                for (area1_id, area2_id), (area1, area2) in self.links.items()
-                for year, value in scenario.loc[idx_link(area1, area2)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
-        elif symbol in _HYDRO_LEVEL_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{area_id},{year}": to_percent(value)
-                for area_id, area in self.areas.items()
-                for year, value in scenario.loc[idx_area(area)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
+            scenario_rules = _gather_rules(
+                t.cast(_SimpleScenario, scenario),
+                [idx_link(area1, area2) for area1, area2 in self.links.values()],
+                [f"{symbol},{area1_id},{area2_id}," for area1_id, area2_id in self.links],
+                [""] * len(self.links),
+                percent=False,
+                allow_nan=allow_nan,
+            )
         elif symbol in _CLUSTER_RELATED_SYMBOLS:
             clusters_mapping = self.clusters_by_symbols[symbol]
-            scenario_rules = {
-                f"{symbol},{area_id},{year},{cluster_id}": to_ts_number(value)
-                for area_id, clusters in clusters_mapping.items()
-                for cluster_id, cluster in clusters.items()
-                for year, value in scenario[self.areas[area_id]].loc[idx_cluster(self.areas[area_id], cluster)].items()
-                if allow_nan or not pd.isna(value)
-            }
+            scenario_rules = {}
+            for area_id, clusters in clusters_mapping.items():
+                if not clusters:
+                    continue
+                area = self.areas[area_id]
+                area_rules = _gather_rules(
+                    t.cast(_ClusterScenario, scenario)[area],
+                    [idx_cluster(area, cluster) for cluster in clusters.values()],
+                    [f"{symbol},{area_id},"] * len(clusters),
+                    [f",{cluster_id}" for cluster_id in clusters],
+                    percent=False,
+                    allow_nan=allow_nan,
+                )
+                scenario_rules.update(area_rules)
         elif symbol in _BINDING_CONSTRAINTS_RELATED_SYMBOLS:
-            scenario_rules = {
-                f"{symbol},{group_id},{year}": to_ts_number(value)
-                for group_id, group in self.groups.items()
-                for year, value in scenario.loc[idx_group(group)].items()  # type: ignore
-                if allow_nan or not pd.isna(value)
-            }
+            scenario_rules = _gather_rules(
+                t.cast(_SimpleScenario, scenario),
+                [idx_group(group) for group in self.groups.values()],
+                [f"{symbol},{group_id}," for group_id in self.groups],
+                [""] * len(self.groups),
+                percent=False,
+                allow_nan=allow_nan,
+            )
         else:
             raise NotImplementedError(f"Unknown symbol {symbol}")
         return scenario_rules
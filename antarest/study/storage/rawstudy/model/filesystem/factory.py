@@ -19,7 +19,8 @@ from pathlib import Path
 
 import filelock
 
-from antarest.core.interfaces.cache import CacheConstants, ICache
+from antarest.core.interfaces.cache import CacheConstants, ICache, record_cache_lookup
+from antarest.core.utils.metrics import Histogram
 from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.matrixstore.uri_resolver_service import UriResolverService
 from antarest.study.storage.rawstudy.model.filesystem.config.files import build, parse_outputs
@@ -29,6 +30,11 @@ from antarest.study.storage.rawstudy.model.filesystem.root.filestudytree import
 
 logger = logging.getLogger(__name__)
 
+_CREATE_FROM_FS_SECONDS = Histogram(
+    "antarest_study_factory_create_from_fs_seconds",
+    "Duration of the creation of a study from the disk (`StudyFactory.create_from_fs`)",
+)
+
 
 class FileStudy(t.NamedTuple):
     """
@@ -62,6 +68,7 @@ class StudyFactory:
         self._lock_dir = tempfile.gettempdir()
         self._lock_fmt = "{basename}.create_from_fs.lock"
 
+    @_CREATE_FROM_FS_SECONDS.time()
     def create_from_fs(
         self,
         path: Path,
@@ -102,6 +109,7 @@ class StudyFactory:
         cache_id = f"{CacheConstants.STUDY_FACTORY}/{study_id}"
         if study_id and use_cache:
             from_cache = self.cache.get(cache_id)
+            record_cache_lookup(CacheConstants.STUDY_FACTORY, from_cache)
             if from_cache is not None:
                 logger.info(f"Study {study_id} read from cache")
                 config = FileStudyTreeConfigDTO.model_validate(from_cache).to_build_config()
@@ -37,8 +37,15 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
 
     The Antares tree structure is implemented in the
     `antarest.study.storage.rawstudy.model.filesystem` module.
+
+    The children built by `build` are memoised: they are built once per tree instance
+    and rebuilt only when the study configuration is modified (see `FileStudyTreeConfig.revision`).
+    Subclasses whose children depend on the content of the filesystem rather than
+    on the study configuration must set `memoize_children` to `False`.
     """
 
+    memoize_children: bool = True
+
     def __init__(
         self,
         context: ContextServer,
@@ -48,11 +55,26 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         super().__init__(config)
         self.context = context
         self.children_glob_exceptions = children_glob_exceptions or []
+        self._children: t.Optional[TREE] = None
+        self._children_revision = -1
 
     @abstractmethod
     def build(self) -> TREE:
         pass
 
+    def _build_children(self) -> TREE:
+        """
+        Build the children of this node, or reuse the children built previously
+        if the study configuration has not been modified since.
+        """
+        if not self.memoize_children:
+            return self.build()
+        revision = self.config.revision
+        if self._children is None or self._children_revision != revision:
+            self._children = self.build()
+            self._children_revision = revision
+        return self._children
+
     def _forward_get(
         self,
         url: t.List[str],
@@ -60,7 +82,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         formatted: bool = True,
         get_node: bool = False,
     ) -> t.Union[JSON, INode[JSON, SUB_JSON, JSON]]:
-        children = self.build()
+        children = self._build_children()
         names, sub_url = self.extract_child(children, url)
 
         # item is unique in url
@@ -93,7 +115,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         if get_node:
             return self
 
-        children = self.build()
+        children = self._build_children()
 
         if depth == 0:
             return {}
@@ -139,7 +161,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         url: t.Optional[t.List[str]] = None,
     ) -> None:
         self._assert_not_in_zipped_file()
-        children = self.build()
+        children = self._build_children()
         if not self.config.path.exists():
             self.config.path.mkdir()
 
@@ -153,7 +175,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
 
     def delete(self, url: t.Optional[t.List[str]] = None) -> None:
         if url and url != [""]:
-            children = self.build()
+            children = self._build_children()
             names, sub_url = self.extract_child(children, url)
             for key in names:
                 children[key].delete(sub_url)
@@ -166,7 +188,7 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
         url: t.Optional[t.List[str]] = None,
         raising: bool = False,
     ) -> t.List[str]:
-        children = self.build()
+        children = self._build_children()
 
         if url and url != [""]:
             (name,), sub_url = self.extract_child(children, url)
@@ -184,11 +206,11 @@ class FolderNode(INode[JSON, SUB_JSON, JSON], ABC):
             return errors
 
     def normalize(self) -> None:
-        for child in self.build().values():
+        for child in self._build_children().values():
             child.normalize()
 
     def denormalize(self) -> None:
-        for child in self.build().values():
+        for child in self._build_children().values():
             child.denormalize()
 
     def extract_child(self, children: TREE, url: t.List[str]) -> t.Tuple[t.List[str], t.List[str]]:
@@ -188,8 +188,20 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
         return output
 
     def save(self, data: SUB_JSON, url: t.Optional[t.List[str]] = None) -> None:
+        self.batch_save([(data, url or [])])
+
+    def batch_save(self, updates: t.Sequence[t.Tuple[SUB_JSON, t.List[str]]]) -> None:
+        """
+        Apply several updates to the INI file with a single read-modify-write.
+
+        The updates are applied in order, so the last update wins if several updates
+        target the same section or key.
+
+        Args:
+            updates: List of (data, url) pairs, where the URL components are [section_name, key_name].
+                An empty URL replaces the whole content of the file.
+        """
         self._assert_not_in_zipped_file()
-        url = url or []
         with FileLock(
             str(
                 Path(tempfile.gettempdir())
@@ -197,18 +209,19 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
             )
         ):
             info = self.reader.read(self.path) if self.path.exists() else {}
-            obj = data
-            if isinstance(data, str):
-                with contextlib.suppress(pydantic_core.ValidationError):
-                    obj = from_json(data)
-            if len(url) == 2:
-                if url[0] not in info:
-                    info[url[0]] = {}
-                info[url[0]][url[1]] = obj
-            elif len(url) == 1:
-                info[url[0]] = obj
-            else:
-                info = t.cast(JSON, obj)
+            for data, url in updates:
+                obj = data
+                if isinstance(data, str):
+                    with contextlib.suppress(pydantic_core.ValidationError):
+                        obj = from_json(data)
+                if len(url) == 2:
+                    if url[0] not in info:
+                        info[url[0]] = {}
+                    info[url[0]][url[1]] = obj
+                elif len(url) == 1:
+                    info[url[0]] = obj
+                else:
+                    info = t.cast(JSON, obj)
             self.writer.write(info, self.path)
 
     @log_warning
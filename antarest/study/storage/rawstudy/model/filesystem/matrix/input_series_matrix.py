@@ -13,7 +13,7 @@
 import logging
 import shutil
 from pathlib import Path
-from typing import Any, List, Optional, Union, cast
+from typing import Any, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -22,13 +22,21 @@ from pandas.errors import EmptyDataError
 
 from antarest.core.exceptions import ChildNotFoundError
 from antarest.core.model import JSON
+from antarest.core.utils.metrics import Histogram
 from antarest.core.utils.utils import StopWatch
+from antarest.matrixstore.repository import scan_tsv_shape
+from antarest.matrixstore.uri_resolver_service import UriResolverService
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.context import ContextServer
 from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixFrequency, MatrixNode
 
 logger = logging.getLogger(__name__)
 
+_PARSE_SECONDS = Histogram(
+    "antarest_input_series_matrix_parse_seconds",
+    "Duration of the parsing of an input matrix of a study (`InputSeriesMatrix.parse`)",
+)
+
 
 class InputSeriesMatrix(MatrixNode):
     """
@@ -52,6 +60,7 @@ class InputSeriesMatrix(MatrixNode):
             self.default_empty = np.copy(default_empty)
             self.default_empty.flags.writeable = True
 
+    @_PARSE_SECONDS.time()
     def parse(
         self,
         file_path: Optional[Path] = None,
@@ -100,6 +109,44 @@ class InputSeriesMatrix(MatrixNode):
                 matrix = pd.DataFrame(self.default_empty)
             return matrix if return_dataframe else cast(JSON, matrix.to_dict(orient="split"))
 
+    def get_shape(self) -> Tuple[int, int]:
+        """
+        Get the shape of the matrix (rows, columns) without parsing its values.
+
+        The shape of a normalized matrix is read from the matrix store,
+        and the shape of a TSV file is computed by scanning its lines.
+        An empty TSV file has the shape of the default matrix, as when it is parsed.
+
+        Returns:
+            The number of rows and columns of the matrix.
+
+        Raises:
+            ChildNotFoundError: if the matrix file is not found.
+        """
+        link_path = self.get_link_path()
+        if link_path.exists():
+            matrix_id = UriResolverService.extract_id(link_path.read_text()) or ""
+            shape = self.context.matrix.get_shape(matrix_id)
+            if shape is None:
+                raise ValueError(f"id matrix {matrix_id} not found")
+            return shape
+
+        file_path, tmp_dir = self._get_real_file_path()
+        try:
+            nb_rows, nb_columns = scan_tsv_shape(file_path)
+        except FileNotFoundError as e:
+            logger.warning(f"Matrix file'{file_path}' not found")
+            study_id = self.config.study_id
+            relpath = self.config.path.relative_to(self.config.study_path).as_posix()
+            raise ChildNotFoundError(f"File '{relpath}' not found in the study '{study_id}'") from e
+        finally:
+            if tmp_dir:
+                tmp_dir.cleanup()
+
+        if not nb_rows and self.default_empty is not None:
+            nb_rows, nb_columns = self.default_empty.shape
+        return nb_rows, nb_columns
+
     def check_errors(
         self,
         data: JSON,
@@ -19,6 +19,8 @@ from antarest.study.storage.rawstudy.model.filesystem.matrix.output_series_matri
 
 
 class OutputSimulationAreaItem(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
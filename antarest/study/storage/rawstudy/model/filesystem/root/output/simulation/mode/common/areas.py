@@ -23,6 +23,8 @@ from antarest.study.storage.rawstudy.model.filesystem.root.output.simulation.mod
 
 
 class OutputSimulationAreas(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -19,6 +19,8 @@ from antarest.study.storage.rawstudy.model.filesystem.matrix.output_series_matri
 
 
 class OutputSimulationBindingConstraintItem(FolderNode):
+    memoize_children = False
+
     def build(self) -> TREE:
         existing_files = [d.stem.replace("binding-constraints-", "") for d in self.config.path.iterdir()]
         children: TREE = {
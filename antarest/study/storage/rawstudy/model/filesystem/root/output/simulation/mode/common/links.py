@@ -44,6 +44,8 @@ class _OutputSimulationModeMcAllLinksBis(FolderNode):
 
 
 class OutputSimulationLinks(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -34,6 +34,8 @@ OUTPUT_MAPPING = {
 
 
 class OutputSimulationModeCommon(FolderNode):
+    memoize_children = False
+
     def build(self) -> TREE:
         if not self.config.output_path:
             return {}
@@ -24,6 +24,8 @@ from antarest.study.storage.rawstudy.model.filesystem.lazy_node import LazyNode
 
 
 class OutputSimulationModeMcAllGrid(FolderNode):
+    memoize_children = False
+
     def build(self) -> TREE:
         files = [d.stem for d in self.config.path.iterdir()]
         children: TREE = {}
@@ -33,6 +33,8 @@ from antarest.study.storage.rawstudy.model.filesystem.root.output.simulation.xpa
 
 
 class OutputSimulation(FolderNode):
+    memoize_children = False
+
     def __init__(
         self,
         context: ContextServer,
@@ -67,6 +67,8 @@ class OutputSimulationTsGeneratorCustomMatrixList(FolderNode):
 
 
 class OutputSimulationTsGenerator(FolderNode):
+    memoize_children = False
+
     def build(self) -> TREE:
         children: TREE = {}
         for output_type in ["load", "solar", "wind"]:
@@ -68,6 +68,8 @@ class OutputSimulationTsNumbers(FolderNode):
            └── turbinage.txt
     """
 
+    memoize_children = False
+
     def build(self) -> TREE:
         children: TREE = {}
         for output_type in ["hydro", "load", "solar", "wind"]:
@@ -27,6 +27,7 @@ from antarest.core.interfaces.cache import ICache
 from antarest.core.model import PublicMode
 from antarest.core.requests import RequestParameters
 from antarest.core.utils.archives import ArchiveFormat, extract_archive
+from antarest.core.utils.file_copy import copy_tree
 from antarest.study.model import DEFAULT_WORKSPACE_NAME, Patch, RawStudy, Study, StudyAdditionalData
 from antarest.study.storage.abstract_storage_service import AbstractStorageService
 from antarest.study.storage.patch_service import PatchService
@@ -262,11 +263,10 @@ class RawStudyService(AbstractStorageService[RawStudy]):
         src_path = self.get_study_path(src_meta)
         dest_path = self.get_study_path(dest_study)
 
-        shutil.copytree(src_path, dest_path)
+        def ignore_outputs(directory: str, _: t.Sequence[str]) -> t.Sequence[str]:
+            return ["output"] if not with_outputs and Path(directory) == src_path else []
 
-        output = dest_path / "output"
-        if not with_outputs and output.exists():
-            shutil.rmtree(output)
+        copy_tree(src_path, dest_path, self.config.storage.copy_mode, ignore=ignore_outputs)
 
         study = self.study_factory.create_from_fs(dest_path, study_id=dest_study.id)
         update_antares_info(dest_study, study.tree, update_author=False)
@@ -357,6 +357,7 @@ class RawStudyService(AbstractStorageService[RawStudy]):
                 outputs,
                 output_list_filter,
                 denormalize,
+                copy_mode=self.config.storage.copy_mode,
             )
 
         finally:
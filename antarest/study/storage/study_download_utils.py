@@ -11,6 +11,7 @@
 # This file is part of the Antares project.
 
 import csv
+import functools
 import logging
 import os
 import re
@@ -19,7 +20,7 @@ from datetime import datetime, timedelta
 from http import HTTPStatus
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from fastapi import HTTPException
@@ -49,6 +50,9 @@ from antarest.study.storage.utils import get_start_date
 
 logger = logging.getLogger(__name__)
 
+# Line terminator used by `csv.writer`
+_CSV_LINE_TERMINATOR = "\r\n"
+
 
 class OutputArchivedError(HTTPException):
     def __init__(self, message: str) -> None:
@@ -75,26 +79,21 @@ class StudyDownloader:
         try:
             elm = study.get(parts)
             columns = elm["columns"]
-            rows = elm["data"]
+            # transpose the rows once, instead of reading the rows for each column
+            columns_data = list(zip(*elm["data"])) or [() for _ in columns]
 
-            for index, column in enumerate(columns):
+            for column, column_data in zip(columns, columns_data):
                 if len(column) > 0:
                     column_name = column[0]
                     if data.columns and len(data.columns) > 0 and column_name not in data.columns:
                         continue
 
-                    if target not in matrix.data:
-                        matrix.data[target] = dict()
-
-                    year_str = str(year)
-                    if year_str not in matrix.data[target]:
-                        matrix.data[target][year_str] = []
-
-                    matrix.data[target][year_str].append(
+                    series = matrix.data.setdefault(target, {}).setdefault(str(year), [])
+                    series.append(
                         TimeSerie.construct(
                             name=column_name,
                             unit=column[1] if len(column) > 1 else "",
-                            data=[row[index] for row in rows],
+                            data=list(column_data),
                         )
                     )
                 else:
@@ -372,30 +371,58 @@ class StudyDownloader:
 
     @staticmethod
     def create_csv_file(ts_data: TimeSeriesData, index: MatrixIndex) -> bytes:
+        """
+        Create the CSV file of the time series of an area, a link or a district.
+
+        The cells are formatted column by column, and the rows are joined in bulk:
+        the output is the same as the one of `csv.writer`.
+        """
         output = StringIO()
         writer = csv.writer(output, quoting=csv.QUOTE_NONE)
         nb_rows, csv_titles = StudyDownloader.export_infos(ts_data.data)
         if nb_rows == -1:
             raise ExportException(f"Outputs export: No rows for {ts_data.name} CSV")
         writer.writerow(csv_titles)
-        row_date = datetime.strptime(index.start_date, "%Y-%m-%d %H:%M:%S")
-        for year in ts_data.data:
-            for i in range(0, nb_rows):
-                columns = ts_data.data[year]
-                csv_row: List[Optional[Union[int, float, str]]] = [
-                    str(row_date),
-                    int(year),
-                ]
-                csv_row.extend([column_data.data[i] for column_data in columns])
-                writer.writerow(csv_row)
-                if index.level == StudyDownloadLevelDTO.WEEKLY and i == 0:
-                    row_date = row_date + timedelta(days=index.first_week_size)
-                else:
-                    row_date = index.level.inc_date(row_date)
+        dates = _format_dates(index.start_date, index.level, index.first_week_size, nb_rows, len(ts_data.data))
+        for year_index, (year, columns) in enumerate(ts_data.data.items()):
+            year_dates = dates[year_index * nb_rows : (year_index + 1) * nb_rows]
+            prefixes = [f"{date},{int(year)}" for date in year_dates]
+            cells = [_format_cells(column_data.data[:nb_rows]) for column_data in columns]
+            output.writelines(f"{row}{_CSV_LINE_TERMINATOR}" for row in map(",".join, zip(prefixes, *cells)))
 
         return str.encode(output.getvalue(), "utf-8")
 
 
+@functools.lru_cache(maxsize=16)
+def _format_dates(
+    start_date: str, level: StudyDownloadLevelDTO, first_week_size: int, nb_rows: int, nb_years: int
+) -> List[str]:
+    """
+    Format the dates of the rows of an exported CSV file.
+
+    The dates of the years follow each other, and are the same for all the exported files.
+    """
+    row_date = datetime.strptime(start_date, "%Y-%m-%d %H:%M:%S")
+    dates = []
+    for _ in range(nb_years):
+        for i in range(nb_rows):
+            dates.append(str(row_date))
+            if level == StudyDownloadLevelDTO.WEEKLY and i == 0:
+                row_date = row_date + timedelta(days=first_week_size)
+            else:
+                row_date = level.inc_date(row_date)
+    return dates
+
+
+def _format_cells(values: Sequence[Optional[float]]) -> List[str]:
+    """
+    Format the values of a column as `csv.writer` does: `str` for numbers, empty strings for `None`.
+    """
+    if None in values:
+        return ["" if value is None else str(value) for value in values]
+    return list(map(str, values))
+
+
 class BadOutputFormat(HTTPException):
     def __init__(self, message: str) -> None:
         super().__init__(HTTPStatus.EXPECTATION_FAILED, message)
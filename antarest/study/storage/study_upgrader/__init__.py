@@ -10,13 +10,14 @@
 #
 # This file is part of the Antares project.
 
+import typing as t
 from http import HTTPStatus
 from http.client import HTTPException
 from pathlib import Path
 
 from antares.study.version.exceptions import ApplicationError
 from antares.study.version.model.study_version import StudyVersion
-from antares.study.version.upgrade_app import UpgradeApp
+from antares.study.version.upgrade_app import UpgradeApp, filter_out_child_files
 
 from antarest.core.exceptions import UnsupportedStudyVersion
 
@@ -46,6 +47,14 @@ class StudyUpgrader:
     def should_denormalize_study(self) -> bool:
         return self.app.should_denormalize
 
+    def get_paths_to_denormalize(self) -> t.List[str]:
+        """
+        Get the files and folders (relative to the study directory) whose matrices must be denormalized
+        before the upgrade: only the ones modified by the upgrade steps which read or rewrite matrices.
+        """
+        paths = {path for method in self.app.upgrade_methods if method.should_denormalize for path in method.files}
+        return [Path(path).as_posix() for path in filter_out_child_files(paths)]
+
 
 def _get_version_index(version: str) -> int:
     try:
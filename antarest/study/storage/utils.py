@@ -34,12 +34,13 @@ from antarest.core.exceptions import (
     UnsupportedStudyVersion,
     WorkspaceNotFound,
 )
-from antarest.core.interfaces.cache import CacheConstants, ICache
+from antarest.core.interfaces.cache import CacheConstants, ICache, record_cache_lookup
 from antarest.core.jwt import JWTUser
 from antarest.core.model import PermissionInfo, StudyPermissionType
 from antarest.core.permissions import check_permission
 from antarest.core.requests import UserHasNotPermissionError
 from antarest.core.utils.archives import is_archive_format
+from antarest.core.utils.file_copy import CopyMode, copy_tree
 from antarest.core.utils.utils import StopWatch
 from antarest.study.model import (
     DEFAULT_WORKSPACE_NAME,
@@ -175,15 +176,43 @@ def is_managed(study: Study) -> bool:
     return not hasattr(study, "workspace") or study.workspace == DEFAULT_WORKSPACE_NAME
 
 
-def remove_from_cache(cache: ICache, root_id: str) -> None:
+def remove_from_cache(cache: ICache, root_id: str, *other_ids: str) -> None:
     cache.invalidate_all(
         [
-            f"{CacheConstants.RAW_STUDY}/{root_id}",
-            f"{CacheConstants.STUDY_FACTORY}/{root_id}",
+            key
+            for study_id in (root_id,) + other_ids
+            for key in (
+                f"{CacheConstants.RAW_STUDY}/{study_id}",
+                f"{CacheConstants.STUDY_FACTORY}/{study_id}",
+                f"{CacheConstants.STUDY_REVISION}/{study_id}",
+            )
         ]
     )
 
 
+def get_study_revision(cache: ICache, study_id: str) -> str:
+    """
+    Get the token identifying the current revision of the data of a study.
+
+    The token is created on demand, and is renewed each time the cache of the study
+    is invalidated with `remove_from_cache` (i.e. each time the study data is modified).
+
+    Args:
+        cache: The cache service.
+        study_id: The ID of the study.
+
+    Returns:
+        A random token, which stays the same until the study data is modified.
+    """
+    cache_id = f"{CacheConstants.STUDY_REVISION}/{study_id}"
+    data = cache.get(cache_id)
+    record_cache_lookup(CacheConstants.STUDY_REVISION, data)
+    if data is None:
+        data = {"revision": uuid4().hex}
+        cache.put(cache_id, data)
+    return t.cast(str, data["revision"])
+
+
 def create_new_empty_study(version: StudyVersion, path_study: Path, path_resources: Path) -> None:
     version_template: t.Optional[str] = STUDY_REFERENCE_TEMPLATES.get(version, None)
     if version_template is None:
@@ -364,6 +393,7 @@ def export_study_flat(
     output_list_filter: t.Optional[t.List[str]] = None,
     denormalize: bool = True,
     output_src_path: t.Optional[Path] = None,
+    copy_mode: CopyMode = CopyMode.COPY,
 ) -> None:
     start_time = time.time()
 
@@ -373,7 +403,7 @@ def export_study_flat(
     def ignore_outputs(directory: str, _: t.Sequence[str]) -> t.Sequence[str]:
         return ["output"] if str(directory) == str(study_dir) else []
 
-    shutil.copytree(src=study_dir, dst=dest, ignore=ignore_outputs)
+    copy_tree(study_dir, dest, copy_mode, ignore=ignore_outputs)
 
     if outputs and output_src_path.exists():
         if output_list_filter is None:
@@ -390,10 +420,7 @@ def export_study_flat(
                 with ZipFile(zip_path) as zf:
                     zf.extractall(output_dest_path / output)
             else:
-                shutil.copytree(
-                    src=output_src_path / output,
-                    dst=output_dest_path / output,
-                )
+                copy_tree(output_src_path / output, output_dest_path / output, copy_mode)
 
     stop_time = time.time()
     duration = "{:.3f}".format(stop_time - start_time)
@@ -0,0 +1,72 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import typing as t
+
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_comments import UpdateComments
+from antarest.study.storage.variantstudy.model.command.update_config import _ENR_MODELLING_KEY, UpdateConfig
+from antarest.study.storage.variantstudy.model.command.update_raw_file import UpdateRawFile
+
+# Target of the `UpdateComments` command
+_COMMENTS_TARGET = "settings/comments"
+
+
+def _get_overwritten_target(command: ICommand) -> t.Optional[str]:
+    """
+    Returns the target of the study which is entirely overwritten by the command,
+    if the command does nothing else: it doesn't read the study data nor change its configuration.
+    """
+    if isinstance(command, UpdateConfig):
+        # The update of the renewable generation modelling also changes the study configuration
+        if f"{_ENR_MODELLING_KEY}/".startswith(f"{command.target}/"):
+            return None
+        return command.target
+    if isinstance(command, (ReplaceMatrix, UpdateRawFile)):
+        return command.target
+    if isinstance(command, UpdateComments):
+        return _COMMENTS_TARGET
+    return None
+
+
+def compact_commands(commands: t.Sequence[t.Sequence[ICommand]]) -> t.List[int]:
+    """
+    Find the commands of a variant which are useless, because they are overwritten by later commands.
+
+    A command which overwrites a target of the study (`UpdateConfig`, `ReplaceMatrix`, `UpdateRawFile`,
+    `UpdateComments`) is useless if the same target is overwritten later, and if all the commands
+    in between only overwrite other targets. Any other command (creation or removal of an area,
+    time series generation...) may read the study data, so the commands before it are kept.
+
+    Args:
+        commands: The list of commands of the variant (a command block may contain several commands).
+
+    Returns:
+        The indexes of the command blocks to keep, so that the generated snapshot is the same.
+    """
+    kept: t.List[int] = []
+    # Targets overwritten by the following commands
+    overwritten: t.Set[str] = set()
+    for index in range(len(commands) - 1, -1, -1):
+        is_useful = False
+        for command in reversed(commands[index]):
+            target = _get_overwritten_target(command)
+            if target is None:
+                overwritten.clear()
+                is_useful = True
+            elif target not in overwritten:
+                overwritten.add(target)
+                is_useful = True
+        if is_useful or not commands[index]:
+            kept.append(index)
+    return kept[::-1]
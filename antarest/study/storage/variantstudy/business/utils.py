@@ -10,6 +10,8 @@
 #
 # This file is part of the Antares project.
 
+import contextlib
+import contextvars
 import typing as t
 
 from antarest.core.model import JSON
@@ -21,6 +23,28 @@ from antarest.study.storage.variantstudy.business.matrix_constants_generator imp
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
 from antarest.study.storage.variantstudy.model.model import CommandDTO
 
+_KNOWN_MATRICES: contextvars.ContextVar[t.FrozenSet[str]] = contextvars.ContextVar(
+    "known_matrices", default=frozenset()
+)
+
+
+@contextlib.contextmanager
+def known_matrices(matrix_ids: t.Iterable[str]) -> t.Iterator[None]:
+    """
+    Context manager used to declare matrices whose existence has already been checked.
+
+    Inside this context, `validate_matrix` doesn't query the matrix service for these matrices.
+    This is used to validate a batch of commands with a single existence check.
+
+    Args:
+        matrix_ids: IDs of the matrices known to exist in the matrix service.
+    """
+    token = _KNOWN_MATRICES.set(_KNOWN_MATRICES.get() | frozenset(matrix_ids))
+    try:
+        yield
+    finally:
+        _KNOWN_MATRICES.reset(token)
+
 
 def validate_matrix(matrix: t.Union[t.List[t.List[MatrixData]], str], values: t.Dict[str, t.Any]) -> str:
     """
@@ -49,7 +73,7 @@ def validate_matrix(matrix: t.Union[t.List[t.List[MatrixData]], str], values: t.
     elif isinstance(matrix, str):
         if not matrix:
             raise ValueError("The matrix ID cannot be empty")
-        elif matrix_service.exists(matrix):
+        elif matrix in _KNOWN_MATRICES.get() or matrix_service.exists(matrix):
             return MATRIX_PROTOCOL_PREFIX + matrix
         else:
             raise ValueError(f"Matrix with id '{matrix}' does not exist")
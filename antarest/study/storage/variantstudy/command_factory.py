@@ -10,7 +10,9 @@
 #
 # This file is part of the Antares project.
 
+import contextlib
 import copy
+import re
 import typing as t
 
 from antares.study.version import StudyVersion
@@ -19,6 +21,7 @@ from antarest.core.model import JSON
 from antarest.matrixstore.service import ISimpleMatrixService
 from antarest.study.storage.patch_service import PatchService
 from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
+from antarest.study.storage.variantstudy.business.utils import known_matrices
 from antarest.study.storage.variantstudy.model.command.common import CommandName
 from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
 from antarest.study.storage.variantstudy.model.command.create_binding_constraint import CreateBindingConstraint
@@ -81,6 +84,27 @@ COMMAND_MAPPING = {
     CommandName.REMOVE_USER_RESOURCE.value: RemoveUserResource,
 }
 
+# Matrix IDs are SHA256 hashes
+_MATRIX_ID_REGEX = re.compile(r"[0-9a-f]{64}")
+
+
+def _collect_matrix_ids(obj: t.Any, matrix_ids: t.Set[str]) -> None:
+    """Collect the strings which look like a matrix ID in the (nested) command arguments."""
+    if isinstance(obj, str):
+        if _MATRIX_ID_REGEX.fullmatch(obj):
+            matrix_ids.add(obj)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _collect_matrix_ids(value, matrix_ids)
+    elif isinstance(obj, list):
+        # Skip the matrices given as arrays of numbers
+        first = obj[0] if obj else None
+        if isinstance(first, list):
+            first = first[0] if first else None
+        if not isinstance(first, (int, float)):
+            for value in obj:
+                _collect_matrix_ids(value, matrix_ids)
+
 
 class CommandFactory:
     """
@@ -114,6 +138,24 @@ class CommandFactory:
             )
         raise NotImplementedError(action)
 
+    @contextlib.contextmanager
+    def prefetch_matrices(self, cmd_dto_list: t.Iterable[CommandDTO]) -> t.Iterator[None]:
+        """
+        Context manager which checks the existence of all the matrices referenced by the given commands at once.
+
+        Inside this context, the conversion of these commands doesn't query the matrix service
+        for each matrix reference: the IDs of the existing matrices are injected in the validators.
+
+        Args:
+            cmd_dto_list: The CommandDTO objects which will be converted.
+        """
+        matrix_ids: t.Set[str] = set()
+        for command_dto in cmd_dto_list:
+            _collect_matrix_ids(command_dto.args, matrix_ids)
+        existing_ids = self.command_context.matrix_service.exists_many(matrix_ids) if matrix_ids else set()
+        with known_matrices(existing_ids):
+            yield
+
     def to_command(self, command_dto: CommandDTO) -> t.List[ICommand]:
         """
         Convert a CommandDTO to a list of ICommand.
@@ -163,4 +205,5 @@ class CommandFactory:
         Raises:
             NotImplementedError: If the argument type is not implemented.
         """
-        return [cmd for dto in cmd_dto_list for cmd in self.to_command(dto)]
+        with self.prefetch_matrices(cmd_dto_list):
+            return [cmd for dto in cmd_dto_list for cmd in self.to_command(dto)]
@@ -77,7 +77,8 @@ class ICommand(ABC, AntaresBaseModel, extra="forbid", arbitrary_types_allowed=Tr
         Returns:
             The command output.
         """
-        output, _ = self._apply_config(study_data)
+        with study_data.modifying():
+            output, _ = self._apply_config(study_data)
         return output
 
     @abstractmethod
@@ -105,7 +106,10 @@ class ICommand(ABC, AntaresBaseModel, extra="forbid", arbitrary_types_allowed=Tr
             The output of the command execution.
         """
         try:
-            return self._apply(study_data, listener)
+            # The command may modify the configuration of the study (areas, clusters...)
+            # so the memoised nodes of the study tree must not be reused meanwhile.
+            with study_data.config.modifying():
+                return self._apply(study_data, listener)
         except Exception as e:
             logger.warning(
                 f"Failed to execute variant command {self.command_name}",
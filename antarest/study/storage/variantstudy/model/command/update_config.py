@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import logging
 import typing as t
 
 import typing_extensions as te
@@ -18,11 +19,14 @@ from antarest.core.model import JSON
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy
 from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
+from antarest.study.storage.rawstudy.model.filesystem.inode import INode
 from antarest.study.storage.variantstudy.model.command.common import CommandName, CommandOutput
 from antarest.study.storage.variantstudy.model.command.icommand import MATCH_SIGNATURE_SEPARATOR, ICommand
 from antarest.study.storage.variantstudy.model.command_listener.command_listener import ICommandListener
 from antarest.study.storage.variantstudy.model.model import CommandDTO
 
+logger = logging.getLogger(__name__)
+
 _ENR_MODELLING_KEY = "settings/generaldata/other preferences/renewable-generation-modelling"
 
 _Data: te.TypeAlias = t.Union[str, int, float, bool, JSON, None]
@@ -78,6 +82,56 @@ class UpdateConfig(ICommand):
         output, _ = self._apply_config(study_data.config)
         return output
 
+    @classmethod
+    def apply_batch(
+        cls,
+        commands: t.Sequence["UpdateConfig"],
+        study_data: FileStudy,
+        listener: t.Optional[ICommandListener] = None,
+    ) -> CommandOutput:
+        """
+        Apply several commands at once, writing each targeted INI file only once.
+
+        Args:
+            commands: The commands to apply, in order.
+            study_data: The study data to be applied.
+            listener: Can be used by the command to notify anyone giving one.
+
+        Returns:
+            The output of the execution, which fails if any of the targets is invalid.
+        """
+        try:
+            with study_data.config.modifying():
+                return cls._apply_batch(commands, study_data)
+        except Exception as e:
+            logger.warning(f"Failed to execute variant command {CommandName.UPDATE_CONFIG}", exc_info=e)
+            message = f"Unexpected exception occurred when trying to apply command {CommandName.UPDATE_CONFIG}: {e}"
+            return CommandOutput(status=False, message=message)
+
+    @classmethod
+    def _apply_batch(cls, commands: t.Sequence["UpdateConfig"], study_data: FileStudy) -> CommandOutput:
+        # Group the updates by INI file, the URL is split between the file and the section/key
+        updates_by_path: t.Dict[str, t.Tuple[IniFileNode, t.List[t.Tuple[_Data, t.List[str]]]]] = {}
+        for command in commands:
+            url = command.target.split("/")
+            for index in range(max(len(url) - 2, 1), len(url) + 1):
+                node: INode[t.Any, t.Any, t.Any] = study_data.tree.get_node(url[:index])
+                if isinstance(node, IniFileNode):
+                    updates_by_path.setdefault(str(node.path), (node, []))[1].append((command.data, url[index:]))
+                    break
+            else:
+                return CommandOutput(
+                    status=False,
+                    message=f"Study node at path {command.target} is invalid",
+                )
+
+        for ini_node, updates in updates_by_path.values():
+            ini_node.batch_save(updates)
+
+        for command in commands:
+            command._apply_config(study_data.config)
+        return CommandOutput(status=True, message="ok")
+
     def to_dto(self) -> CommandDTO:
         return CommandDTO(
             action=CommandName.UPDATE_CONFIG.value,
@@ -11,12 +11,14 @@
 # This file is part of the Antares project.
 
 import datetime
+import re
 import typing as t
 import uuid
 from pathlib import Path
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String  # type: ignore
-from sqlalchemy.orm import relationship  # type: ignore
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, event, inspect  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from sqlalchemy.orm import Mapper, relationship  # type: ignore
 
 from antarest.core.persistence import Base
 from antarest.core.serialization import from_json
@@ -90,6 +92,66 @@ class CommandBlock(Base):  # type: ignore
         )
 
 
+class CommandBlockMatrix(Base):  # type: ignore
+    """
+    Reference from a command block to a matrix used in its arguments.
+
+    The references are maintained each time a command block is inserted or updated,
+    and are deleted with the command block, so that the matrix garbage collector
+    can find the used matrices without parsing all the commands.
+    """
+
+    __tablename__ = "commandblock_matrix"
+
+    command_id: str = Column(
+        String(36),
+        ForeignKey("commandblock.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    matrix_id: str = Column(String(64), primary_key=True, index=True)
+
+    def __str__(self) -> str:
+        return f"CommandBlockMatrix(command_id={self.command_id!r}, matrix_id={self.matrix_id!r})"
+
+
+# Matrix IDs are SHA256 hashes, optionally prefixed by "matrix://" in the command arguments.
+_MATRIX_ID_REGEX = re.compile(r"(?<![0-9a-f])[0-9a-f]{64}(?![0-9a-f])")
+
+
+def extract_matrix_ids(args: str) -> t.Set[str]:
+    """
+    Extract the IDs of the matrices referenced in the JSON arguments of a command block.
+
+    The extraction doesn't need to parse the command: any SHA256 hash found in the arguments
+    is considered as a matrix reference, which can only prevent the deletion of an unused matrix.
+    """
+    return set(_MATRIX_ID_REGEX.findall(args or ""))
+
+
+def _save_matrix_references(connection: Connection, command_block: CommandBlock, *, replace: bool) -> None:
+    table = CommandBlockMatrix.__table__
+    if replace:
+        connection.execute(table.delete().where(table.c.command_id == command_block.id))
+    if matrix_ids := extract_matrix_ids(command_block.args):
+        connection.execute(
+            table.insert(),
+            [{"command_id": command_block.id, "matrix_id": matrix_id} for matrix_id in sorted(matrix_ids)],
+        )
+
+
+def _on_command_block_inserted(mapper: Mapper, connection: Connection, command_block: CommandBlock) -> None:
+    _save_matrix_references(connection, command_block, replace=False)
+
+
+def _on_command_block_updated(mapper: Mapper, connection: Connection, command_block: CommandBlock) -> None:
+    if inspect(command_block).attrs.args.history.has_changes():
+        _save_matrix_references(connection, command_block, replace=True)
+
+
+event.listen(CommandBlock, "after_insert", _on_command_block_inserted)
+event.listen(CommandBlock, "after_update", _on_command_block_updated)
+
+
 class VariantStudy(Study):
     """
     Study filesystem based entity implementation.
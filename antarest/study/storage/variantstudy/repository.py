@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import datetime
 import typing as t
 
 from sqlalchemy.orm import Session, joinedload  # type: ignore
@@ -18,7 +19,15 @@ from antarest.core.interfaces.cache import ICache
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.study.model import Study
 from antarest.study.repository import StudyMetadataRepository
-from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
+from antarest.study.storage.variantstudy.model.dbmodel import (
+    CommandBlock,
+    CommandBlockMatrix,
+    VariantStudy,
+    VariantStudySnapshot,
+)
+
+# Maximum number of parameters in an `IN (...)` clause (SQLite is limited to 999 parameters).
+_IN_CHUNK_SIZE = 500
 
 
 class VariantStudyRepository(StudyMetadataRepository):
@@ -90,6 +99,47 @@ class VariantStudyRepository(StudyMetadataRepository):
         q = self.session.query(recursive_q)
         return [r[0] for r in q]
 
+    def get_descendant_ids(self, study_id: str) -> t.List[str]:
+        """
+        Retrieve the identifiers of all the descendants of a study (children, grandchildren, etc.),
+        with a single recursive query.
+
+        Args:
+            study_id: Unique identifier of the study.
+
+        Returns:
+            List of the descendant identifiers, parents before their children.
+        """
+        top_q = self.session.query(Study.id)
+        top_q = top_q.filter(Study.parent_id == study_id)
+        top_q = top_q.cte("descendant_cte", recursive=True)
+
+        bot_q = self.session.query(Study.id)
+        bot_q = bot_q.join(top_q, Study.parent_id == top_q.c.id)
+
+        recursive_q = top_q.union_all(bot_q)
+        q = self.session.query(recursive_q)
+        return [r[0] for r in q]
+
+    def invalidate_snapshots(self, variant_ids: t.Collection[str]) -> None:
+        """
+        Mark the snapshots of the given variants as out of date, and update their modification date,
+        with bulk updates.
+
+        Args:
+            variant_ids: IDs of the variants to invalidate.
+        """
+        ids = list(variant_ids)
+        now = datetime.datetime.utcnow()
+        session = self.session
+        for start in range(0, len(ids), _IN_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CHUNK_SIZE]
+            q = session.query(VariantStudySnapshot).filter(VariantStudySnapshot.id.in_(chunk))  # type: ignore
+            q.update({VariantStudySnapshot.last_executed_command: None}, synchronize_session="fetch")
+            q = session.query(Study).filter(Study.id.in_(chunk))
+            q.update({Study.updated_at: now}, synchronize_session="fetch")
+        session.commit()
+
     def get_all_command_blocks(self) -> t.List[CommandBlock]:
         """
         Get all command blocks.
@@ -100,6 +150,25 @@ class VariantStudyRepository(StudyMetadataRepository):
         cmd_blocks: t.List[CommandBlock] = self.session.query(CommandBlock).all()
         return cmd_blocks
 
+    def get_used_matrices(self, matrix_ids: t.Collection[str]) -> t.Set[str]:
+        """
+        Get the matrices referenced by at least one command block.
+
+        Args:
+            matrix_ids: IDs of the matrices to check.
+
+        Returns:
+            The subset of the given matrix IDs which are used in command blocks.
+        """
+        ids = list(set(matrix_ids))
+        used: t.Set[str] = set()
+        for start in range(0, len(ids), _IN_CHUNK_SIZE):
+            chunk = ids[start : start + _IN_CHUNK_SIZE]
+            q = self.session.query(CommandBlockMatrix.matrix_id).distinct()
+            q = q.filter(CommandBlockMatrix.matrix_id.in_(chunk))  # type: ignore
+            used.update(r[0] for r in q)
+        return used
+
     def find_variants(self, variant_ids: t.Sequence[str]) -> t.Sequence[VariantStudy]:
         """
         Find a list of variants by IDs
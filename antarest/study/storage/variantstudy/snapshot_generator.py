@@ -24,6 +24,7 @@ from antarest.core.interfaces.cache import CacheConstants, ICache
 from antarest.core.jwt import JWTUser
 from antarest.core.model import StudyPermissionType
 from antarest.core.tasks.service import ITaskNotifier, NoopNotifier
+from antarest.core.utils.metrics import Histogram
 from antarest.study.model import RawStudy, StudyAdditionalData
 from antarest.study.storage.patch_service import PatchService
 from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfigDTO
@@ -42,6 +43,11 @@ logger = logging.getLogger(__name__)
 
 OUTPUT_RELATIVE_PATH = "output"
 
+_GENERATE_SNAPSHOT_SECONDS = Histogram(
+    "antarest_snapshot_generation_seconds",
+    "Duration of the generation of variant study snapshots (`SnapshotGenerator.generate_snapshot`)",
+)
+
 
 class SnapshotGenerator:
     """
@@ -64,6 +70,7 @@ class SnapshotGenerator:
         self.patch_service = patch_service
         self.repository = repository
 
+    @_GENERATE_SNAPSHOT_SECONDS.time()
     def generate_snapshot(
         self,
         variant_study_id: str,
@@ -160,6 +167,7 @@ class SnapshotGenerator:
                 self.study_factory,
                 denormalize=False,  # de-normalization is done at the end
                 outputs=False,  # do NOT export outputs
+                copy_mode=self.raw_study_service.config.storage.copy_mode,
             )
         elif isinstance(ref_study, RawStudy):
             self.raw_study_service.export_study_flat(
@@ -178,7 +186,9 @@ class SnapshotGenerator:
         cmd_blocks: t.Sequence[CommandBlock],
         listener: t.Optional[ICommandListener] = None,
     ) -> GenerationResultInfoDTO:
-        commands = [self.command_factory.to_command(cb.to_dto()) for cb in cmd_blocks]
+        command_dtos = [cb.to_dto() for cb in cmd_blocks]
+        with self.command_factory.prefetch_matrices(command_dtos):
+            commands = [self.command_factory.to_command(dto) for dto in command_dtos]
         generator = VariantCommandGenerator(self.study_factory)
         results = generator.generate(
             commands,
@@ -58,6 +58,7 @@ from antarest.study.storage.rawstudy.model.filesystem.config.model import FileSt
 from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy, StudyFactory
 from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
 from antarest.study.storage.utils import assert_permission, export_study_flat, is_managed, remove_from_cache
+from antarest.study.storage.variantstudy.business.command_compactor import compact_commands
 from antarest.study.storage.variantstudy.business.utils import transform_command_to_dto
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
 from antarest.study.storage.variantstudy.model.command.icommand import ICommand
@@ -146,12 +147,13 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
 
     def _check_commands_validity(self, study_id: str, commands: t.List[CommandDTO]) -> t.List[ICommand]:
         command_objects: t.List[ICommand] = []
-        for i, command in enumerate(commands):
-            try:
-                command_objects.extend(self.command_factory.to_command(command))
-            except Exception as e:
-                logger.error(f"Command at index {i} for study {study_id}", exc_info=e)
-                raise CommandNotValid(f"Command at index {i} for study {study_id}") from None
+        with self.command_factory.prefetch_matrices(commands):
+            for i, command in enumerate(commands):
+                try:
+                    command_objects.extend(self.command_factory.to_command(command))
+                except Exception as e:
+                    logger.error(f"Command at index {i} for study {study_id}", exc_info=e)
+                    raise CommandNotValid(f"Command at index {i} for study {study_id}") from None
         return command_objects
 
     def _check_update_authorization(self, metadata: VariantStudy) -> None:
@@ -316,6 +318,32 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
         study.commands = []
         self.invalidate_cache(study, invalidate_self_snapshot=True)
 
+    def compact_commands(self, study_id: str, params: RequestParameters) -> int:
+        """
+        Remove the commands which are overwritten by later commands (see `compact_commands`),
+        the generated snapshot is the same but faster to generate.
+
+        Args:
+            study_id: study id
+            params: request parameters
+        Returns: the number of removed commands
+        """
+        study = self._get_variant_study(study_id, params)
+        self._check_update_authorization(study)
+
+        dto_list = [command.to_dto() for command in study.commands]
+        with self.command_factory.prefetch_matrices(dto_list):
+            commands = [self.command_factory.to_command(dto) for dto in dto_list]
+        kept = compact_commands(commands)
+        removed_count = len(study.commands) - len(kept)
+        if removed_count:
+            logger.info(f"Compacting the commands of variant study {study_id}: {removed_count} commands removed")
+            study.commands = [study.commands[index] for index in kept]
+            for idx, command in enumerate(study.commands):
+                command.index = idx
+            self.invalidate_cache(study, invalidate_self_snapshot=True)
+        return removed_count
+
     def update_command(
         self,
         study_id: str,
@@ -399,15 +427,23 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
         variant_study: Study,
         invalidate_self_snapshot: bool = False,
     ) -> None:
-        remove_from_cache(self.cache, variant_study.id)
+        """
+        Invalidate the cache of a study, and the cache and snapshots of all its descendants.
+
+        Args:
+            variant_study: study to invalidate (raw study or variant).
+            invalidate_self_snapshot: whether the snapshot of the study itself must be marked as out of date.
+        """
+        descendant_ids = self.repository.get_descendant_ids(variant_study.id)
+        remove_from_cache(self.cache, variant_study.id, *descendant_ids)
         if isinstance(variant_study, VariantStudy) and variant_study.snapshot and invalidate_self_snapshot:
             variant_study.snapshot.last_executed_command = None
         self.repository.save(
             metadata=variant_study,
             update_modification_date=True,
         )
-        for child in self.repository.get_children(parent_id=variant_study.id):
-            self.invalidate_cache(child, invalidate_self_snapshot=True)
+        if descendant_ids:
+            self.repository.invalidate_snapshots(descendant_ids)
 
     def clear_snapshot(self, variant_study: Study) -> None:
         logger.info(f"Clearing snapshot for study {variant_study.id}")
@@ -764,11 +800,9 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
         return commands, notify
 
     def _to_commands(self, metadata: VariantStudy, from_index: int = 0) -> t.List[t.List[ICommand]]:
-        commands: t.List[t.List[ICommand]] = [
-            self.command_factory.to_command(command_block.to_dto())
-            for index, command_block in enumerate(metadata.commands)
-            if from_index <= index
-        ]
+        command_dtos = [command_block.to_dto() for command_block in metadata.commands[from_index:]]
+        with self.command_factory.prefetch_matrices(command_dtos):
+            commands: t.List[t.List[ICommand]] = [self.command_factory.to_command(dto) for dto in command_dtos]
         return commands
 
     def _generate_config(
@@ -1039,6 +1073,7 @@ class VariantStudyService(AbstractStorageService[VariantStudy]):
             output_list_filter,
             denormalize,
             output_src_path,
+            copy_mode=self.config.storage.copy_mode,
         )
 
     def get_synthesis(
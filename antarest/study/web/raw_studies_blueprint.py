@@ -17,7 +17,7 @@ import logging
 import typing as t
 from pathlib import Path, PurePosixPath
 
-from fastapi import APIRouter, Body, Depends, File, HTTPException
+from fastapi import APIRouter, Body, Depends, File, Header, HTTPException
 from fastapi.params import Param, Query
 from starlette.responses import FileResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 
@@ -89,6 +89,15 @@ def _split_comma_separated_values(value: str, *, default: t.Sequence[str] = ())
     return list(collections.OrderedDict.fromkeys(values))
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check if the value of the `If-None-Match` header matches the given `ETag` (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    # weak comparison: the "W/" prefix is ignored, as recommended for `If-None-Match` (RFC 9110)
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
 def create_raw_study_routes(
     study_service: StudyService,
     config: Config,
@@ -115,6 +124,7 @@ def create_raw_study_routes(
         path: str = Param("/", examples=get_path_examples()),  # type: ignore
         depth: int = 3,
         formatted: bool = True,
+        if_none_match: t.Optional[str] = Header(None),
         current_user: JWTUser = Depends(auth.get_current_user),
     ) -> t.Any:
         """
@@ -129,12 +139,23 @@ def create_raw_study_routes(
 
         Returns the fetched data: a JSON object (in most cases), a plain text file
         or a file attachment (Microsoft Office document, TSV/TSV file...).
+
+        The data of managed studies is returned with an `ETag` header: if the `If-None-Match`
+        header of the request matches the current `ETag`, a "304 Not Modified" response is returned.
         """
         logger.info(
             f"📘 Fetching data at {path} (depth={depth}) from study {uuid}",
             extra={"user": current_user.id},
         )
         parameters = RequestParameters(user=current_user)
+        etag = study_service.get_etag(uuid, path, depth=depth, formatted=formatted, params=parameters)
+        if etag is not None:
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if if_none_match and _etag_matches(if_none_match, etag):
+                return Response(status_code=http.HTTPStatus.NOT_MODIFIED, headers=headers)
+        else:
+            headers = {}
+
         output = study_service.get(uuid, path, depth=depth, formatted=formatted, params=parameters)
 
         if isinstance(output, bytes):
@@ -150,7 +171,7 @@ def create_raw_study_routes(
                 # that checks `NaN` and `Infinity` values.
                 try:
                     output = from_json(output)
-                    return JSONResponse(content=output)
+                    return JSONResponse(content=output, headers=headers)
                 except ValueError as exc:
                     raise HTTPException(
                         status_code=http.HTTPStatus.UNPROCESSABLE_ENTITY,
@@ -158,7 +179,7 @@ def create_raw_study_routes(
                     ) from None
             elif encoding:
                 try:
-                    response = PlainTextResponse(output, media_type=content_type)
+                    response = PlainTextResponse(output, media_type=content_type, headers=headers)
                     response.charset = encoding
                     return response
 
@@ -168,7 +189,7 @@ def create_raw_study_routes(
                         detail=f"Invalid plain text configuration in path '{path}': {exc}",
                     ) from None
             elif content_type:
-                headers = {"Content-Disposition": f"attachment; filename={resource_path.name}"}
+                headers["Content-Disposition"] = f"attachment; filename={resource_path.name}"
                 return StreamingResponse(
                     io.BytesIO(output),
                     media_type=content_type,
@@ -177,14 +198,14 @@ def create_raw_study_routes(
             else:
                 # Unknown content types are considered binary,
                 # because it's better to avoid raising an exception.
-                return Response(content=output, media_type="application/octet-stream")
+                return Response(content=output, media_type="application/octet-stream", headers=headers)
 
         # We want to allow `NaN`, `+Infinity`, and `-Infinity` values in the JSON response
         # even though they are not standard JSON values because they are supported in JavaScript.
         # Additionally, we cannot use `orjson` because, despite its superior performance, it converts
         # `NaN` and other values to `null`, even when using a custom encoder.
         json_response = to_json(output)
-        return Response(content=json_response, media_type="application/json")
+        return Response(content=json_response, media_type="application/json", headers=headers)
 
     @bp.delete(
         "/studies/{uuid}/raw",
@@ -366,6 +366,31 @@ def create_study_variant_routes(
         sanitized_uuid = sanitize_uuid(uuid)
         variant_study_service.remove_all_commands(sanitized_uuid, params)
 
+    @bp.post(
+        "/studies/{uuid}/commands/compact",
+        tags=[APITag.study_variant_management],
+        summary="Remove the variant's commands overwritten by later commands",
+        response_model=int,
+    )
+    def compact_commands(
+        uuid: str,
+        current_user: JWTUser = Depends(auth.get_current_user),
+    ) -> int:
+        """
+        Remove the commands of the variant which are useless because their target
+        (configuration, matrix, file...) is overwritten by a later command.
+        The generated snapshot is the same, but faster to generate.
+
+        Returns the number of removed commands.
+        """
+        logger.info(
+            f"Compacting commands of variant study {uuid}",
+            extra={"user": current_user.id},
+        )
+        params = RequestParameters(user=current_user)
+        sanitized_uuid = sanitize_uuid(uuid)
+        return variant_study_service.compact_commands(sanitized_uuid, params)
+
     @bp.put(
         "/studies/{uuid}/generate",
         tags=[APITag.study_variant_management],
@@ -11,7 +11,7 @@
 # This file is part of the Antares project.
 
 import logging
-import time
+import threading
 from abc import abstractmethod
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Union
@@ -106,9 +106,8 @@ class AbstractWorker(IService):
         # All the work is actually performed by callbacks
         # on events.
         # However, we want to keep the service alive while
-        # it waits for new events, so infinite loop ...
-        while True:
-            time.sleep(1)
+        # it waits for new events, so wait forever...
+        threading.Event().wait()
 
     async def _listen_for_tasks(self, event: Event) -> None:
         logger.info(f"Accepting new task {event.model_dump_json()}")
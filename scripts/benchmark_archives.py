@@ -0,0 +1,97 @@
+"""
+Throughput benchmark of the study archiving engine.
+
+Compares the parallel ZIP engine of `antarest.core.utils.archives` with a serial
+`zipfile` compression (the previous implementation of `archive_dir`),
+for archiving and unarchiving a directory.
+
+Usage:
+
+    PYTHONPATH=. python scripts/benchmark_archives.py                      # synthetic study-like data
+    PYTHONPATH=. python scripts/benchmark_archives.py --source path/to/study
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Callable, Optional
+
+import click
+import numpy as np
+
+from antarest.core.utils.archives import ZIP_COMPRESS_LEVEL, archive_dir, unzip
+
+
+def serial_archive_dir(src_dir_path: Path, target_archive_path: Path) -> None:
+    with zipfile.ZipFile(
+        target_archive_path, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL
+    ) as zipf:
+        for root, _, files in os.walk(src_dir_path):
+            for file in files:
+                path = os.path.join(root, file)
+                zipf.write(path, arcname=os.path.relpath(path, src_dir_path))
+
+
+def serial_unzip(dir_path: Path, zip_path: Path) -> None:
+    with zipfile.ZipFile(zip_path, mode="r") as zipf:
+        zipf.extractall(dir_path)
+
+
+def generate_study_like_data(target: Path, areas: int, rows: int = 8760, columns: int = 10) -> None:
+    """Generate TSV matrices similar to the time series of a study (one folder per area)."""
+    rng = np.random.default_rng(seed=42)
+    for index in range(areas):
+        area_dir = target / "input" / "load" / "series" / f"area{index}"
+        area_dir.mkdir(parents=True)
+        matrix = rng.integers(0, 10000, size=(rows, columns))
+        np.savetxt(area_dir / "load.txt", matrix, delimiter="\t", fmt="%d")
+        (area_dir / "properties.ini").write_text(f"[area{index}]\nname = area{index}\n")
+
+
+def dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def measure(label: str, size: int, func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    click.echo(f"{label:<24} {duration:8.2f} s {size / duration / 2**20:10.1f} MiB/s")
+    return duration
+
+
+@click.command("benchmark_archives")
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Directory to archive (synthetic data is generated if missing)",
+)
+@click.option("--areas", type=int, default=50, show_default=True, help="Number of areas of the synthetic data")
+def main(source: Optional[Path], areas: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        if source is None:
+            source = tmp_dir / "study"
+            generate_study_like_data(source, areas)
+        size = dir_size(source)
+        click.echo(f"Source: {source} ({size / 2**20:.1f} MiB)")
+
+        serial_zip = tmp_dir / "serial.zip"
+        parallel_zip = tmp_dir / "parallel.zip"
+        serial = measure("serial archive", size, lambda: serial_archive_dir(source, serial_zip))
+        parallel = measure("parallel archive", size, lambda: archive_dir(source, parallel_zip))
+        click.echo(f"archive speedup: x{serial / parallel:.2f}")
+
+        serial = measure("serial unarchive", size, lambda: serial_unzip(tmp_dir / "serial", parallel_zip))
+        parallel = measure("parallel unarchive", size, lambda: unzip(tmp_dir / "parallel", parallel_zip))
+        click.echo(f"unarchive speedup: x{serial / parallel:.2f}")
+        shutil.rmtree(tmp_dir / "serial")
+        shutil.rmtree(tmp_dir / "parallel")
+
+
+if __name__ == "__main__":
+    main()
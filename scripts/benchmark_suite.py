@@ -0,0 +1,547 @@
+"""
+Performance benchmark suite of the paths which dominate the production load.
+
+The studies are generated synthetically (with a configurable number of areas, thermal clusters
+and Monte-Carlo years), so that the suite runs offline and gives comparable results between runs:
+
+- `matrix_parse` / `matrix_dump`: parsing and writing of the input time series (`InputSeriesMatrix`),
+- `config_build`: building of the study configuration from the disk (`config/files.py` `build`),
+- `snapshot`: generation of the snapshot of a variant with N commands (`SnapshotGenerator`),
+- `aggregation`: aggregation of hourly simulation outputs (`AggregatorManager`),
+- `study_listing`: listing of many studies in the database (`StudyMetadataRepository.get_all`).
+
+Each benchmark is run once to warm up, then `--repeat` times: the minimum and median durations are
+reported, along with the memory peak (measured with `tracemalloc` in a separate run).
+The results can be saved with `--json` and compared with a previous run with `--baseline`:
+the command fails if a median duration is slower than the baseline by more than `--tolerance`.
+
+Usage:
+
+    PYTHONPATH=. python scripts/benchmark_suite.py --areas 10 --clusters 5 --years 5
+    PYTHONPATH=. python scripts/benchmark_suite.py --json results.json
+    PYTHONPATH=. python scripts/benchmark_suite.py --baseline results.json --only matrix_parse
+"""
+
+import dataclasses
+import datetime
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing as t
+import uuid
+import zipfile
+from pathlib import Path
+
+import click
+import numpy as np
+from sqlalchemy import create_engine  # type: ignore
+
+from antarest.core.cache.business.local_chache import LocalCache
+from antarest.core.config import Config, StorageConfig, WorkspaceConfig
+from antarest.core.jwt import DEFAULT_ADMIN_USER
+from antarest.core.model import JSON
+from antarest.core.serialization import to_json_string
+from antarest.core.utils.fastapi_sqlalchemy import DBSessionMiddleware, db
+from antarest.dbmodel import Base
+from antarest.login.model import Group, User
+from antarest.matrixstore.repository import MatrixContentRepository
+from antarest.matrixstore.service import SimpleMatrixService
+from antarest.matrixstore.uri_resolver_service import UriResolverService
+from antarest.study.business.aggregator_management import AggregatorManager, MCIndAreasQueryFile
+from antarest.study.model import STUDY_VERSION_8_8, RawStudy, StudyAdditionalData
+from antarest.study.repository import (
+    AccessPermissions,
+    StudyFilter,
+    StudyMetadataRepository,
+    StudyPagination,
+    StudySortBy,
+)
+from antarest.study.storage.patch_service import PatchService
+from antarest.study.storage.rawstudy.model.filesystem.config.files import build
+from antarest.study.storage.rawstudy.model.filesystem.factory import FileStudy, StudyFactory
+from antarest.study.storage.rawstudy.model.filesystem.matrix.input_series_matrix import InputSeriesMatrix
+from antarest.study.storage.rawstudy.model.filesystem.matrix.matrix import MatrixFrequency
+from antarest.study.storage.rawstudy.raw_study_service import RawStudyService
+from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
+from antarest.study.storage.variantstudy.command_factory import CommandFactory
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.create_cluster import CreateCluster
+from antarest.study.storage.variantstudy.model.command.create_link import CreateLink
+from antarest.study.storage.variantstudy.model.command.icommand import ICommand
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
+from antarest.study.storage.variantstudy.repository import VariantStudyRepository
+from antarest.study.storage.variantstudy.snapshot_generator import SnapshotGenerator
+
+RESOURCES_DIR = Path(__file__).parents[1] / "resources"
+
+HOURS = 8760
+OUTPUT_ID = "20240101-0000eco"
+# Workspace of the studies created by the `study_listing` benchmark
+LISTING_WORKSPACE = "benchmark"
+OUTPUT_VARIABLES = [
+    ("OV. COST", "Euro"),
+    ("OP. COST", "Euro"),
+    ("MRG. PRICE", "Euro"),
+    ("CO2 EMIS.", "Tons"),
+    ("BALANCE", "MWh"),
+    ("LOAD", "MWh"),
+    ("H. ROR", "MWh"),
+    ("NUCLEAR", "MWh"),
+    ("GAS", "MWh"),
+    ("WIND ONSHORE", "MWh"),
+    ("SOLAR PV", "MWh"),
+    ("UNSP. ENRG", "MWh"),
+]
+
+
+# ========================================================================================
+# Synthetic data
+# ========================================================================================
+
+
+@dataclasses.dataclass
+class BenchmarkContext:
+    """
+    Services and data shared by the benchmarks (everything is stored in a temporary directory).
+    """
+
+    root_dir: Path
+    matrix_service: SimpleMatrixService
+    command_factory: CommandFactory
+    study_factory: StudyFactory
+    study: FileStudy
+    rng: np.random.Generator
+
+    @property
+    def command_context(self) -> CommandContext:
+        return self.command_factory.command_context
+
+
+def create_context(root_dir: Path, seed: int) -> BenchmarkContext:
+    matrix_service = SimpleMatrixService(MatrixContentRepository(root_dir / "matrixstore"))
+    generator_matrix_constants = GeneratorMatrixConstants(matrix_service)
+    generator_matrix_constants.init_constant_matrices()
+    patch_service = PatchService()
+    command_factory = CommandFactory(
+        generator_matrix_constants=generator_matrix_constants,
+        matrix_service=matrix_service,
+        patch_service=patch_service,
+    )
+    # The cache is never used by the benchmarks: `use_cache=False` is used to create the studies
+    study_factory = StudyFactory(
+        matrix=matrix_service,
+        resolver=UriResolverService(matrix_service=matrix_service),
+        cache=LocalCache(),
+    )
+    study_path = root_dir / "study"
+    with zipfile.ZipFile(RESOURCES_DIR / "empty_study_880.zip") as zf:
+        zf.extractall(study_path)
+    study = study_factory.create_from_fs(study_path, "", use_cache=False)
+    return BenchmarkContext(
+        root_dir, matrix_service, command_factory, study_factory, study, rng=np.random.default_rng(seed)
+    )
+
+
+def generate_study(ctx: BenchmarkContext, areas: int, clusters: int, years: int) -> None:
+    """
+    Populate the study with areas linked in a chain, thermal clusters in each area,
+    and load and thermal time series of `years` columns, then write the matrices in the study.
+    """
+    commands: t.List[ICommand] = [
+        UpdateConfig(
+            target="settings/generaldata/general/nbyears",
+            data=years,
+            command_context=ctx.command_context,
+            study_version=STUDY_VERSION_8_8,
+        )
+    ]
+    for area in range(areas):
+        area_id = f"area{area:03d}"
+        commands.append(
+            CreateArea(area_name=area_id, command_context=ctx.command_context, study_version=STUDY_VERSION_8_8)
+        )
+        commands.append(_replace_series(ctx, f"input/load/series/load_{area_id}", years))
+        if area:
+            commands.append(
+                CreateLink(
+                    area1=f"area{area - 1:03d}",
+                    area2=area_id,
+                    command_context=ctx.command_context,
+                    study_version=STUDY_VERSION_8_8,
+                )
+            )
+        for cluster in range(clusters):
+            cluster_id = f"cluster{cluster:03d}"
+            commands.append(
+                CreateCluster(
+                    area_id=area_id,
+                    cluster_name=cluster_id,
+                    parameters={"group": "Gas", "unitcount": 2, "nominalcapacity": 500},
+                    command_context=ctx.command_context,
+                    study_version=STUDY_VERSION_8_8,
+                )
+            )
+            commands.append(_replace_series(ctx, f"input/thermal/series/{area_id}/{cluster_id}/series", years))
+    for command in commands:
+        output = command.apply(ctx.study)
+        assert output.status, output.message
+    # A managed study stores its matrices as TSV files, not as links to the matrix store
+    ctx.study.tree.denormalize()
+
+
+def _replace_series(ctx: BenchmarkContext, target: str, columns: int) -> ReplaceMatrix:
+    matrix = ctx.rng.integers(0, 10000, size=(HOURS, columns)).astype(float)
+    return ReplaceMatrix(
+        target=target,
+        matrix=matrix.tolist(),
+        command_context=ctx.command_context,
+        study_version=STUDY_VERSION_8_8,
+    )
+
+
+def _hourly_dates() -> t.List[str]:
+    start = datetime.datetime(2018, 1, 1)
+    dates = (start + datetime.timedelta(hours=hour) for hour in range(HOURS))
+    return [f"{d.day:02d}\t{d.strftime('%b').upper()}\t{d.hour:02d}:00" for d in dates]
+
+
+def generate_outputs(ctx: BenchmarkContext, areas: int, years: int) -> None:
+    """
+    Write hourly `values` files of an economy simulation, for each Monte-Carlo year and each area.
+    """
+    dates = _hourly_dates()
+    names = "\t".join(name for name, _ in OUTPUT_VARIABLES)
+    units = "\t".join(unit for _, unit in OUTPUT_VARIABLES)
+    blanks = "\t" * (len(OUTPUT_VARIABLES) - 1)
+    mc_ind_dir = ctx.study.config.study_path / "output" / OUTPUT_ID / "economy" / "mc-ind"
+    for year in range(1, years + 1):
+        for area in range(areas):
+            area_id = f"area{area:03d}"
+            values = ctx.rng.normal(loc=1000, scale=300, size=(HOURS, len(OUTPUT_VARIABLES))).round(2)
+            lines = [
+                f"{area_id}\tarea\tva\thourly",
+                "\tVARIABLES\tBEGIN\tEND",
+                f"\t{len(OUTPUT_VARIABLES)}\t1\t{HOURS}",
+                "",
+                f"{area_id}\thourly\t\t\t\t{names}",
+                f"\t\t\t\t\t{units}",
+                f"\tindex\tday\tmonth\thour\t{blanks}",
+            ]
+            lines.extend(
+                f"\t{index}\t{date}\t" + "\t".join(map(str, row))
+                for index, (date, row) in enumerate(zip(dates, values.tolist()), start=1)
+            )
+            area_dir = mc_ind_dir / f"{year:05d}" / "areas" / area_id
+            area_dir.mkdir(parents=True)
+            (area_dir / "values-hourly.txt").write_text("\n".join(lines) + "\n")
+
+
+# ========================================================================================
+# Measurements
+# ========================================================================================
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    durations: t.List[float]
+    memory_peak: int
+
+    @property
+    def min(self) -> float:
+        return min(self.durations)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.durations)
+
+    def to_json(self) -> t.Dict[str, t.Any]:
+        return {"min": self.min, "median": self.median, "durations": self.durations, "memory_peak": self.memory_peak}
+
+
+def measure(name: str, func: t.Callable[[], t.Any], repeat: int) -> BenchmarkResult:
+    """
+    Measure the durations of `func` (after a warm-up run) and its memory peak (in a separate run,
+    because `tracemalloc` slows down the allocations).
+    """
+    func()
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, memory_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, durations, memory_peak)
+
+
+# ========================================================================================
+# Benchmarks
+# ========================================================================================
+
+
+def _series_nodes(ctx: BenchmarkContext) -> t.List[InputSeriesMatrix]:
+    nodes = []
+    for area_id, area in ctx.study.config.areas.items():
+        nodes.append(ctx.study.tree.get_node(["input", "load", "series", f"load_{area_id}"]))
+        for cluster in area.thermals:
+            nodes.append(ctx.study.tree.get_node(["input", "thermal", "series", area_id, cluster.id, "series"]))
+    return [t.cast(InputSeriesMatrix, node) for node in nodes]
+
+
+def bench_matrix_parse(ctx: BenchmarkContext) -> t.Callable[[], t.Any]:
+    nodes = _series_nodes(ctx)
+    return lambda: [node.parse() for node in nodes]
+
+
+def bench_matrix_dump(ctx: BenchmarkContext) -> t.Callable[[], t.Any]:
+    nodes = _series_nodes(ctx)
+    matrices = [t.cast(JSON, node.parse()) for node in nodes]
+
+    def _dump() -> None:
+        for node, matrix in zip(nodes, matrices):
+            node.dump(matrix)
+
+    return _dump
+
+
+def bench_config_build(ctx: BenchmarkContext) -> t.Callable[[], t.Any]:
+    return lambda: build(ctx.study.config.study_path, "bench")
+
+
+def bench_aggregation(ctx: BenchmarkContext) -> t.Callable[[], t.Any]:
+    manager = AggregatorManager(
+        ctx.study.config.study_path,
+        OUTPUT_ID,
+        MCIndAreasQueryFile.VALUES,
+        MatrixFrequency.HOURLY,
+        ids_to_consider=[],
+        columns_names=[],
+    )
+    return manager.aggregate_output_data
+
+
+def _setup_database(ctx: BenchmarkContext) -> None:
+    engine = create_engine(f"sqlite:///{ctx.root_dir / 'database.db'}", echo=False)
+    Base.metadata.create_all(engine)
+    DBSessionMiddleware(None, custom_engine=engine, session_args={"autocommit": False, "autoflush": False})
+
+
+def bench_snapshot(ctx: BenchmarkContext, commands: int) -> t.Callable[[], t.Any]:
+    """
+    Generate the snapshot of a variant of the synthetic study, from scratch, with `commands` commands:
+    each new area has its load series replaced.
+    """
+    cache = LocalCache()
+    config = Config(
+        storage=StorageConfig(
+            tmp_dir=ctx.root_dir / "tmp",
+            workspaces={"default": WorkspaceConfig(path=ctx.root_dir / "internal_studies")},
+        ),
+    )
+    patch_service = ctx.command_factory.command_context.patch_service
+    raw_study_service = RawStudyService(
+        config=config,
+        study_factory=ctx.study_factory,
+        path_resources=RESOURCES_DIR,
+        patch_service=patch_service,
+        cache=cache,
+    )
+    repository = VariantStudyRepository(cache)
+    generator = SnapshotGenerator(
+        cache=cache,
+        raw_study_service=raw_study_service,
+        command_factory=ctx.command_factory,
+        study_factory=ctx.study_factory,
+        patch_service=patch_service,
+        repository=repository,
+    )
+
+    variant_commands: t.List[ICommand] = []
+    while len(variant_commands) < commands:
+        area_id = f"variant_area{len(variant_commands):04d}"
+        variant_commands.append(
+            CreateArea(area_name=area_id, command_context=ctx.command_context, study_version=STUDY_VERSION_8_8)
+        )
+        variant_commands.append(_replace_series(ctx, f"input/load/series/load_{area_id}", 1))
+    dtos = [command.to_dto() for command in variant_commands[:commands]]
+
+    now = datetime.datetime.utcnow()
+    root_study = RawStudy(
+        id=str(uuid.uuid4()),
+        name="bench",
+        path=str(ctx.study.config.study_path),
+        version="880",
+        workspace="default",
+        created_at=now,
+        updated_at=now,
+        additional_data=StudyAdditionalData(author="bench"),
+    )
+    variant_id = str(uuid.uuid4())
+    variant = VariantStudy(
+        id=variant_id,
+        name="bench-variant",
+        parent_id=root_study.id,
+        path=str(ctx.root_dir / "variants" / variant_id),
+        version=root_study.version,
+        created_at=now,
+        updated_at=now,
+        additional_data=StudyAdditionalData(author="bench"),
+        commands=[
+            CommandBlock(
+                command=dto.action,
+                args=to_json_string(dto.args),
+                index=index,
+                version=dto.version,
+                study_version=str(dto.study_version),
+            )
+            for index, dto in enumerate(dtos)
+        ],
+    )
+    with db():
+        db.session.add_all([root_study, variant])
+        db.session.commit()
+
+    def _generate() -> None:
+        with db():
+            result = generator.generate_snapshot(variant_id, DEFAULT_ADMIN_USER, denormalize=False, from_scratch=True)
+            assert result.success, result
+
+    return _generate
+
+
+def bench_study_listing(ctx: BenchmarkContext, studies: int) -> t.Callable[[], t.Any]:
+    """
+    List a page of studies (with their owners and groups) among `studies` rows, sorted by name.
+
+    The rows are created in a dedicated workspace, so that the studies created by the other benchmarks
+    in the same database are not listed.
+    """
+    now = datetime.datetime.utcnow()
+    with db():
+        users = [User(id=1000 + i, name=f"user{i}") for i in range(10)]
+        groups = [Group(id=f"group{i}", name=f"group{i}") for i in range(10)]
+        db.session.add_all(users + groups)
+        db.session.add_all(
+            RawStudy(
+                id=str(uuid.uuid4()),
+                name=f"study{i:06d}",
+                path=str(ctx.root_dir / "studies" / f"study{i:06d}"),
+                version="880",
+                workspace=LISTING_WORKSPACE,
+                created_at=now,
+                updated_at=now,
+                owner=users[i % len(users)],
+                groups=[groups[i % len(groups)]],
+                additional_data=StudyAdditionalData(author=f"user{i % len(users)}", horizon="2030"),
+            )
+            for i in range(studies)
+        )
+        db.session.commit()
+
+    repository = StudyMetadataRepository(LocalCache())
+    study_filter = StudyFilter(workspace=LISTING_WORKSPACE, access_permissions=AccessPermissions(is_admin=True))
+    pagination = StudyPagination(page_nb=0, page_size=100)
+
+    def _list_studies() -> None:
+        with db():
+            repository.count_studies(study_filter)
+            page = repository.get_all(study_filter, StudySortBy.NAME_ASC, pagination)
+            assert len(page) == min(studies, pagination.page_size)
+
+    return _list_studies
+
+
+BENCHMARKS = ("matrix_parse", "matrix_dump", "config_build", "snapshot", "aggregation", "study_listing")
+
+
+def _format_size(size: float) -> str:
+    return f"{size / 2**20:.1f} MiB"
+
+
+@click.command("benchmark_suite")
+@click.option("--areas", type=int, default=10, show_default=True, help="Number of areas of the synthetic study")
+@click.option("--clusters", type=int, default=5, show_default=True, help="Number of thermal clusters per area")
+@click.option("--years", type=int, default=5, show_default=True, help="Number of Monte-Carlo years (and time series)")
+@click.option("--commands", type=int, default=50, show_default=True, help="Number of commands of the variant")
+@click.option("--studies", type=int, default=5000, show_default=True, help="Number of studies in the database")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Number of measured runs per benchmark")
+@click.option("--seed", type=int, default=42, show_default=True, help="Seed of the synthetic data")
+@click.option("--only", type=click.Choice(BENCHMARKS), multiple=True, help="Benchmarks to run (default: all)")
+@click.option("--json", "json_path", type=click.Path(path_type=Path), default=None, help="Save the results")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Results of a previous run, to detect regressions",
+)
+@click.option("--tolerance", type=float, default=0.2, show_default=True, help="Accepted slowdown from the baseline")
+def main(
+    areas: int,
+    clusters: int,
+    years: int,
+    commands: int,
+    studies: int,
+    repeat: int,
+    seed: int,
+    only: t.Tuple[str, ...],
+    json_path: t.Optional[Path],
+    baseline: t.Optional[Path],
+    tolerance: float,
+) -> None:
+    selected = only or BENCHMARKS
+    results: t.List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = create_context(Path(tmp), seed)
+        click.echo(f"Generating a study of {areas} areas x {clusters} clusters x {years} years...")
+        generate_study(ctx, areas, clusters, years)
+        if "aggregation" in selected:
+            generate_outputs(ctx, areas, years)
+        if "snapshot" in selected or "study_listing" in selected:
+            _setup_database(ctx)
+
+        factories: t.Dict[str, t.Callable[[], t.Callable[[], t.Any]]] = {
+            "matrix_parse": lambda: bench_matrix_parse(ctx),
+            "matrix_dump": lambda: bench_matrix_dump(ctx),
+            "config_build": lambda: bench_config_build(ctx),
+            "snapshot": lambda: bench_snapshot(ctx, commands),
+            "aggregation": lambda: bench_aggregation(ctx),
+            "study_listing": lambda: bench_study_listing(ctx, studies),
+        }
+        click.echo(f"{'benchmark':<16} {'min':>10} {'median':>10} {'memory peak':>14}")
+        for name in selected:
+            result = measure(name, factories[name](), repeat)
+            results.append(result)
+            click.echo(f"{name:<16} {result.min:>9.3f}s {result.median:>9.3f}s {_format_size(result.memory_peak):>14}")
+
+    if json_path is not None:
+        json_path.write_text(json.dumps({r.name: r.to_json() for r in results}, indent=2))
+
+    if baseline is not None:
+        reference = json.loads(baseline.read_text())
+        regressions = [
+            f"{r.name}: {r.median:.3f}s > {reference[r.name]['median']:.3f}s (+{tolerance:.0%})"
+            for r in results
+            if r.name in reference and r.median > reference[r.name]["median"] * (1 + tolerance)
+        ]
+        for regression in regressions:
+            click.echo(f"Regression: {regression}", err=True)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
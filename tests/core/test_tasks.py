@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import dataclasses
 import datetime
 import time
 import typing as t
@@ -24,7 +25,7 @@ from sqlalchemy import create_engine  # type: ignore
 from sqlalchemy.engine.base import Engine  # type: ignore
 from sqlalchemy.orm import Session, sessionmaker  # type: ignore
 
-from antarest.core.config import Config
+from antarest.core.config import Config, RemoteWorkerConfig, TaskConfig
 from antarest.core.interfaces.eventbus import DummyEventBusService, EventType, IEventBus
 from antarest.core.jwt import DEFAULT_ADMIN_USER, JWTUser
 from antarest.core.model import PermissionInfo, PublicMode
@@ -204,6 +205,38 @@ class DummyWorker(AbstractWorker):
         return TaskResult(success=True, message="")
 
 
+@with_db_context
+def test_worker_task(tmp_path: Path, core_config: Config, admin_user: JWTUser) -> None:
+    task_queue = "touch_stuff"
+    config = dataclasses.replace(
+        core_config,
+        tasks=TaskConfig(remote_workers=[RemoteWorkerConfig(name="test", queues=[task_queue])]),
+    )
+    event_bus = EventBusService(LocalEventBus())
+    service = TaskJobService(config=config, repository=TaskJobRepository(), event_bus=event_bus)
+    worker = DummyWorker(event_bus, [task_queue], tmp_path)
+    worker.start()
+
+    task_id = service.add_worker_task(
+        TaskType.UNARCHIVE,
+        task_queue,
+        {"file": "foo"},
+        "touch foo",
+        None,
+        RequestParameters(user=admin_user),
+    )
+    assert task_id is not None
+
+    # the task ends as soon as the worker has processed it
+    start = time.monotonic()
+    service.await_task(task_id, timeout_sec=10)
+    assert time.monotonic() - start < 5
+    assert (tmp_path / "foo").exists()
+    task = service.repo.get(task_id)
+    assert task is not None
+    assert task.status == TaskStatus.COMPLETED.value
+
+
 def test_repository(db_session: Session) -> None:
     # Prepare two users in the database
     user1_id = 9
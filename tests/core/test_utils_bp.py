@@ -53,3 +53,15 @@ def test_server_health() -> None:
     client = TestClient(app)
     result = client.get("/health")
     assert result.json() == {"status": "available"}
+
+
+@pytest.mark.unit_test
+def test_metrics() -> None:
+    app = FastAPI(title=__name__)
+    app.include_router(create_utils_routes(Config()))
+    client = TestClient(app)
+    result = client.get("/metrics")
+    assert result.status_code == HTTPStatus.OK.value
+    assert result.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE antarest_study_factory_create_from_fs_seconds histogram" in result.text
+    assert "# TYPE antarest_cache_requests_total counter" in result.text
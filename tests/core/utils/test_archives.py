@@ -0,0 +1,128 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from antarest.core.utils import archives
+from antarest.core.utils.archives import archive_dir, unzip
+
+
+def _create_tree(root: Path) -> dict:
+    files = {
+        "study.antares": b"[antares]\nversion = 880\n",
+        "input/empty.txt": b"",
+        "input/load/series/load_fr.txt": b"\n".join(str(i).encode() * 8 for i in range(5000)),
+        "input/load/series/load_de.txt": os.urandom(100_000),
+        "output/20240101-0000eco/annual.txt": b"annual\n" * 1000,
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return files
+
+
+@pytest.mark.parametrize("max_file_size", [archives._PARALLEL_MAX_FILE_SIZE, 50_000, 0])
+def test_archive_dir__zip_round_trip(tmp_path: Path, max_file_size: int) -> None:
+    src_dir = tmp_path / "src"
+    files = _create_tree(src_dir)
+
+    zip_path = tmp_path / "study.zip"
+    # Small sizes force the serial writing of some files and the flushing of the pending files
+    with patch.object(archives, "_PARALLEL_MAX_FILE_SIZE", max_file_size), patch.object(
+        archives, "_PARALLEL_MAX_PENDING_SIZE", max_file_size
+    ):
+        archive_dir(src_dir, zip_path)
+
+    # The archive must be readable by the standard ZIP reader
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == sorted(files)
+        for name, content in files.items():
+            assert zf.read(name) == content
+            assert zf.getinfo(name).compress_type == zipfile.ZIP_DEFLATED
+
+    target_dir = tmp_path / "target"
+    unzip(target_dir, zip_path, remove_source_zip=True)
+    assert not zip_path.exists()
+    for name, content in files.items():
+        assert (target_dir / name).read_bytes() == content
+
+
+def test_archive_dir__zip_parallel_integrity(tmp_path: Path) -> None:
+    src_dir = tmp_path / "src"
+    files = _create_tree(src_dir)
+
+    # All the files are compressed in parallel and written with `_write_deflated`
+    zip_path = tmp_path / "study.zip"
+    with patch.object(archives, "_write_deflated", wraps=archives._write_deflated) as write_deflated:
+        archive_dir(src_dir, zip_path)
+    assert write_deflated.call_count == len(files)
+
+    # The archive must pass the integrity check (CRC and headers) of the standard ZIP reader
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        for info in zf.infolist():
+            assert zf.read(info) == files[info.filename]
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_archive_dir__zip_fallback(tmp_path: Path) -> None:
+    src_dir = tmp_path / "src"
+    files = _create_tree(src_dir)
+
+    # If the `zipfile` internals are not available, the files are written with `ZipFile.write`
+    zip_path = tmp_path / "study.zip"
+    with patch.object(archives, "_ZIPFILE_WRITE_ATTRIBUTES", ("missing",)), patch.object(
+        archives, "_write_deflated"
+    ) as write_deflated:
+        archive_dir(src_dir, zip_path)
+    write_deflated.assert_not_called()
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == sorted(files)
+
+
+def test_write_deflated__open_writing_handle(tmp_path: Path) -> None:
+    deflated = archives._DeflatedFile(data=b"\x03\x00", crc=0, size=0)
+    with zipfile.ZipFile(tmp_path / "test.zip", mode="w") as zf:
+        assert archives._can_write_deflated(zf)
+        with zf.open("other.txt", mode="w") as f:
+            f.write(b"data")
+            with pytest.raises(ValueError, match="open writing handle"):
+                archives._write_deflated(zf, zipfile.ZipInfo("empty.txt"), deflated)
+        archives._write_deflated(zf, zipfile.ZipInfo("empty.txt"), deflated)
+
+    with zipfile.ZipFile(tmp_path / "test.zip") as zf:
+        assert zf.testzip() is None
+        assert zf.read("other.txt") == b"data"
+        assert zf.read("empty.txt") == b""
+
+
+def test_unzip__unsafe_member(tmp_path: Path) -> None:
+    zip_path = tmp_path / "evil.zip"
+    with zipfile.ZipFile(zip_path, mode="w") as zf:
+        zf.writestr("../evil.txt", "evil")
+        zf.writestr("dir/good.txt", "good")
+
+    target_dir = tmp_path / "target"
+    unzip(target_dir, zip_path)
+
+    assert not (tmp_path / "evil.txt").exists()
+    assert (target_dir / "evil.txt").read_text() == "evil"
+    assert (target_dir / "dir/good.txt").read_text() == "good"
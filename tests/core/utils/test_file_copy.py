@@ -0,0 +1,80 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import os
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from antarest.core.utils import file_copy
+from antarest.core.utils.file_copy import CopyMode, clone_file, copy_tree
+
+
+def _create_tree(root: Path) -> t.Dict[str, bytes]:
+    files = {
+        "study.antares": b"[antares]\nversion = 880\n",
+        "input/areas/list.txt": b"fr\nde\n",
+        "input/load/series/load_fr.txt": os.urandom(300_000),
+        "input/empty.txt": b"",
+        "output/20240101-0000eco/info.antares-output": b"[general]\n",
+    }
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return files
+
+
+def _read_tree(root: Path) -> t.Dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+@pytest.mark.parametrize("mode", list(CopyMode))
+def test_copy_tree(tmp_path: Path, mode: CopyMode) -> None:
+    src = tmp_path / "src"
+    files = _create_tree(src)
+    os.utime(src / "input/areas/list.txt", (1_000_000, 1_000_000))
+
+    def ignore_outputs(directory: str, _: t.Sequence[str]) -> t.Sequence[str]:
+        return ["output"] if Path(directory) == src else []
+
+    dst = tmp_path / "dst"
+    copy_tree(src, dst, mode, ignore=ignore_outputs)
+
+    assert _read_tree(dst) == {k: v for k, v in files.items() if not k.startswith("output/")}
+    assert (dst / "input/areas/list.txt").stat().st_mtime == 1_000_000
+
+    # the copy is independent of the source
+    (dst / "input/areas/list.txt").write_bytes(b"it\n")
+    assert (src / "input/areas/list.txt").read_bytes() == b"fr\nde\n"
+
+
+@pytest.mark.parametrize("available", [True, False], ids=["unsupported", "unavailable"])
+def test_clone_file__fallback(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, available: bool) -> None:
+    src = tmp_path / "src.txt"
+    src.write_bytes(os.urandom(100_000))
+
+    def unsupported(*args: t.Any) -> t.NoReturn:
+        raise OSError("not supported")
+
+    # neither reflinks nor `copy_file_range` are supported
+    # (`copy_file_range` is only available on Linux)
+    monkeypatch.setattr(file_copy, "_reflink", lambda *args: False)
+    if available:
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    else:
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+    dst = tmp_path / "dst.txt"
+    dst.write_bytes(b"previous content")
+    clone_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
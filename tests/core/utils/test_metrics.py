@@ -0,0 +1,75 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import pytest
+
+from antarest.core.utils.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_render() -> None:
+    registry = MetricsRegistry()
+    counter = Counter("cache_requests_total", "Cache requests", ["cache", "result"], registry=registry)
+    gauge = Gauge("queue_depth", "Queue depth", registry=registry)
+    histogram = Histogram("parse_seconds", "Parsing duration", registry=registry, buckets=[0.1, 1])
+
+    counter.labels("RAW_STUDY", "hit").inc()
+    counter.labels("RAW_STUDY", "hit").inc(2)
+    counter.labels("RAW_STUDY", 'mi"ss').inc()
+    gauge.set_function(lambda: 7)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.render() == (
+        "# HELP cache_requests_total Cache requests\n"
+        "# TYPE cache_requests_total counter\n"
+        'cache_requests_total{cache="RAW_STUDY",result="hit"} 3.0\n'
+        'cache_requests_total{cache="RAW_STUDY",result="mi\\"ss"} 1.0\n'
+        "# HELP queue_depth Queue depth\n"
+        "# TYPE queue_depth gauge\n"
+        "queue_depth 7.0\n"
+        "# HELP parse_seconds Parsing duration\n"
+        "# TYPE parse_seconds histogram\n"
+        'parse_seconds_bucket{le="0.1"} 1.0\n'
+        'parse_seconds_bucket{le="1.0"} 2.0\n'
+        'parse_seconds_bucket{le="+Inf"} 3.0\n'
+        "parse_seconds_sum 5.55\n"
+        "parse_seconds_count 3.0\n"
+    )
+
+
+def test_histogram_timer() -> None:
+    registry = MetricsRegistry()
+    histogram = Histogram("duration_seconds", "Duration", ["name"], registry=registry)
+
+    @histogram.labels("func").time()
+    def func(x: int) -> int:
+        return x * 2
+
+    assert func(2) == 4
+    assert func(3) == 6
+    with histogram.labels("block").time():
+        pass
+
+    assert 'duration_seconds_count{name="func"} 2.0' in registry.render()
+    assert 'duration_seconds_count{name="block"} 1.0' in registry.render()
+
+
+def test_errors() -> None:
+    registry = MetricsRegistry()
+    counter = Counter("requests_total", "Requests", ["result"], registry=registry)
+    with pytest.raises(ValueError, match="Duplicated"):
+        Counter("requests_total", "Requests", registry=registry)
+    with pytest.raises(ValueError, match="expects the labels"):
+        counter.labels()
+    with pytest.raises(ValueError, match="non-negative"):
+        counter.labels("hit").inc(-1)
@@ -10,6 +10,9 @@
 #
 # This file is part of the Antares project.
 
+import threading
+import time
+
 from antarest.core.interfaces.eventbus import Event, EventType
 from antarest.core.model import PermissionInfo, PublicMode
 from antarest.eventbus.business.local_eventbus import LocalEventBus
@@ -26,3 +29,20 @@ def test_lifecycle():
     assert eventbus.get_events() == [event]
     eventbus.clear_events()
     assert len(eventbus.get_events()) == 0
+
+
+def test_pull_queues():
+    eventbus = LocalEventBus()
+    event = Event(
+        type=EventType.WORKER_TASK,
+        payload="foo",
+        permissions=PermissionInfo(public_mode=PublicMode.NONE),
+    )
+    assert eventbus.pull_queues(["q1", "q2"], timeout=0.01) is None
+
+    # the event is received as soon as it is queued
+    threading.Timer(0.05, eventbus.queue_event, args=(event, "q2")).start()
+    start = time.monotonic()
+    assert eventbus.pull_queues(["q1", "q2"], timeout=10) == ("q2", event)
+    assert time.monotonic() - start < 5
+    assert eventbus.pull_queues(["q1", "q2"], timeout=0) is None
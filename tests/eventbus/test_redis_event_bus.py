@@ -34,3 +34,20 @@ def test_lifecycle():
     eventbus.push_event(event)
     redis_client.publish.assert_called_once_with("events", serialized)
     assert eventbus.get_events() == [event]
+
+
+def test_pull_queues():
+    redis_client = Mock()
+    eventbus = RedisEventBus(redis_client)
+    event = Event(
+        type=EventType.WORKER_TASK,
+        payload="foo",
+        permissions=PermissionInfo(public_mode=PublicMode.NONE),
+    )
+    redis_client.blpop.return_value = (b"q2", event.model_dump_json().encode())
+    assert eventbus.pull_queues(["q1", "q2"], timeout=2) == ("q2", event)
+    redis_client.blpop.assert_called_once_with(["q1", "q2"], timeout=2)
+
+    redis_client.blpop.return_value = None
+    assert eventbus.pull_queues(["q1"], timeout=0.5) is None
+    redis_client.blpop.assert_called_with(["q1"], timeout=1)
@@ -17,6 +17,7 @@ from antarest.core.config import Config, EventBusConfig, RedisConfig
 from antarest.core.interfaces.eventbus import Event, EventType
 from antarest.core.model import PermissionInfo, PublicMode
 from antarest.eventbus.main import build_eventbus
+from antarest.eventbus.service import EventBusService
 from tests.helpers import auto_retry_assert
 
 
@@ -85,3 +86,63 @@ def test_lifecycle():
         queue_name,
     )
     auto_retry_assert(lambda: len(test_bucket) == 1, timeout=2)
+
+
+def test_coalescing():
+    backend = Mock()
+    event_bus = EventBusService(
+        backend,
+        autostart=False,
+        coalescing_windows={EventType.TASK_PROGRESS: 60, EventType.STUDY_DATA_EDITED: 60},
+    )
+
+    def progress(task_id: str, value: int) -> Event:
+        return Event(
+            type=EventType.TASK_PROGRESS,
+            payload={"task_id": task_id, "progress": value},
+            permissions=PermissionInfo(public_mode=PublicMode.READ),
+            channel=f"TASK/{task_id}",
+        )
+
+    def study_edited(study_id: str) -> Event:
+        return Event(
+            type=EventType.STUDY_DATA_EDITED,
+            payload={"id": study_id, "name": "foo"},
+            permissions=PermissionInfo(public_mode=PublicMode.READ),
+        )
+
+    def pushed() -> List[Event]:
+        return [args[0] for args, _ in backend.push_event.call_args_list]
+
+    # the first event of a burst is pushed immediately, the next ones are retained
+    for value in range(1, 11):
+        event_bus.push(progress("t1", value))
+    event_bus.push(progress("t2", 1))
+    event_bus.push(study_edited("s1"))
+    event_bus.push(study_edited("s1"))
+    event_bus.push(study_edited("s2"))
+    assert pushed() == [progress("t1", 1), progress("t2", 1), study_edited("s1"), study_edited("s2")]
+
+    # events are pushed before a related event to preserve the ordering
+    backend.reset_mock()
+    completed = Event(
+        type=EventType.TASK_COMPLETED,
+        payload={"id": "t1"},
+        permissions=PermissionInfo(public_mode=PublicMode.READ),
+        channel="TASK/t1",
+    )
+    event_bus.push(completed)
+    assert pushed() == [progress("t1", 10), completed]
+
+    # only the latest retained event is pushed at the end of the window
+    backend.reset_mock()
+    event_bus.coalescer.flush(backend.push_event)
+    assert pushed() == []
+    event_bus.flush()
+    assert pushed() == [study_edited("s1")]
+
+    # events without coalescing window are always pushed
+    backend.reset_mock()
+    for _ in range(3):
+        event_bus.push(completed)
+    assert pushed() == [completed] * 3
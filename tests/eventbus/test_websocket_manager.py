@@ -10,6 +10,7 @@
 #
 # This file is part of the Antares project.
 
+import asyncio
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, call
 
@@ -17,7 +18,7 @@ from starlette.websockets import WebSocket
 
 from antarest.core.jwt import JWTUser
 from antarest.core.model import PermissionInfo
-from antarest.eventbus.web import ConnectionManager, WebsocketMessage, WebsocketMessageAction
+from antarest.eventbus.web import MAX_QUEUE_SIZE, ConnectionManager, WebsocketMessage, WebsocketMessageAction
 
 
 class AsyncMock(MagicMock):
@@ -43,16 +44,65 @@ class ConnectionManagerTest(IsolatedAsyncioTestCase):
         assert connections.channel_subscriptions[0] == "foo"
 
         # the event manager must send events if the channel is empty (i.e.: ""),
-        await ws_manager.broadcast("msg1", PermissionInfo(), channel="")
+        ws_manager.broadcast("msg1", PermissionInfo(), channel="")
         # the event manager must send events if the channel is a subscriber channel
-        await ws_manager.broadcast("msg2", PermissionInfo(), channel="foo")
+        ws_manager.broadcast("msg2", PermissionInfo(), channel="foo")
         # the event manager must not send events if the channel does not correspond to any subscriber channel
-        await ws_manager.broadcast("msg3", PermissionInfo(), channel="bar")
+        ws_manager.broadcast("msg3", PermissionInfo(), channel="bar")
+        await connections.queue.join()
 
         mock_connection.send_text.assert_has_calls([call("msg1"), call("msg2")])
+        assert mock_connection.send_text.call_count == 2
 
         ws_manager.process_message(unsubscribe_message.model_dump_json(), mock_connection)
         assert len(connections.channel_subscriptions) == 0
 
+        assert ws_manager.channels == {}
+
         ws_manager.disconnect(mock_connection)
         assert len(ws_manager.active_connections) == 0
+        assert connections.sender.cancelling()
+
+    async def test_slow_consumer(self):
+        ws_manager = ConnectionManager()
+        user = JWTUser(id=1, type="user", impersonator=1, groups=[])
+
+        slow_release = asyncio.Event()
+        slow_connection = AsyncMock(spec=WebSocket)
+
+        async def slow_send(message: str) -> None:
+            await slow_release.wait()
+
+        slow_connection.send_text.side_effect = slow_send
+        fast_connection = AsyncMock(spec=WebSocket)
+        await ws_manager.connect(slow_connection, user)
+        await ws_manager.connect(fast_connection, user)
+        slow, fast = ws_manager.active_connections
+
+        # a slow client does not prevent the others from receiving messages
+        ws_manager.broadcast("msg1", PermissionInfo(), channel="")
+        await fast.queue.join()
+        fast_connection.send_text.assert_called_once_with("msg1")
+
+        # progress events are coalesced while waiting in the queue
+        for progress in range(10):
+            ws_manager.broadcast(f"progress{progress}", PermissionInfo(), channel="", coalesce_key="task")
+        ws_manager.broadcast("msg2", PermissionInfo(), channel="")
+        stats = ws_manager.get_stats()
+        assert stats["connections"] == 2
+        assert stats["max_queue_depth"] == 2
+
+        slow_release.set()
+        await slow.queue.join()
+        await fast.queue.join()
+        assert slow_connection.send_text.call_args_list == [call("msg1"), call("progress9"), call("msg2")]
+        assert ws_manager.get_stats()["queued_messages"] == 0
+
+        # messages are dropped when the queue of a connection is full
+        slow_release.clear()
+        for index in range(MAX_QUEUE_SIZE + 5):
+            ws_manager.broadcast(f"msg{index}", PermissionInfo(), channel="")
+        assert ws_manager.get_stats()["dropped_messages"] >= 5
+
+        ws_manager.disconnect(slow_connection)
+        ws_manager.disconnect(fast_connection)
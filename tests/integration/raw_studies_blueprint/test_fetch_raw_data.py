@@ -452,6 +452,89 @@ def test_create_folder(client: TestClient, user_access_token: str, internal_stud
     _check_endpoint_response(study_type, res, client, internal_study_id, expected_msg, "FolderCreationNotAllowed")
 
 
+def test_get_study_etag(client: TestClient, user_access_token: str, internal_study_id: str) -> None:
+    client.headers = {"Authorization": f"Bearer {user_access_token}"}
+    raw_url = f"/v1/studies/{internal_study_id}/raw"
+
+    # The files of a study stored in an external workspace can be modified outside the application
+    res = client.get(raw_url, params={"path": "settings/generaldata", "depth": -1})
+    assert res.status_code == 200, res.json()
+    assert "ETag" not in res.headers
+
+    # Copies the study, to convert it into a managed one.
+    res = client.post(
+        f"/v1/studies/{internal_study_id}/copy",
+        params={"dest": "default", "with_outputs": False, "use_task": False},
+    )
+    assert res.status_code == 201
+    study_id = res.json()
+    raw_url = f"/v1/studies/{study_id}/raw"
+
+    params = {"path": "settings/generaldata", "depth": -1}
+    res = client.get(raw_url, params=params)
+    assert res.status_code == 200, res.json()
+    etag = res.headers["ETag"]
+    general_data = res.json()
+
+    # The data is not sent again if it is not modified
+    res = client.get(raw_url, params=params, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["ETag"] == etag
+    assert not res.content
+    res = client.get(raw_url, params=params, headers={"If-None-Match": f'"other", W/{etag}'})
+    assert res.status_code == 304
+
+    # The ETag depends on the request parameters
+    res = client.get(raw_url, params={**params, "depth": 1}, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+
+    # The ETag is renewed when the study is modified
+    res = client.post(raw_url, params={"path": "settings/generaldata/general/nbyears"}, json=42)
+    assert res.status_code == 204, res.json()
+    res = client.get(raw_url, params=params, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    assert res.json() != general_data
+    assert res.json()["general"]["nbyears"] == 42
+
+    # The ETag of a variant is renewed when its parent is modified
+    res = client.post(f"/v1/studies/{study_id}/variants", params={"name": "variant 1"})
+    variant_url = f"/v1/studies/{res.json()}/raw"
+    res = client.get(variant_url, params=params)
+    assert res.status_code == 200, res.json()
+    etag = res.headers["ETag"]
+    res = client.post(raw_url, params={"path": "settings/generaldata/general/nbyears"}, json=12)
+    assert res.status_code == 204, res.json()
+    res = client.get(variant_url, params=params, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()["general"]["nbyears"] == 12
+
+
+def test_get_study_etag_xpansion(client: TestClient, user_access_token: str) -> None:
+    client.headers = {"Authorization": f"Bearer {user_access_token}"}
+    res = client.post("/v1/studies", params={"name": "MyStudy", "version": "860"})
+    assert res.status_code == 201, res.json()
+    study_id = res.json()
+    raw_url = f"/v1/studies/{study_id}/raw"
+    xpansion_url = f"/v1/studies/{study_id}/extensions/xpansion"
+
+    # The xpansion configuration is written without variant commands
+    res = client.post(xpansion_url)
+    assert res.status_code in {200, 201}, res.json()
+    params = {"path": "user/expansion/settings", "depth": -1}
+    res = client.get(raw_url, params=params)
+    assert res.status_code == 200, res.json()
+    etag = res.headers["ETag"]
+
+    res = client.put(f"{xpansion_url}/settings", json={"optimality_gap": 42})
+    assert res.status_code == 200, res.json()
+    res = client.get(raw_url, params=params, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+    assert res.json()["optimality_gap"] == 42
+
+
 def test_retrieve_from_archive(client: TestClient, user_access_token: str) -> None:
     # client headers
     client.headers = {"Authorization": f"Bearer {user_access_token}"}
@@ -11,6 +11,7 @@
 # This file is part of the Antares project.
 
 import io
+import json
 import os
 from http import HTTPStatus
 from pathlib import Path
@@ -18,6 +19,7 @@ from unittest.mock import ANY
 
 from starlette.testclient import TestClient
 
+from antarest.core.tasks.model import TaskStatus, TaskType
 from antarest.launcher.model import LauncherLoadDTO
 from antarest.study.business.area_management import LayerInfoDTO
 from antarest.study.business.general_management import Mode
@@ -1755,6 +1757,27 @@ def test_import(client: TestClient, admin_access_token: str, internal_study_id:
         assert result[0]["name"] == "fr.txt"
         assert result[1]["name"] == "it.txt"
 
+    # test matrices import in a task
+    res = client.post(
+        "/v1/matrix/_import",
+        headers={"Authorization": f'Bearer {george_credentials["access_token"]}'},
+        params={"use_task": True},
+        files={
+            "file": (matrices_seven_zip_path.name, io.BytesIO(matrices_seven_zip_path.read_bytes()), "application/zip")
+        },
+    )
+    assert res.status_code == 200
+    task_id = res.json()
+    res = client.get(
+        f"/v1/tasks/{task_id}",
+        headers={"Authorization": f'Bearer {george_credentials["access_token"]}'},
+        params={"wait_for_completion": True},
+    )
+    task = res.json()
+    assert task["status"] == TaskStatus.COMPLETED.value, task
+    assert task["type"] == TaskType.MATRIX_IMPORT
+    assert json.loads(task["result"]["return_value"]) == res_seven_zip.json()
+
 
 def test_copy(client: TestClient, admin_access_token: str, internal_study_id: str) -> None:
     client.headers = {"Authorization": f"Bearer {admin_access_token}"}
@@ -321,6 +321,54 @@ def test_comments(client: TestClient, admin_access_token: str, variant_id: str)
     assert res.json() == comment
 
 
+def test_compact_commands(client: TestClient, admin_access_token: str, variant_id: str) -> None:
+    admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
+
+    nb_years = "settings/generaldata/general/nbyears"
+    commands = [
+        {"action": "update_config", "args": {"target": nb_years, "data": 2}},
+        {"action": "create_area", "args": {"area_name": "fr"}},
+        {"action": "replace_matrix", "args": {"target": "input/load/series/load_fr", "matrix": [[1], [2]]}},
+        {"action": "update_config", "args": {"target": nb_years, "data": 3}},
+        {"action": "update_comments", "args": {"comments": "first"}},
+        {"action": "replace_matrix", "args": {"target": "input/load/series/load_fr", "matrix": [[3], [4]]}},
+        {"action": "update_config", "args": {"target": nb_years, "data": 4}},
+        {"action": "update_comments", "args": {"comments": "last"}},
+    ]
+    res = client.post(f"/v1/studies/{variant_id}/commands", json=commands, headers=admin_headers)
+    assert res.status_code == 200, res.json()
+
+    res = client.post(f"/v1/studies/{variant_id}/commands/compact", headers=admin_headers)
+    assert res.status_code == 200, res.json()
+    assert res.json() == 3
+
+    res = client.get(f"/v1/studies/{variant_id}/commands", headers=admin_headers)
+    assert [(c["action"], c["args"][0].get("data")) for c in res.json()] == [
+        ("update_config", 2),
+        ("create_area", None),
+        ("replace_matrix", None),
+        ("update_config", 4),
+        ("update_comments", None),
+    ]
+
+    # Nothing left to compact
+    res = client.post(f"/v1/studies/{variant_id}/commands/compact", headers=admin_headers)
+    assert res.json() == 0
+
+    # The generated study has the last values
+    res = client.put(f"/v1/studies/{variant_id}/generate?from_scratch=true", headers=admin_headers)
+    task = wait_task_completion(client, admin_access_token, res.json())
+    assert task.status == TaskStatus.COMPLETED, task
+    res = client.get(f"/v1/studies/{variant_id}/raw", params={"path": nb_years}, headers=admin_headers)
+    assert res.json() == 4
+    res = client.get(
+        f"/v1/studies/{variant_id}/raw", params={"path": "input/load/series/load_fr"}, headers=admin_headers
+    )
+    assert res.json()["data"] == [[3.0], [4.0]]
+    res = client.get(f"/v1/studies/{variant_id}/comments", headers=admin_headers)
+    assert res.json() == "last"
+
+
 def test_recursive_variant_tree(client: TestClient, admin_access_token: str, base_study_id: str) -> None:
     admin_headers = {"Authorization": f"Bearer {admin_access_token}"}
     parent_id = base_study_id
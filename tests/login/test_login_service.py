@@ -11,10 +11,11 @@
 # This file is part of the Antares project.
 
 import typing as t
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
+from antarest.core.interfaces.eventbus import EventType
 from antarest.core.jwt import JWTGroup, JWTUser
 from antarest.core.requests import RequestParameters
 from antarest.core.roles import RoleType
@@ -31,7 +32,7 @@ from antarest.login.model import (
     UserCreateDTO,
     UserLdap,
 )
-from antarest.login.service import LoginService
+from antarest.login.service import LiveBotCache, LoginService
 from tests.helpers import with_db_context
 
 # For the unit tests, we will define several fictitious users, groups and roles.
@@ -644,6 +645,12 @@ class TestLoginService:
         assert login_service.exists_bot(joh_bot.id) is True
         assert login_service.exists_bot(999) is False
 
+        # The existing bots are cached
+        login_service.bots.delete(joh_bot.id)
+        assert login_service.exists_bot(joh_bot.id) is True
+        login_service.live_bots.discard(joh_bot.id)
+        assert login_service.exists_bot(joh_bot.id) is False
+
     @with_db_context
     def test_authenticate(self, login_service: LoginService) -> None:
         # Update the password of "Lois Lane"
@@ -915,10 +922,17 @@ class TestLoginService:
         _param = get_user_param(login_service, user_id=joh_id, group_id="metropolis")
         joh_bot = login_service.save_bot(BotCreateDTO(name="Maria", roles=[]), _param)
 
-        # The site admin can delete the bot
+        assert login_service.exists_bot(joh_bot.id) is True
+
+        # The site admin can delete the bot, and the deletion is notified
         _param = get_user_param(login_service, user_id=ADMIN_ID, group_id="admin")
-        login_service.delete_bot(joh_bot.id, _param)
+        with patch.object(login_service, "event_bus", Mock()) as event_bus:
+            login_service.delete_bot(joh_bot.id, _param)
         assert login_service.bots.get(joh_bot.id) is None
+        assert login_service.exists_bot(joh_bot.id) is False
+        event = event_bus.push.call_args[0][0]
+        assert event.type == EventType.BOT_DELETED
+        assert event.payload == joh_bot.id
 
         # Create Lois's bot
         lois_id = 3
@@ -1025,3 +1039,18 @@ class TestLoginService:
         with pytest.raises(Exception):
             login_service.delete_all_roles_from_user(user.id, _param)
         assert login_service.roles.get(role.identity.id, role.group.id) is not None
+
+
+def test_live_bot_cache() -> None:
+    cache = LiveBotCache(ttl=60)
+    assert not cache.contains(1)
+    cache.add(1)
+    assert cache.contains(1)
+    cache.discard(1)
+    assert not cache.contains(1)
+    cache.discard(1)
+
+    # The entries expire after the TTL
+    cache = LiveBotCache(ttl=0)
+    cache.add(1)
+    assert not cache.contains(1)
@@ -10,20 +10,24 @@
 #
 # This file is part of the Antares project.
 
+import asyncio
 import base64
 import json
 from datetime import timedelta
 from pathlib import Path
-from typing import Dict, Union
-from unittest.mock import Mock
+from typing import Dict, Optional, Union
+from unittest.mock import Mock, patch
 
+import jwt
 import pytest
 from fastapi import FastAPI
 from starlette.testclient import TestClient
 
 from antarest.core.application import AppBuildContext, create_app_ctxt
 from antarest.core.config import Config, SecurityConfig
+from antarest.core.interfaces.eventbus import Event, EventType
 from antarest.core.jwt import JWTGroup, JWTUser
+from antarest.core.model import PermissionInfo
 from antarest.core.requests import RequestParameters
 from antarest.fastapi_jwt_auth import AuthJWT
 from antarest.login.main import build_login
@@ -54,7 +58,7 @@ PARAMS = RequestParameters(
 )
 
 
-def create_app(service: Mock, auth_disabled=False) -> FastAPI:
+def create_app(service: Mock, auth_disabled=False, event_bus: Optional[Mock] = None) -> FastAPI:
     app = FastAPI(title=__name__)
 
     @AuthJWT.load_config
@@ -72,6 +76,7 @@ def create_app(service: Mock, auth_disabled=False) -> FastAPI:
             resources_path=Path(),
             security=SecurityConfig(disabled=auth_disabled),
         ),
+        **({"event_bus": event_bus} if event_bus else {}),
     )
     return app_ctxt.build()
 
@@ -458,3 +463,57 @@ def test_bot_delete() -> None:
 
     assert res.status_code == 200
     service.delete_bot.assert_called_once_with(0, PARAMS)
+
+
+@pytest.mark.unit_test
+def test_token_verified_once() -> None:
+    service = Mock()
+
+    app = create_app(service)
+    client = TestClient(app)
+    headers = create_auth_token(app)
+    with patch("antarest.fastapi_jwt_auth.auth_jwt.jwt.decode", wraps=jwt.decode) as decode:
+        for _ in range(3):
+            res = client.get("/v1/auth", headers=headers)
+            assert res.status_code == 200
+    decode.assert_called_once()
+
+    # An expired token is always rejected
+    res = client.get("/v1/auth", headers=create_auth_token(app, expires_delta=-1))
+    assert res.status_code == 401
+
+
+@pytest.mark.unit_test
+def test_bot_token_revocation() -> None:
+    service = Mock()
+    service.live_bots.contains.return_value = False
+    service.exists_bot.return_value = True
+    event_bus = Mock()
+
+    app = create_app(service, event_bus=event_bus)
+    client = TestClient(app)
+    bot = JWTUser(id=3, impersonator=0, type="bots", groups=[])
+    token = AuthJWT().create_access_token(subject=bot.model_dump_json())
+    headers = {"Authorization": f"Bearer {token}"}
+    res = client.get("/v1/auth", headers=headers)
+    assert res.status_code == 200
+    service.exists_bot.assert_called_once_with(3)
+
+    # Cached bots are not checked in database
+    service.live_bots.contains.return_value = True
+    res = client.get("/v1/auth", headers=headers)
+    assert res.status_code == 200
+    service.exists_bot.assert_called_once_with(3)
+
+    # Deleted bots are revoked
+    service.live_bots.contains.return_value = False
+    service.exists_bot.return_value = False
+    res = client.get("/v1/auth", headers=headers)
+    assert res.status_code == 401
+
+    # The cache is invalidated when a bot is deleted by another worker
+    listener, type_filter = event_bus.add_listener.call_args[0]
+    assert type_filter == [EventType.BOT_DELETED]
+    event = Event(type=EventType.BOT_DELETED, payload=3, permissions=PermissionInfo())
+    asyncio.run(listener(event))
+    service.live_bots.discard.assert_called_once_with(3)
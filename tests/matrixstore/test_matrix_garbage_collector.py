@@ -10,8 +10,10 @@
 #
 # This file is part of the Antares project.
 
+import os
+import time
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import numpy as np
 import pytest
@@ -27,7 +29,7 @@ from antarest.study.storage.patch_service import PatchService
 from antarest.study.storage.variantstudy.business.matrix_constants_generator import GeneratorMatrixConstants
 from antarest.study.storage.variantstudy.command_factory import CommandFactory
 from antarest.study.storage.variantstudy.model.command.common import CommandName
-from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, VariantStudy
+from antarest.study.storage.variantstudy.model.dbmodel import CommandBlock, CommandBlockMatrix, VariantStudy
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 
 
@@ -47,6 +49,7 @@ def matrix_garbage_collector(tmp_path: Path):
     mock_config.storage.matrixstore = matrix_store
     mock_config.storage.workspaces = {"default": mock_workspace_config}
     mock_config.storage.matrix_gc_dry_run = False
+    mock_config.storage.matrix_gc_grace_period = 0
 
     matrix_constant_generator = Mock(spec=GeneratorMatrixConstants)
     matrix_constant_generator.hashes = {"test": "constant_matrix"}
@@ -72,15 +75,25 @@ def test_get_saved_matrices(
 ):
     """
     Test that the get_all_saved_matrices function returns a list of all saved
-    matrices.
+    matrices older than the grace period.
     """
     matrix_name1 = "matrix_name1"
     matrix_name2 = "matrix_name2"
+    matrix_name3 = "matrix_name3"
     (matrix_garbage_collector.saved_matrices_path / f"{matrix_name1}.txt").touch()
     (matrix_garbage_collector.saved_matrices_path / f"{matrix_name2}.txt").touch()
+    (matrix_garbage_collector.saved_matrices_path / f"{matrix_name3}.txt").touch()
 
     # Get all saved matrices
     saved_matrices = matrix_garbage_collector._get_saved_matrices()
+    assert saved_matrices == {matrix_name1, matrix_name2, matrix_name3}
+
+    # Recent matrices are excluded
+    one_day_ago = time.time() - 86400
+    for matrix_name in [matrix_name1, matrix_name2]:
+        os.utime(matrix_garbage_collector.saved_matrices_path / f"{matrix_name}.txt", (one_day_ago, one_day_ago))
+    matrix_garbage_collector.grace_period = 3600
+    saved_matrices = matrix_garbage_collector._get_saved_matrices()
     assert saved_matrices == {matrix_name1, matrix_name2}
 
 
@@ -124,7 +137,12 @@ def test_get_matrices_used_in_variant_studies(
         study_version = "880"
         variant_study_repository.save(VariantStudy(id=study_id, version=study_version))
 
-        # TODO: add series to the command blocks
+        matrix1_id = "1" * 64
+        matrix2_id = "2" * 64
+        matrix3_id = "3" * 64
+        unused_matrix_id = "4" * 64
+        all_matrices = {matrix1_id, matrix2_id, matrix3_id, unused_matrix_id}
+
         command_block1 = CommandBlock(
             study_id=study_id,
             command=CommandName.CREATE_LINK.value,
@@ -137,38 +155,52 @@ def test_get_matrices_used_in_variant_studies(
             study_id=study_id,
             command=CommandName.CREATE_LINK.value,
             args='{"area1": "area2", "area2": "area3"}',
-            index=0,
+            index=1,
             version=7,
             study_version=study_version,
         )
         db.session.add(command_block1)
         db.session.add(command_block2)
         db.session.commit()
-        matrices = matrix_garbage_collector._get_variant_studies_matrices()
+        matrices = matrix_garbage_collector._get_variant_studies_matrices(all_matrices)
         assert not matrices
-        command_block1 = CommandBlock(
+
+        command_block3 = CommandBlock(
             study_id=study_id,
             command=CommandName.CREATE_LINK.value,
-            args='{"area1": "area1", "area2": "area2","series": "[[1,2,3]]"}',
-            index=0,
+            args=f'{{"area1": "area1", "area2": "area3", "series": "{matrix1_id}", "direct": "matrix://{matrix2_id}"}}',
+            index=2,
             version=7,
             study_version=study_version,
         )
-        command_block2 = CommandBlock(
+        command_block4 = CommandBlock(
             study_id=study_id,
-            command=CommandName.CREATE_LINK.value,
-            args='{"area1": "area2", "area2": "area3","series": "[[1,2,4]]"}',
-            index=0,
-            version=7,
+            command=CommandName.REPLACE_MATRIX.value,
+            args=f'[{{"target": "a/b", "matrix": "{matrix1_id}"}}, {{"target": "c/d", "matrix": "{matrix3_id}"}}]',
+            index=3,
+            version=1,
             study_version=study_version,
         )
-        db.session.add(command_block1)
-        db.session.add(command_block2)
+        db.session.add(command_block3)
+        db.session.add(command_block4)
+        db.session.commit()
+        matrices = matrix_garbage_collector._get_variant_studies_matrices(all_matrices)
+        assert matrices == {matrix1_id, matrix2_id, matrix3_id}
+
+        # The references are updated with the command arguments
+        command_block4.args = f'[{{"target": "a/b", "matrix": "{matrix1_id}"}}]'
         db.session.commit()
-        matrices = matrix_garbage_collector._get_variant_studies_matrices()
-        assert len(matrices) == 2
-        assert "[[1,2,3]]" in matrices
-        assert "[[1,2,4]]" in matrices
+        matrices = matrix_garbage_collector._get_variant_studies_matrices(all_matrices)
+        assert matrices == {matrix1_id, matrix2_id}
+
+        # The references are deleted with the commands
+        db.session.delete(command_block3)
+        db.session.commit()
+        matrices = matrix_garbage_collector._get_variant_studies_matrices(all_matrices)
+        assert matrices == {matrix1_id}
+        variant_study_repository.delete(study_id)
+        assert not matrix_garbage_collector._get_variant_studies_matrices(all_matrices)
+        assert not db.session.query(CommandBlockMatrix).count()
 
 
 @pytest.mark.unit_test
@@ -188,50 +220,59 @@ def test_get_matrices_used_in_dataset(
             params=RequestParameters(admin_user),
         )
 
-        matrices = matrix_garbage_collector._get_datasets_matrices()
-        assert len(matrices) == 2
-        assert matrix1_id in matrices
-        assert matrix2_id in matrices
+        matrix3_id = matrix_service.create(np.ones((3, 1)))
+
+        matrices = matrix_garbage_collector._get_datasets_matrices({matrix1_id, matrix2_id, matrix3_id})
+        assert matrices == {matrix1_id, matrix2_id}
+        # Only the given matrices are checked
+        assert matrix_garbage_collector._get_datasets_matrices({matrix2_id, matrix3_id}) == {matrix2_id}
 
 
 @pytest.mark.unit_test
-def test_get_used_matrices(matrix_garbage_collector: MatrixGarbageCollector):
+def test_get_unused_matrices(matrix_garbage_collector: MatrixGarbageCollector):
     matrix_garbage_collector._get_raw_studies_matrices = Mock(return_value={"matrix1", "matrix2"})
     matrix_garbage_collector._get_variant_studies_matrices = Mock(return_value={"matrix3", "matrix4"})
     matrix_garbage_collector._get_datasets_matrices = Mock(return_value={"matrix4", "matrix6"})
-    assert matrix_garbage_collector._get_used_matrices() == {
-        "matrix1",
-        "matrix2",
-        "matrix3",
-        "matrix4",
-        "matrix6",
-        "constant_matrix",
-    }
+    saved_matrices = {f"matrix{i}" for i in range(1, 8)} | {"constant_matrix"}
+    assert matrix_garbage_collector._get_unused_matrices(saved_matrices) == {"matrix5", "matrix7"}
+    matrix_garbage_collector._get_variant_studies_matrices.assert_called_once_with({f"matrix{i}" for i in range(1, 8)})
+    matrix_garbage_collector._get_datasets_matrices.assert_called_once_with(
+        {"matrix1", "matrix2", "matrix5", "matrix6", "matrix7"}
+    )
+
+    # The workspace is not scanned if all the matrices are referenced in the database
+    matrix_garbage_collector._get_raw_studies_matrices.reset_mock()
+    assert matrix_garbage_collector._get_unused_matrices({"matrix3", "matrix6", "constant_matrix"}) == set()
+    matrix_garbage_collector._get_raw_studies_matrices.assert_not_called()
 
 
 @pytest.mark.unit_test
 def test_delete_unused_saved_matrices(
     matrix_garbage_collector: MatrixGarbageCollector,
 ):
-    unused_matrices = {"matrix1", "matrix2"}
-    matrix_garbage_collector.matrix_service.delete = Mock()
+    unused_matrices = {f"matrix{i:04d}" for i in range(1500)}
+    matrix_garbage_collector.matrix_service.delete_many = Mock()
     matrix_garbage_collector._delete_unused_saved_matrices(unused_matrices)
 
-    matrix_garbage_collector.matrix_service.delete.assert_any_call("matrix1")
-    matrix_garbage_collector.matrix_service.delete.assert_any_call("matrix2")
+    # The matrices are deleted by batches
+    assert matrix_garbage_collector.matrix_service.delete_many.call_args_list == [
+        call(sorted(unused_matrices)[:1000]),
+        call(sorted(unused_matrices)[1000:]),
+    ]
 
     matrix_garbage_collector.dry_run = True
-    matrix_garbage_collector.matrix_service.delete.reset_mock()
+    matrix_garbage_collector.matrix_service.delete_many.reset_mock()
     matrix_garbage_collector._delete_unused_saved_matrices(unused_matrices)
-    matrix_garbage_collector.matrix_service.delete.assert_not_called()
+    matrix_garbage_collector.matrix_service.delete_many.assert_not_called()
 
 
 @pytest.mark.unit_test
 def test_clean_matrices(matrix_garbage_collector: MatrixGarbageCollector):
     matrix_garbage_collector._get_saved_matrices = Mock(return_value={"matrix1", "matrix2"})
-    matrix_garbage_collector._get_used_matrices = Mock(return_value={"matrix1"})
+    matrix_garbage_collector._get_unused_matrices = Mock(return_value={"matrix2"})
     matrix_garbage_collector._delete_unused_saved_matrices = Mock()
 
     matrix_garbage_collector._clean_matrices()
 
+    matrix_garbage_collector._get_unused_matrices.assert_called_once_with({"matrix1", "matrix2"})
     matrix_garbage_collector._delete_unused_saved_matrices.assert_called_once_with(unused_matrices={"matrix2"})
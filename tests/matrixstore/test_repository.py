@@ -39,6 +39,17 @@ class TestMatrixRepository:
             repo.delete(m.id)
             assert repo.get(m.id) is None
 
+    def test_exists_many(self, db_session: Session) -> None:
+        with db_session:
+            repo = MatrixRepository(db_session)
+            matrix_ids = [f"matrix-{i}" for i in range(1200)]
+            for matrix_id in matrix_ids[::2]:
+                db_session.add(Matrix(id=matrix_id, created_at=datetime.datetime.now()))
+            db_session.commit()
+            # More IDs than the chunk size of the `IN (...)` queries
+            assert repo.exists_many(matrix_ids) == set(matrix_ids[::2])
+            assert repo.exists_many([]) == set()
+
     def test_bucket_lifecycle(self, tmp_path: Path) -> None:
         repo = MatrixContentRepository(tmp_path)
 
@@ -265,6 +276,18 @@ class TestMatrixContentRepository:
             missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
             matrix_content_repo.get(missing_hash)
 
+    def test_get_shape(self, matrix_content_repo: MatrixContentRepository) -> None:
+        """
+        Retrieves the shape of a matrix with a given SHA256 hash, without parsing its values.
+        """
+        data: ArrayData = [[1, 2, 3], [4, 5, 6]]
+        matrix_hash = matrix_content_repo.save(data)
+        assert matrix_content_repo.get_shape(matrix_hash) == (2, 3)
+
+        # an empty matrix has the same shape as the retrieved array
+        matrix_hash = matrix_content_repo.save([[]])
+        assert matrix_content_repo.get_shape(matrix_hash) == matrix_content_repo.get_array(matrix_hash).shape
+
     def test_exists(self, matrix_content_repo: MatrixContentRepository) -> None:
         """
         Checks if a matrix with a given SHA256 hash exists in the directory.
@@ -280,6 +303,16 @@ class TestMatrixContentRepository:
         missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
         assert not matrix_content_repo.exists(missing_hash)
 
+    @pytest.mark.parametrize("nb_missing", [2, 100])
+    def test_exists_many(self, matrix_content_repo: MatrixContentRepository, nb_missing: int) -> None:
+        """
+        Checks the existence of several matrices at once, by checking each file or by listing the directory.
+        """
+        saved_hashes = {matrix_content_repo.save([[float(i)]]) for i in range(3)}
+        missing_hashes = {f"{i:064x}" for i in range(nb_missing)}
+        assert matrix_content_repo.exists_many(saved_hashes | missing_hashes) == saved_hashes
+        assert matrix_content_repo.exists_many(missing_hashes) == set()
+
     def test_delete(self, matrix_content_repo: MatrixContentRepository) -> None:
         """
         Deletes the tsv file containing the content of a matrix with a given SHA256 hash.
@@ -11,14 +11,16 @@
 # This file is part of the Antares project.
 
 import datetime
+import hashlib
 import io
 import json
 import time
 import typing as t
 import zipfile
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, call
 
 import numpy as np
+import py7zr
 import pytest
 from fastapi import UploadFile
 from starlette.datastructures import Headers
@@ -135,6 +137,17 @@ class TestMatrixService:
             obj = matrix_service.get(missing_hash)
         assert obj is None
 
+    def test_get_shape(self, matrix_service: MatrixService) -> None:
+        """Get the shape of a matrix from the database, without reading its content."""
+        data: MatrixType = [[1, 2, 3], [4, 5, 6]]
+        matrix_id = matrix_service.create(data)
+        matrix_service.matrix_content_repository.get_path(matrix_id).unlink()
+
+        with db():
+            assert matrix_service.get_shape(matrix_id) == (2, 3)
+            missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
+            assert matrix_service.get_shape(missing_hash) is None
+
     def test_exists(self, matrix_service: MatrixService) -> None:
         """Test the exists method."""
         # when a matrix is created (inserted) in the service
@@ -182,6 +195,19 @@ class TestMatrixService:
         with db():
             assert not db.session.query(Matrix).count()
 
+    def test_delete_many(self, matrix_service: MatrixService) -> None:
+        """Delete several matrix objects, missing matrices are ignored."""
+        matrix_ids = [matrix_service.create([[float(i)]]) for i in range(3)]
+        missing_hash = "8b1a9953c4611296a827abf8c47804d7e6c49c6b"
+
+        with db():
+            matrix_service.delete_many([matrix_ids[0], matrix_ids[1], missing_hash])
+
+        bucket_dir = matrix_service.matrix_content_repository.bucket_dir
+        assert [f.stem for f in bucket_dir.glob("*.tsv")] == [matrix_ids[2]]
+        with db():
+            assert [m.id for m in db.session.query(Matrix)] == [matrix_ids[2]]
+
     @pytest.mark.parametrize(
         "data",
         [
@@ -313,6 +339,102 @@ class TestMatrixService:
             now = datetime.datetime.utcnow()
             assert now - datetime.timedelta(seconds=1) <= obj.created_at <= now
 
+    @pytest.mark.parametrize("archive_format", ["zip", "7z"])
+    def test_create_by_importation__archive_pipeline(
+        self, tmp_path, matrix_service: MatrixService, archive_format: str
+    ) -> None:
+        """
+        Import an archive with many matrices in a task and check that the hashes are the same
+        as the ones of the matrices parsed with `np.loadtxt`.
+        """
+        rng = np.random.default_rng(1234)
+        contents = {}
+        for i in range(150):
+            buffer = io.BytesIO()
+            np.savetxt(buffer, rng.random((8, 3)) * 1000, delimiter="\t", fmt="%.18f")
+            contents[f"matrix-{i:03d}.txt"] = buffer.getvalue()
+        contents["duplicate.txt"] = contents["matrix-000.txt"]
+        # Comment lines are skipped and explicit NaN values are accepted, like `np.loadtxt`
+        contents["comment.txt"] = b"# comment\n1\t2\n3\t4\n"
+        contents["nan.txt"] = b"1\tnan\n3\t4\n"
+        upload_file = _create_archive_upload_file(contents, archive_format)
+
+        tmp_dir = tmp_path.joinpath("tmp")
+        tmp_dir.mkdir()
+        matrix_service.config.storage.tmp_dir = tmp_dir
+        params = RequestParameters(user=JWTUser(id=1, type="users", impersonator=1))
+        task_id = matrix_service.create_by_importation_task(upload_file, is_json=False, params=params)
+        assert task_id == matrix_service.task_service.add_task.return_value
+
+        # Run the task
+        import_task = matrix_service.task_service.add_task.call_args[0][0]
+        notifier = Mock()
+        result = import_task(notifier)
+        assert result.success
+        info_list = [MatrixInfoDTO.model_validate(obj) for obj in json.loads(result.return_value)]
+
+        expected_ids = [
+            hashlib.sha256(np.loadtxt(io.BytesIO(content), delimiter="\t", ndmin=2).data).hexdigest()
+            for content in contents.values()
+        ]
+        assert [info.name for info in info_list] == list(contents)
+        assert [info.id for info in info_list] == expected_ids
+        assert notifier.notify_progress.call_args_list[-1] == call(100)
+        with db():
+            assert matrix_service.exists_many(expected_ids) == set(expected_ids)
+        # The uploaded file and the extracted members are removed
+        assert not list(tmp_dir.iterdir())
+
+        # Malformed files are rejected, like `np.loadtxt` does
+        malformed_contents = {"trailing_tab.txt": b"1\t2\t\n3\t4\t\n", "short_row.txt": b"1\t2\n3\n"}
+        for name, content in malformed_contents.items():
+            upload_file = _create_archive_upload_file({**contents, name: content}, archive_format)
+            matrix_service.create_by_importation_task(upload_file, is_json=False, params=params)
+            import_task = matrix_service.task_service.add_task.call_args[0][0]
+            with pytest.raises(ValueError):
+                import_task(Mock())
+            assert not list(tmp_dir.iterdir())
+
+    def test_create_by_importation_task__registration_error(self, tmp_path, matrix_service: MatrixService) -> None:
+        tmp_dir = tmp_path.joinpath("tmp")
+        tmp_dir.mkdir()
+        matrix_service.config.storage.tmp_dir = tmp_dir
+        matrix_service.task_service.add_task.side_effect = RuntimeError("task service failure")
+        upload_file = _create_archive_upload_file({"matrix.txt": b"1\t2\n"}, "zip")
+        params = RequestParameters(user=JWTUser(id=1, type="users", impersonator=1))
+        with pytest.raises(RuntimeError, match="task service failure"):
+            matrix_service.create_by_importation_task(upload_file, is_json=False, params=params)
+        # The uploaded file is removed if the task can't be registered
+        assert not list(tmp_dir.iterdir())
+
+    @pytest.mark.parametrize("precision", [None, 2])
+    def test_create_matrix_files(self, tmp_path, matrix_service: MatrixService, precision: t.Optional[int]) -> None:
+        matrices = [
+            np.array([[1.5, 2.25], [3.125, 4.0]], dtype=np.float64),
+            np.array([[]], dtype=np.float64),
+            np.arange(300, dtype=np.float64).reshape((100, 3)) / 7,
+        ]
+        matrix_ids = [matrix_service.create(matrix) for matrix in matrices]
+
+        # unknown and duplicate matrices are ignored
+        export_path = tmp_path / "export.zip"
+        with db():
+            result = matrix_service.create_matrix_files([*matrix_ids, "unknown", matrix_ids[0]], export_path, precision)
+        assert result == str(export_path)
+
+        with zipfile.ZipFile(export_path) as zf:
+            assert zf.namelist() == [f"matrix-{matrix_id}.txt" for matrix_id in matrix_ids]
+            for matrix_id, matrix in zip(matrix_ids, matrices):
+                content = zf.read(f"matrix-{matrix_id}.txt")
+                if matrix.size == 0:
+                    assert content == b""
+                    continue
+                actual = np.loadtxt(io.BytesIO(content), delimiter="\t", ndmin=2)
+                expected = matrix if precision is None else matrix.round(precision)
+                np.testing.assert_allclose(actual, expected, atol=1e-12)
+                if precision is not None:
+                    assert content.splitlines()[0] == b"\t".join(f"{v:.2f}".encode() for v in matrix[0])
+
 
 def test_dataset_lifecycle() -> None:
     content = Mock()
@@ -502,3 +624,17 @@ def _create_upload_file(filename: str, file: t.IO = None, content_type: str = ""
     headers = Headers(headers={"content-type": content_type})
     # noinspection PyTypeChecker,PyArgumentList
     return UploadFile(filename=filename, file=file, headers=headers)
+
+
+def _create_archive_upload_file(contents: t.Mapping[str, bytes], archive_format: str) -> UploadFile:
+    buffer = io.BytesIO()
+    if archive_format == "zip":
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, content in contents.items():
+                zf.writestr(name, content)
+    else:
+        with py7zr.SevenZipFile(buffer, mode="w") as szf:
+            for name, content in contents.items():
+                szf.writestr(content, name)
+    buffer.seek(0)
+    return _create_upload_file(filename=f"matrices.{archive_format}", file=buffer, content_type="application/zip")
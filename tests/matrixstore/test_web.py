@@ -128,3 +128,21 @@ def test_import() -> None:
     )
     assert res.status_code == 200
     assert [MatrixInfoDTO.model_validate(res.json()[0])] == matrix_info
+
+
+@pytest.mark.unit_test
+def test_import_with_task() -> None:
+    service = Mock()
+    service.create_by_importation_task.return_value = "my-task-id"
+
+    app = create_app(service)
+    client = TestClient(app)
+    res = client.post(
+        "/v1/matrix/_import",
+        headers=create_auth_token(app),
+        params={"use_task": True},
+        files={"file": ("Matrix.zip", bytes(5), "application/zip")},
+    )
+    assert res.status_code == 200
+    assert res.json() == "my-task-id"
+    service.create_by_importation.assert_not_called()
@@ -17,7 +17,7 @@ from sqlalchemy.orm import Session  # type: ignore
 
 from antarest.core.interfaces.cache import ICache
 from antarest.study.model import RawStudy
-from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy
+from antarest.study.storage.variantstudy.model.dbmodel import VariantStudy, VariantStudySnapshot
 from antarest.study.storage.variantstudy.repository import VariantStudyRepository
 
 
@@ -80,3 +80,41 @@ class TestVariantStudyRepository:
         # Ensure the root study has the 3 same children
         children = repository.get_children(parent_id=raw_study.id)
         assert children == [variant2, variant3, variant1]
+
+    def test_invalidate_descendants(self, db_session: Session) -> None:
+        """
+        Given a root study with a tree of variants
+        When getting the descendants of a study and invalidating their snapshots
+        Then all the descendants (and only them) are returned and invalidated
+        """
+        repository = VariantStudyRepository(cache_service=Mock(spec=ICache), session=db_session)
+
+        day1 = datetime.datetime(2023, 1, 1)
+        raw_study = RawStudy(id="root", name="My Root", updated_at=day1)
+        db_session.add(raw_study)
+        db_session.commit()
+
+        def _variant(variant_id: str, parent_id: str) -> VariantStudy:
+            snapshot = VariantStudySnapshot(id=variant_id, created_at=day1, last_executed_command="cmd")
+            return VariantStudy(id=variant_id, parent_id=parent_id, updated_at=day1, snapshot=snapshot)
+
+        variants = [_variant("v1", "root"), _variant("v2", "root"), _variant("v1a", "v1"), _variant("v1a1", "v1a")]
+        db_session.add_all(variants)
+        db_session.commit()
+
+        assert sorted(repository.get_descendant_ids("root")) == ["v1", "v1a", "v1a1", "v2"]
+        assert sorted(repository.get_descendant_ids("v1")) == ["v1a", "v1a1"]
+        assert repository.get_descendant_ids("v1a1") == []
+
+        repository.invalidate_snapshots(["v1a", "v1a1"])
+
+        # The objects of the session are synchronized with the database
+        v1, v2, v1a, v1a1 = variants
+        assert v1.snapshot.last_executed_command == "cmd"
+        assert v1.updated_at == day1
+        for variant in [v1a, v1a1]:
+            assert variant.snapshot.last_executed_command is None
+            assert variant.updated_at > day1
+        db_session.expire_all()
+        assert repository.one("v1a1").snapshot.last_executed_command is None
+        assert repository.one("v2").snapshot.last_executed_command == "cmd"
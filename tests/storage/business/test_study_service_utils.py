@@ -10,7 +10,9 @@
 #
 # This file is part of the Antares project.
 
+import csv
 import datetime
+import io
 import tarfile
 from hashlib import md5
 from pathlib import Path
@@ -18,6 +20,7 @@ from typing import Any, Dict
 from unittest.mock import Mock
 from zipfile import ZipFile
 
+import numpy as np
 import pytest
 
 from antarest.study.model import (
@@ -390,3 +393,51 @@ def test_create_matrix_index_input(config: Dict[str, Any], level: StudyDownloadL
     next_year = str(actual_datetime.year + (actual_datetime.month != 1))
     first_january = datetime.datetime.strptime(next_year, "%Y").weekday()
     assert first_january == DAY_NAMES.index(config["january.1st"])
+
+
+def _create_csv_file_reference(ts_data: TimeSeriesData, index: MatrixIndex) -> bytes:
+    """Row by row implementation of `StudyDownloader.create_csv_file`, using `csv.writer`."""
+    output = io.StringIO()
+    writer = csv.writer(output, quoting=csv.QUOTE_NONE)
+    nb_rows, csv_titles = StudyDownloader.export_infos(ts_data.data)
+    writer.writerow(csv_titles)
+    row_date = datetime.datetime.strptime(index.start_date, "%Y-%m-%d %H:%M:%S")
+    for year in ts_data.data:
+        for i in range(0, nb_rows):
+            columns = ts_data.data[year]
+            writer.writerow([str(row_date), int(year)] + [column_data.data[i] for column_data in columns])
+            if index.level == StudyDownloadLevelDTO.WEEKLY and i == 0:
+                row_date = row_date + datetime.timedelta(days=index.first_week_size)
+            else:
+                row_date = index.level.inc_date(row_date)
+    return output.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "level",
+    [StudyDownloadLevelDTO.HOURLY, StudyDownloadLevelDTO.WEEKLY, StudyDownloadLevelDTO.MONTHLY],
+)
+def test_create_csv_file__same_as_csv_writer(level: StudyDownloadLevelDTO) -> None:
+    rng = np.random.default_rng(seed=0)
+    values = rng.normal(scale=1e6, size=(3, 5, 100))
+    values[0] = values[0].round(2)
+    values[1, 2, :10] = np.nan
+    values[2, 0, :] = [0.0, -0.0, 1e16, 1e-5, 123.0] * 20
+    ts_data = TimeSeriesData(
+        name="fr",
+        type=StudyDownloadType.AREA,
+        data={
+            str(year + 1): [
+                TimeSerie(
+                    name=f"COL{col}",
+                    unit="MWh",
+                    data=[None if np.isnan(v) else float(v) for v in values[year, col]],
+                )
+                for col in range(5)
+            ]
+            for year in range(3)
+        },
+    )
+    index = MatrixIndex(start_date="2018-01-01 00:00:00", steps=100, first_week_size=3, level=level)
+
+    assert StudyDownloader.create_csv_file(ts_data, index) == _create_csv_file_reference(ts_data, index)
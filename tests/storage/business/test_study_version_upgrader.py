@@ -117,6 +117,21 @@ def test_end_to_end_upgrades(tmp_path: Path):
     assert not are_same_dir(study_dir, before_upgrade_dir)
 
 
+def test_get_paths_to_denormalize(tmp_path: Path):
+    path_study = ASSETS_DIR / "little_study_720.zip"
+    study_dir = tmp_path / "little_study_720"
+    with zipfile.ZipFile(path_study) as zip_output:
+        zip_output.extractall(path=study_dir)
+    # No upgrade step reads or rewrites matrices from v7.2 to v8.1
+    assert StudyUpgrader(study_dir, "810").get_paths_to_denormalize() == []
+    # The links are upgraded in v8.2, the binding constraints and thermal clusters in v8.7
+    assert StudyUpgrader(study_dir, "870").get_paths_to_denormalize() == [
+        "input/bindingconstraints",
+        "input/links",
+        "input/thermal",
+    ]
+
+
 def test_fails_because_of_versions_asked(tmp_path: Path):
     # Prepare a study to upgrade
     path_study = ASSETS_DIR / "little_study_720.zip"
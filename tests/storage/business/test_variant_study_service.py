@@ -297,6 +297,7 @@ def test_delete_study(tmp_path: Path) -> None:
         [
             f"{CacheConstants.RAW_STUDY}/{name}",
             f"{CacheConstants.STUDY_FACTORY}/{name}",
+            f"{CacheConstants.STUDY_REVISION}/{name}",
         ]
     )
     assert not study_path.exists()
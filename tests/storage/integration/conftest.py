@@ -106,6 +106,7 @@ def storage_service(tmp_path: Path, project_path: Path, sta_mini_zip_path: Path)
 
     variant_repo = Mock()
     variant_repo.get_children.return_value = []
+    variant_repo.get_descendant_ids.return_value = []
 
     config = Config(
         resources_path=path_resources,
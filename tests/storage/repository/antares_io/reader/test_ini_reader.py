@@ -11,10 +11,13 @@
 # This file is part of the Antares project.
 
 import io
+import os
 import textwrap
+import time
 from pathlib import Path
 
-from antarest.study.storage.rawstudy.ini_reader import IniReader, SimpleKeyValueReader
+from antarest.study.storage.rawstudy.ini_reader import IniReader, SimpleKeyValueReader, ini_parse_cache
+from antarest.study.storage.rawstudy.ini_writer import IniWriter
 
 
 class TestIniReader:
@@ -324,6 +327,45 @@ class TestIniReader:
         expected = {"part1": {"bar": "hello"}, "part2": {"bar": "salut"}}
         assert actual == expected
 
+    def test_read__cached(self, tmp_path: Path) -> None:
+        path = Path(tmp_path) / "test.ini"
+        path.write_text("[part1]\nfoo = 5\n+ = east\n+ = west\n")
+        # the file must be old enough to be cached
+        an_hour_ago = time.time() - 3600
+        os.utime(path, (an_hour_ago, an_hour_ago))
+
+        reader = IniReader(["+"])
+        expected = {"part1": {"foo": 5, "+": ["east", "west"]}}
+        actual = reader.read(path)
+        assert actual == expected
+
+        # the returned data can be modified without altering the cache
+        actual["part1"]["+"].append("north")
+        actual["part1"]["bar"] = "hello"
+        assert reader.read(path) == expected
+        assert IniReader(["+"]).read(path, option="foo") == {"part1": {"foo": 5}}
+
+        # the cache is not used if the file is modified (the size changes)
+        path.write_text("[part1]\nfoo = 6\n")
+        os.utime(path, (an_hour_ago, an_hour_ago))
+        assert reader.read(path) == {"part1": {"foo": 6}}
+
+        # the cache is invalidated when the file is written, even if its stamp is unchanged
+        IniWriter().write({"part1": {"foo": 7}}, path)
+        os.utime(path, (an_hour_ago, an_hour_ago))
+        assert reader.read(path) == {"part1": {"foo": 7}}
+
+        # the cache depends on the reader configuration
+        assert IniReader().read(path) == {"part1": {"foo": 7}}
+
+        # recently modified files are not cached, because their stamp is not reliable
+        path.write_text("[part1]\nfoo = 8\n")
+        stat = path.stat()
+        assert reader.read(path) == {"part1": {"foo": 8}}
+        path.write_text("[part1]\nfoo = 9\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert reader.read(path) == {"part1": {"foo": 9}}
+
 
 class TestSimpleKeyValueReader:
     def test_read(self) -> None:
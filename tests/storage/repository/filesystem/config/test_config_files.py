@@ -245,6 +245,32 @@ def test_parse_outputs__nominal(tmp_path: Path, assets_name: str, expected: t.Di
     assert actual == expected
 
 
+@pytest.mark.parametrize("assets_name", ["little_study_700.zip", "little_study_720.zip"])
+def test_build__archived_and_parallel(tmp_path: Path, assets_name: str) -> None:
+    """
+    The configuration of an archived study, or built with a thread pool,
+    must be the same as the configuration of the extracted study built sequentially.
+    """
+    archive_path = ASSETS_DIR.joinpath(assets_name)
+    study_dir = tmp_path / "my-study"
+    with ZipFile(archive_path) as zf:
+        zf.extractall(study_dir)
+
+    expected = build(study_dir, "id", max_workers=1)
+    assert expected.areas, "the study should contain some areas"
+
+    actual = build(study_dir, "id", max_workers=4)
+    assert actual == expected
+    assert list(actual.areas) == list(expected.areas)
+
+    actual = build(archive_path, "id", output_path=study_dir / "output")
+    assert actual.areas == expected.areas
+    assert actual.sets == expected.sets
+    assert actual.bindings == expected.bindings
+    assert actual.version == expected.version
+    assert actual.archive_path == archive_path
+
+
 def test_parse_sets(study_path: Path) -> None:
     content = """\
     [hello]
@@ -340,6 +340,45 @@ class TestRulesetMatrices:
             ruleset.update_rules(rules)
         assert ruleset.get_rules() == {}
 
+    def test_update_rules__unknown_year(self, ruleset: RulesetMatrices) -> None:
+        # Rules for years beyond the number of MC years are kept in an additional column
+        rules = {
+            "l,france,0": 1,
+            "l,france,5": 2,
+            "t,italy,3,fuel": 3,
+        }
+        ruleset.update_rules(rules)
+        assert ruleset.scenarios["load"].columns.tolist() == ["0", "1", "2", "3", "5"]
+        assert ruleset.scenarios["thermal"]["Italy"].at["fuel", "3"] == 3
+        assert ruleset.get_rules() == rules
+
+    def test_update_rules__large_ruleset(self) -> None:
+        nb_years = 1000
+        areas = [f"Area{i}" for i in range(50)]
+        thermals = {area: [f"Cluster{i}" for i in range(20)] for area in areas}
+        ruleset = RulesetMatrices(
+            nb_years=nb_years,
+            areas=areas,
+            links=[],
+            thermals=thermals,
+            renewables={},
+            groups=[],
+            scenario_types=SCENARIO_TYPES,
+        )
+        rules = {
+            f"t,{area.lower()},{year},{cluster.lower()}": year % 7 + 1
+            for area in areas
+            for cluster in thermals[area]
+            for year in range(0, nb_years, 3)
+        }
+        rules.update({f"hl,{area.lower()},{year}": 0.5 for area in areas for year in range(nb_years)})
+        ruleset.update_rules(rules)
+        assert ruleset.scenarios["thermal"]["Area3"].at["Cluster7", "999"] == 999 % 7 + 1
+        assert ruleset.scenarios["hydroInitialLevels"].at["Area3", "999"] == 50
+        actual_rules = ruleset.get_rules()
+        assert actual_rules == rules
+        assert list(actual_rules)[:2] == ["t,area0,0,cluster0", "t,area0,3,cluster0"]
+
     def test_set_table_form(self, ruleset: RulesetMatrices) -> None:
         table_form = {
             "load": {
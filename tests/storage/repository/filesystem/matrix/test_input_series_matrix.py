@@ -17,6 +17,7 @@ import typing as t
 from pathlib import Path
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from antarest.core.exceptions import ChildNotFoundError
@@ -95,6 +96,39 @@ class TestInputSeriesMatrix:
         actual = node.load()
         assert actual == matrix_obj
 
+    def test_get_shape(self, my_study_config: FileStudyTreeConfig) -> None:
+        file = my_study_config.path
+        # trailing tabulations and blank lines are ignored, like when the matrix is parsed
+        file.write_text("1\t2\t3\t\n4\t5\t6\t\n\n")
+        node = InputSeriesMatrix(context=Mock(), config=my_study_config, default_empty=np.zeros((8760, 1)))
+        assert node.get_shape() == (2, 3)
+        assert node.get_shape() == node.parse(return_dataframe=True).shape
+
+        # An empty matrix has the shape of the default matrix
+        file.write_text("")
+        assert node.get_shape() == (8760, 1)
+        assert InputSeriesMatrix(context=Mock(), config=my_study_config).get_shape() == (0, 0)
+
+        file.unlink()
+        with pytest.raises(ChildNotFoundError):
+            node.get_shape()
+
+    def test_get_shape__link_to_matrix(self, my_study_config: FileStudyTreeConfig) -> None:
+        link = my_study_config.path.with_suffix(".txt.link")
+        matrix_id = "54e252eb14c0440055c82520c338376ff436e1d7ed6cb7283084c89e2e472c42"
+        link.write_text(f"matrix://{matrix_id}")
+
+        # The shape is read from the matrix store, the matrix is not resolved
+        matrix_service = Mock(spec=ISimpleMatrixService)
+        matrix_service.get_shape.return_value = (8760, 3)
+        resolver = Mock(spec=UriResolverService)
+        context = ContextServer(matrix=matrix_service, resolver=resolver)
+
+        node = InputSeriesMatrix(context=context, config=my_study_config)
+        assert node.get_shape() == (8760, 3)
+        matrix_service.get_shape.assert_called_once_with(matrix_id)
+        resolver.resolve.assert_not_called()
+
     def test_save(self, my_study_config: FileStudyTreeConfig) -> None:
         node = InputSeriesMatrix(context=Mock(), config=my_study_config)
         node.dump({"columns": [0, 1], "data": [[1, 2], [3, 4]], "index": [0, 1]})
@@ -19,7 +19,7 @@ from unittest.mock import Mock
 import pytest
 
 from antarest.core.exceptions import ChildNotFoundError
-from antarest.study.storage.rawstudy.model.filesystem.config.model import FileStudyTreeConfig
+from antarest.study.storage.rawstudy.model.filesystem.config.model import Area, FileStudyTreeConfig
 from antarest.study.storage.rawstudy.model.filesystem.factory import StudyFactory
 from antarest.study.storage.rawstudy.model.filesystem.ini_file_node import IniFileNode
 from antarest.study.storage.rawstudy.model.filesystem.inode import INode
@@ -277,3 +277,47 @@ def test_delete(tmp_path: Path) -> None:
     assert not data_link_node.exists()
     tree_node.delete()
     assert not folder_node.exists()
+
+
+def test_build_children__memoised(tmp_path: Path) -> None:
+    """
+    The children of a folder node are built once, and rebuilt only when the configuration is modified.
+    """
+    study_factory = StudyFactory(Mock(), Mock(), Mock())
+    file_study = study_factory.create_from_fs(tmp_path, "my-study", use_cache=False)
+    url = ["input", "thermal", "prepro"]
+
+    prepro_node = file_study.tree.get_node(url)
+    assert file_study.tree.get_node(url) is prepro_node
+    assert file_study.tree.get_node(["input", "links"]) is file_study.tree.get_node(["input", "links"])
+
+    # A new area is added to the configuration, so the tree must be rebuilt
+    with file_study.config.modifying():
+        file_study.config.areas["fr"] = Area(
+            name="FR",
+            links={},
+            thermals=[],
+            renewables=[],
+            filters_synthesis=[],
+            filters_year=[],
+        )
+        # Nodes are not reused while the configuration is being modified
+        assert file_study.tree.get_node(url) is not file_study.tree.get_node(url)
+
+    new_prepro_node = file_study.tree.get_node(url)
+    assert new_prepro_node is not prepro_node
+    assert file_study.tree.get_node(url) is new_prepro_node
+    assert file_study.tree.get_node([*url, "fr"]) is file_study.tree.get_node([*url, "fr"])
+
+
+def test_build_children__not_memoised(tmp_path: Path) -> None:
+    """
+    The children of a folder node depending on the filesystem are never memoised.
+    """
+    study_factory = StudyFactory(Mock(), Mock(), Mock())
+    file_study = study_factory.create_from_fs(tmp_path, "my-study", use_cache=False)
+    tmp_path.joinpath("user").mkdir()
+
+    assert file_study.tree.get(["user"]) == {}
+    tmp_path.joinpath("user/readme.txt").write_text("Hello")
+    assert file_study.tree.get(["user"], depth=1) == {"readme.txt": {}}
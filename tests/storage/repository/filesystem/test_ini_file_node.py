@@ -290,6 +290,36 @@ def test_save(tmp_path: Path) -> None:
     )
     assert ini_path.read_text().strip() == expected.strip()
 
+    # The example below allows for updating several sections and parameters at once,
+    # the file is written only once and the last update wins.
+    node.batch_save(
+        [
+            ({"key_int": 7}, ["part3"]),
+            (False, ["part1", "key_bool"]),
+            ("value20", ["part2", "key_str"]),
+            ("value30", ["part2", "key_str"]),
+        ]
+    )
+    expected = textwrap.dedent(
+        """\
+        [part1]
+        key_str = value10
+        key_float = 3.14
+        key_bool = False
+
+        [part2]
+        key_float = 18
+        key_int = 5
+        key_str = value30
+
+        [part3]
+        key_int = 7
+        """
+    )
+    assert ini_path.read_text().strip() == expected.strip()
+    # no temporary file is left behind
+    assert [p.name for p in tmp_path.iterdir()] == ["test.ini"]
+
 
 @pytest.mark.parametrize(
     ("ini_section", "url"),
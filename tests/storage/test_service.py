@@ -2019,6 +2019,50 @@ def test_upgrade_study__raw_study__failed(tmp_path: Path) -> None:
     event_bus.push.assert_not_called()
 
 
+@with_db_context
+@patch("antarest.study.storage.study_upgrader.StudyUpgrader.upgrade")
+def test_upgrade_study__raw_study__selective_denormalization(upgrade_study_mock: Mock, tmp_path: Path) -> None:
+    study_id = str(uuid.uuid4())
+    (tmp_path / "study.antares").write_text(
+        "[antares]\nversion = 800\ncaption = my_study\ncreated = 1682506382\nlastsave = 1682506382\nauthor = Unknown\n"
+    )
+
+    # noinspection PyArgumentList
+    raw_study = RawStudy(
+        id=study_id,
+        name="my_study",
+        workspace=DEFAULT_WORKSPACE_NAME,
+        path=str(tmp_path),
+        version="800",
+        additional_data=StudyAdditionalData(),
+        public_mode=PublicMode.NONE,
+    )
+    with contextlib.closing(db.session):
+        db.session.add(raw_study)
+        db.session.commit()
+
+    # The upgrade from v8.0 to v8.2 only rewrites the matrices of the links (v8.1 to v8.2).
+    storage_service = Mock()
+    tree = storage_service.get_storage.return_value.get_raw.return_value.tree
+    task = StudyUpgraderTask(
+        study_id,
+        "820",
+        repository=StudyMetadataRepository(Mock()),
+        storage_service=storage_service,
+        cache_service=Mock(),
+        event_bus=Mock(),
+    )
+    task(Mock())
+
+    upgrade_study_mock.assert_called_once_with()
+    # Only the links are denormalized before the upgrade, and normalized after it.
+    tree.denormalize.assert_not_called()
+    tree.normalize.assert_not_called()
+    assert tree.get_node.call_args_list == [call(["input", "links"]), call(["input", "links"])]
+    tree.get_node.return_value.denormalize.assert_called_once_with()
+    tree.get_node.return_value.normalize.assert_called_once_with()
+
+
 @pytest.mark.unit_test
 def test_is_output_archived(tmp_path) -> None:
     assert not is_output_archived(path_output=Path("fake_path"))
@@ -15,7 +15,7 @@ import io
 import re
 import typing as t
 import uuid
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import numpy as np
 import pytest
@@ -408,13 +408,14 @@ class TestSTStorageManager:
         storage = study_storage_service.get_storage(study)
         file_study = storage.get_raw(study)
         ini_file_node = IniFileNode(context=Mock(), config=Mock())
+        ini_file_node.batch_save = Mock()  # type: ignore
         file_study.tree = Mock(
             spec=FileStudyTree,
             get=Mock(return_value=LIST_CFG),
             get_node=Mock(return_value=ini_file_node),
         )
 
-        mock_config = Mock(spec=FileStudyTreeConfig, study_id=study.id)
+        mock_config = MagicMock(spec=FileStudyTreeConfig, study_id=study.id)
         file_study.config = mock_config
 
         # Given the following arguments
@@ -446,24 +447,17 @@ class TestSTStorageManager:
         # which only does a partial update of the configuration file: only the fields
         # that are explicitly mentioned in the form are updated. The other fields are left unchanged.
         #
-        # The effective update of the fields is done by the `save` method of the `IniFileNode` class.
-        # The signature of the `save` method is: `save(self, value: Any, path: Sequence[str]) -> None`
+        # The effective update of the fields is done at once by the `batch_save` method of the `IniFileNode` class.
+        # The signature of the `batch_save` method is: `batch_save(self, updates: Sequence[Tuple[Any, List[str]]])`
 
-        assert file_study.tree.save.call_count == 2
+        ini_file_node.batch_save.assert_called_once()
 
         # Fields "initiallevel" and "initialleveloptim" could be updated in any order.
-        # We construct a *set* of the actual calls to the `save` method and compare it
-        # to the expected set of calls.
-        actual = {(call_args[0][0], tuple(call_args[0][1])) for call_args in file_study.tree.save.call_args_list}
+        # We construct a *set* of the actual updates and compare it to the expected set of updates.
+        actual = {(value, tuple(url)) for value, url in ini_file_node.batch_save.call_args[0][0]}
         expected = {
-            (
-                0.0,
-                ("input", "st-storage", "clusters", "West", "list", "storage1", "initiallevel"),
-            ),
-            (
-                False,
-                ("input", "st-storage", "clusters", "West", "list", "storage1", "initialleveloptim"),
-            ),
+            (0.0, ("storage1", "initiallevel")),
+            (False, ("storage1", "initialleveloptim")),
         }
         assert actual == expected
 
@@ -24,8 +24,21 @@ from antarest.core.exceptions import CommandApplicationError
 from antarest.core.model import PublicMode
 from antarest.core.utils.fastapi_sqlalchemy import db
 from antarest.login.model import Group, User
-from antarest.study.business.areas.thermal_management import ThermalClusterCreation, ThermalClusterInput, ThermalManager
-from antarest.study.model import RawStudy, Study, StudyAdditionalData, StudyContentStatus
+from antarest.study.business.areas.thermal_management import (
+    ThermalClusterCreation,
+    ThermalClusterInput,
+    ThermalManager,
+    create_thermal_output,
+    create_thermal_outputs,
+)
+from antarest.study.model import (
+    STUDY_VERSION_8_6,
+    STUDY_VERSION_8_7,
+    RawStudy,
+    Study,
+    StudyAdditionalData,
+    StudyContentStatus,
+)
 from antarest.study.storage.rawstudy.model.filesystem.config.thermal import (
     LawOption,
     LocalTSGenerationBehavior,
@@ -63,6 +76,23 @@ class TestThermalClusterGroup:
             ThermalClusterGroup(123)
 
 
+@pytest.mark.parametrize("study_version", [STUDY_VERSION_8_6, STUDY_VERSION_8_7])
+def test_create_thermal_outputs(study_version) -> None:
+    """
+    The bulk creation of the outputs gives the same result as the creation one by one.
+    """
+    configs = {
+        "gas cluster": {"name": "Gas Cluster", "group": "gas", "unitcount": 3, "nominalcapacity": 150.5},
+        "coal": {"name": "Coal", "enabled": False, "marginal-cost": 12.5, "co2": 0.7},
+    }
+    actual = create_thermal_outputs(study_version, configs)
+    expected = {
+        cluster_id: create_thermal_output(study_version, cluster_id, config) for cluster_id, config in configs.items()
+    }
+    assert actual == expected
+    assert list(actual) == ["gas cluster", "coal"]
+
+
 @pytest.fixture(name="zip_legacy_path")
 def zip_legacy_path_fixture(tmp_path: Path) -> Path:
     target_dir = tmp_path.joinpath("resources")
@@ -13,8 +13,9 @@ from pathlib import Path
 
 import pytest
 
-from antarest.core.config import WorkspaceConfig
-from antarest.study.storage.utils import is_folder_safe
+from antarest.core.cache.business.local_chache import LocalCache
+from antarest.core.config import CacheConfig, WorkspaceConfig
+from antarest.study.storage.utils import get_study_revision, is_folder_safe, remove_from_cache
 
 
 @pytest.fixture
@@ -50,3 +51,14 @@ def test_is_folder_safe_nested_folder(workspace_config: WorkspaceConfig):
     # Test case: nested folder within the workspace
     folder = "project/subfolder"
     assert is_folder_safe(workspace_config, folder) is True
+
+
+def test_get_study_revision() -> None:
+    cache = LocalCache(config=CacheConfig())
+    revision = get_study_revision(cache, "study1")
+    # The revision is stable until the study is modified
+    assert get_study_revision(cache, "study1") == revision
+    assert get_study_revision(cache, "study2") != revision
+    # The revision is renewed when the cache of the study is invalidated
+    remove_from_cache(cache, "study1")
+    assert get_study_revision(cache, "study1") != revision
@@ -50,6 +50,7 @@ class TestStudy:
             "ix_study_archived",
             "ix_study_created_at",
             "ix_study_folder",
+            "ix_study_last_access",
             "ix_study_name",
             "ix_study_owner_id",
             "ix_study_parent_id",
@@ -1251,3 +1251,32 @@ def test_count_studies__general_case(
     # test that the expected studies are returned
     if expected_ids is not None:
         assert count == len(expected_ids)
+
+
+def test_get_archiving_candidates(db_session: Session) -> None:
+    repository = StudyMetadataRepository(cache_service=Mock(spec=ICache), session=db_session)
+    now = datetime.datetime.utcnow()
+    old = now - datetime.timedelta(days=61)
+    recent = now - datetime.timedelta(days=1)
+
+    db_session.add_all(
+        [
+            RawStudy(id="1", workspace=DEFAULT_WORKSPACE_NAME, updated_at=old, last_access=None),
+            RawStudy(id="2", workspace=DEFAULT_WORKSPACE_NAME, updated_at=old, last_access=recent),
+            RawStudy(id="3", workspace=DEFAULT_WORKSPACE_NAME, updated_at=recent, last_access=old),
+            RawStudy(id="4", workspace=DEFAULT_WORKSPACE_NAME, updated_at=old, archived=True),
+            RawStudy(id="5", workspace="other-workspace", updated_at=old),
+            VariantStudy(id="6", updated_at=old, archived=True),
+            VariantStudy(id="7", updated_at=recent),
+        ]
+    )
+    db_session.commit()
+
+    old_date = now - datetime.timedelta(days=60)
+    # the candidates are selected with a single query, without loading the studies
+    with DBStatementRecorder(db_session.bind) as db_recorder:
+        candidates = repository.get_archiving_candidates(old_date)
+    assert len(db_recorder.sql_statements) == 1, str(db_recorder)
+    assert sorted(candidates) == [("1", True), ("3", True), ("6", False)]
+
+    assert len(repository.get_archiving_candidates(old_date, limit=2)) == 2
@@ -83,6 +83,12 @@ def matrix_service_fixture() -> MatrixService:
         """
         return matrix_id in matrix_map
 
+    def exists_many(matrix_ids: t.Collection[str]) -> t.Set[str]:
+        """
+        This function returns the IDs of the matrices which exist in the map.
+        """
+        return {matrix_id for matrix_id in matrix_ids if matrix_id in matrix_map}
+
     def delete(matrix_id: str) -> None:
         """
         This function deletes the matrix from the map.
@@ -104,6 +110,7 @@ def matrix_service_fixture() -> MatrixService:
     matrix_service.create.side_effect = create
     matrix_service.get.side_effect = get
     matrix_service.exists.side_effect = exists
+    matrix_service.exists_many.side_effect = exists_many
     matrix_service.delete.side_effect = delete
     matrix_service.get_matrix_id.side_effect = get_matrix_id
 
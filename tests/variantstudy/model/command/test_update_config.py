@@ -78,6 +78,50 @@ def test_update_config(empty_study: FileStudy, command_context: CommandContext):
     assert layers == {"first_layer": {"1": False}}
 
 
+@pytest.mark.unit_test
+def test_update_config__batch(empty_study: FileStudy, command_context: CommandContext):
+    study_path = empty_study.config.study_path
+    study_version = empty_study.config.version
+
+    commands = [
+        UpdateConfig(
+            target=target,
+            data=data,
+            command_context=command_context,
+            study_version=study_version,
+        )
+        for target, data in [
+            ("settings/generaldata/optimization/simplex-range", "day"),
+            ("settings/generaldata/general/nbyears", 5),
+            ("layers/layers", {"first_layer": {"0": "Nothing"}}),
+            ("settings/generaldata/general/nbyears", 10),
+        ]
+    ]
+    with patch("antarest.study.storage.rawstudy.ini_writer.IniWriter.write", autospec=True) as write:
+        output = UpdateConfig.apply_batch(commands, empty_study)
+    assert output.status
+    # Each INI file is written only once
+    assert sorted(call.args[2].name for call in write.call_args_list) == ["generaldata.ini", "layers.ini"]
+
+    output = UpdateConfig.apply_batch(commands, empty_study)
+    assert output.status
+    generaldata = IniReader().read(study_path / "settings/generaldata.ini")
+    assert generaldata["optimization"]["simplex-range"] == "day"
+    assert generaldata["general"]["nbyears"] == 10
+    layers = IniReader().read(study_path / "layers/layers.ini")
+    assert layers == {"first_layer": {"0": "Nothing"}}
+
+    # An invalid target makes the whole batch fail
+    invalid_command = UpdateConfig(
+        target="input/areas/list",
+        data="foo",
+        command_context=command_context,
+        study_version=study_version,
+    )
+    output = UpdateConfig.apply_batch([*commands, invalid_command], empty_study)
+    assert not output.status
+
+
 def test_match(command_context: CommandContext):
     base = UpdateConfig(target="foo", data="bar", command_context=command_context, study_version=STUDY_VERSION_8_8)
     other_match = UpdateConfig(
@@ -0,0 +1,49 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+from antarest.study.model import STUDY_VERSION_8_8
+from antarest.study.storage.variantstudy.business.command_compactor import compact_commands
+from antarest.study.storage.variantstudy.model.command.create_area import CreateArea
+from antarest.study.storage.variantstudy.model.command.replace_matrix import ReplaceMatrix
+from antarest.study.storage.variantstudy.model.command.update_comments import UpdateComments
+from antarest.study.storage.variantstudy.model.command.update_config import UpdateConfig
+from antarest.study.storage.variantstudy.model.command_context import CommandContext
+
+
+def test_compact_commands(command_context: CommandContext) -> None:
+    version = STUDY_VERSION_8_8
+
+    def _update_config(target: str, data: int) -> UpdateConfig:
+        return UpdateConfig(target=target, data=data, command_context=command_context, study_version=version)
+
+    def _replace_matrix(target: str, value: float) -> ReplaceMatrix:
+        return ReplaceMatrix(target=target, matrix=[[value]], command_context=command_context, study_version=version)
+
+    nb_years = "settings/generaldata/general/nbyears"
+    load_fr = "input/load/series/load_fr"
+    commands = [
+        [_update_config(nb_years, 1)],  # 0: overwritten by 2
+        [_replace_matrix(load_fr, 1)],  # 1: kept, the area creation may read the study data
+        [_update_config(nb_years, 2)],  # 2: used to create the area
+        [CreateArea(area_name="de", command_context=command_context, study_version=version)],
+        [_replace_matrix(load_fr, 2)],  # 4: overwritten by 7
+        [_update_config(nb_years, 3), _update_config("settings/generaldata/general/mode", 0)],
+        [UpdateComments(comments="first", command_context=command_context, study_version=version)],
+        [_replace_matrix(load_fr, 3), _update_config(nb_years, 4)],
+        [UpdateComments(comments="last", command_context=command_context, study_version=version)],
+        [_update_config("settings/generaldata/other preferences/renewable-generation-modelling", 0)],
+        [_update_config("settings/generaldata/other preferences/renewable-generation-modelling", 1)],
+    ]
+    # the update of the renewable generation modelling also changes the study configuration
+    assert compact_commands(commands) == [1, 2, 3, 5, 7, 8, 9, 10]
+
+    assert compact_commands([]) == []
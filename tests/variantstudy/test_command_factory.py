@@ -487,3 +487,33 @@ def test_unknown_command():
         command_factory.to_command(
             command_dto=CommandDTO(action="unknown_command", args={}, study_version=STUDY_VERSION_8_8)
         )
+
+
+@pytest.mark.unit_test
+def test_to_commands__matrices_checked_at_once(command_factory: CommandFactory):
+    matrix_service = command_factory.command_context.matrix_service
+    matrix_ids = [f"{i:064x}" for i in range(3)]
+    matrix_service.exists_many.return_value = set(matrix_ids)
+    command_dtos = [
+        CommandDTO(
+            action=CommandName.REPLACE_MATRIX.value,
+            args=[{"target": f"some/matrix/path{i}", "matrix": matrix_id} for i, matrix_id in enumerate(matrix_ids)],
+            study_version=STUDY_VERSION_8_8,
+        ),
+        CommandDTO(
+            action=CommandName.CREATE_AREA.value,
+            args={"area_name": "area_name"},
+            study_version=STUDY_VERSION_8_8,
+        ),
+    ]
+
+    commands = command_factory.to_commands(command_dtos)
+
+    assert len(commands) == 4
+    matrix_service.exists_many.assert_called_once_with(set(matrix_ids))
+    matrix_service.exists.assert_not_called()
+
+    # Outside the context, the existence of each matrix is checked again
+    matrix_service.exists.return_value = True
+    command_factory.to_command(command_dtos[0])
+    assert matrix_service.exists.call_count == 3
@@ -31,4 +31,5 @@ export const TaskType = {
   UpgradeStudy: "UPGRADE_STUDY",
   ThermalClusterSeriesGeneration: "THERMAL_CLUSTER_SERIES_GENERATION",
   SnapshotClearing: "SNAPSHOT_CLEARING",
+  MatrixImport: "MATRIX_IMPORT",
 } as const;